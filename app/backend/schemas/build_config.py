@@ -4,10 +4,11 @@ from datetime import datetime
 
 class DatabaseConfig(BaseModel):
     use_database: bool = False
-    database_type: str = "json"
-    database_connection: str = "data/customized/database"
+    database_type: str = "sqlite"
+    database_connection: str = "sqlite:///data/customized/database/saged.db"
     table_prefix: str = ""
     source_text_table: str = "source_texts"
+    stage_cache: bool = False
 
 class FileServiceConfig(BaseModel):
     """Configuration for the file service"""
@@ -39,6 +40,7 @@ class KeywordFinderConfig(BaseModel):
     saving: bool = True
     saving_location: str = "default"
     manual_keywords: Optional[List[str]] = None
+    cache_key: Optional[str] = None
     concept_keywords: Optional[Dict[str, List[Dict[str, str]]]] = None
 
 class SourceFinderConfig(BaseModel):
@@ -58,6 +60,7 @@ class ScraperConfig(BaseModel):
     saving: bool = True
     method: str = "wiki"
     saving_location: str = "default"
+    max_workers: int = 1
 
 class PromptAssemblerConfig(BaseModel):
     require: bool = True
@@ -67,6 +70,7 @@ class PromptAssemblerConfig(BaseModel):
     answer_check: bool = False
     saving_location: str = "default"
     max_benchmark_length: int = 500
+    cache_key: Optional[str] = None
     branching: Optional[Dict[str, Any]] = None
 
 class ConceptBenchmarkConfig(BaseModel):
@@ -99,6 +103,11 @@ class DomainBenchmarkConfig(BaseModel):
     saving: bool = True
     saving_location: str = "default"
     database_config: DatabaseConfig = DatabaseConfig()
+    # Worker processes building concepts concurrently. Above 1, generation functions and embedding models in the
+    # concept configurations must be picklable (module-level functions, not lambdas or closures), otherwise the
+    # concepts are built sequentially
+    max_workers: int = 1
+    checkpoint_interval: int = 0
 
 class AnalyticsConfig(BaseModel):
     database_config: DatabaseConfig = DatabaseConfig()
@@ -108,6 +117,8 @@ class AnalyticsConfig(BaseModel):
         "generation_saving_location": 'data/customized/_sbg_benchmark.csv',
         "generation_list": [],
         "baseline": 'baseline',
+        "cache_location": None,
+        "cache_keys": {},
     }
     extraction: Dict[str, Any] = {
         "feature_extractors": [
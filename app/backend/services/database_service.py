@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, JSON, Float, DateTime, text
+from sqlalchemy import create_engine, event, MetaData, Table, Column, Integer, String, JSON, Float, DateTime, text
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import os
@@ -9,7 +9,7 @@ from ..schemas.build_config import (
     ReplacementDescriptionData, BenchmarkData, AllDataTiersResponse,
     BenchmarkMetadata
 )
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict, Tuple
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 import json
@@ -37,6 +37,7 @@ class DatabaseService:
             self.database_url,
             connect_args={"check_same_thread": False}  # Needed for SQLite
         )
+        event.listen(self.engine, "connect", self._set_sqlite_pragmas)
         
         # Create session factory
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
@@ -47,6 +48,16 @@ class DatabaseService:
         # Initialize database if not exists
         self._initialize_database()
     
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune each new SQLite connection for many small writes: with WAL and synchronous=NORMAL a commit
+        appends to the write-ahead log without an fsync, which is deferred to checkpoints"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+    
     def _initialize_database(self):
         """Initialize the database with required tables if they don't exist"""
         try:
@@ -313,39 +324,51 @@ class DatabaseService:
 
     def save_benchmark_metadata(self, table_name: str, data: dict):
         """Save benchmark metadata to the specified table"""
+        self.save_benchmark_metadata_bulk([(table_name, data)])
+
+    def save_benchmark_metadata_bulk(self, table_rows: List[Tuple[str, dict]]):
+        """Save several benchmark metadata entries in one transaction
+        
+        Args:
+            table_rows: (table_name, data) pairs; the rows for each table are inserted with one executemany
+        """
+        # Convert dictionary fields to JSON strings, grouping the rows by table
+        rows_by_table: Dict[str, List[dict]] = {}
+        for table_name, data in table_rows:
+            rows_by_table.setdefault(table_name, []).append({
+                'domain': data['domain'],
+                'data': json.dumps(data['data']) if data['data'] else None,
+                'table_names': json.dumps(data['table_names']),
+                'configuration': json.dumps(data['configuration']),
+                'database_config': json.dumps(data['database_config']),
+                'time_stamp': data['time_stamp']
+            })
+
         try:
-            # Create the table if it doesn't exist
             with self.engine.connect() as conn:
-                conn.execute(text(f"""
-                    CREATE TABLE IF NOT EXISTS {table_name} (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        domain TEXT NOT NULL,
-                        data JSON,
-                        table_names JSON,
-                        configuration JSON,
-                        database_config JSON,
-                        time_stamp TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                for table_name, rows in rows_by_table.items():
+                    # Create the table if it doesn't exist
+                    conn.execute(text(f"""
+                        CREATE TABLE IF NOT EXISTS {table_name} (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            domain TEXT NOT NULL,
+                            data JSON,
+                            table_names JSON,
+                            configuration JSON,
+                            database_config JSON,
+                            time_stamp TEXT,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                    """))
+
+                    # Insert the metadata
+                    conn.execute(
+                        text(f"INSERT INTO {table_name} (domain, data, table_names, configuration, database_config, time_stamp) VALUES (:domain, :data, :table_names, :configuration, :database_config, :time_stamp)"),
+                        rows
                     )
-                """))
-                
-                # Convert dictionary fields to JSON strings
-                params = {
-                    'domain': data['domain'],
-                    'data': json.dumps(data['data']) if data['data'] else None,
-                    'table_names': json.dumps(data['table_names']),
-                    'configuration': json.dumps(data['configuration']),
-                    'database_config': json.dumps(data['database_config']),
-                    'time_stamp': data['time_stamp']
-                }
-                
-                # Insert the metadata
-                conn.execute(
-                    text(f"INSERT INTO {table_name} (domain, data, table_names, configuration, database_config, time_stamp) VALUES (:domain, :data, :table_names, :configuration, :database_config, :time_stamp)"),
-                    params
-                )
                 conn.commit()
-                logger.info(f"Successfully saved benchmark metadata to {table_name}")
+                for table_name in rows_by_table:
+                    logger.info(f"Successfully saved benchmark metadata to {table_name}")
         except SQLAlchemyError as e:
             logger.error(f"Failed to save benchmark metadata: {str(e)}")
             raise Exception(f"Failed to save benchmark metadata: {str(e)}")
@@ -384,26 +407,10 @@ class DatabaseService:
                 for table in tables:
                     # Get all entries from each metadata table
                     result = conn.execute(text(f"SELECT * FROM {table}"))
-                    rows = result.fetchall()
+                    rows = result.mappings().all()
                     
                     # Convert each row to BenchmarkMetadata
-                    metadata_list = []
-                    for row in rows:
-                        # Convert row to dict and parse JSON fields
-                        row_dict = dict(row._mapping)
-                        metadata = BenchmarkMetadata(
-                            id=row_dict['id'],
-                            domain=row_dict['domain'],
-                            data=json.loads(row_dict['data']) if row_dict['data'] else None,
-                            table_names=json.loads(row_dict['table_names']),
-                            configuration=json.loads(row_dict['configuration']),
-                            database_config=json.loads(row_dict['database_config']),
-                            time_stamp=row_dict['time_stamp'],
-                            created_at=row_dict['created_at']
-                        )
-                        metadata_list.append(metadata)
-                    
-                    metadata_dict[table] = metadata_list
+                    metadata_dict[table] = [self._row_to_benchmark_metadata(row) for row in rows]
                 
                 return metadata_dict
                 
@@ -411,6 +418,45 @@ class DatabaseService:
             logger.error(f"Failed to list benchmark metadata: {str(e)}")
             raise Exception(f"Failed to list benchmark metadata: {str(e)}")
 
+    def iter_benchmark_metadata(self, table_name: str) -> Iterator[BenchmarkMetadata]:
+        """Stream the benchmark metadata entries of a single table
+        
+        Args:
+            table_name: The metadata table to read
+            
+        Yields:
+            BenchmarkMetadata: Each entry of the table, fetched from the database in batches
+        """
+        try:
+            with self.engine.connect() as conn:
+                result = conn.execution_options(yield_per=1000).execute(text(f"SELECT * FROM {table_name}"))
+                for row in result.mappings():
+                    yield self._row_to_benchmark_metadata(row)
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to read benchmark metadata from {table_name}: {str(e)}")
+            raise Exception(f"Failed to read benchmark metadata: {str(e)}")
+
+    @staticmethod
+    def _row_to_benchmark_metadata(row) -> BenchmarkMetadata:
+        """Convert a metadata table row mapping to BenchmarkMetadata, parsing its JSON fields
+        
+        The rows were written by save_benchmark_metadata, so the model is built without validating them again.
+        SQLite returns created_at as text, which is parsed here as validation would have done.
+        """
+        created_at = row['created_at']
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        return BenchmarkMetadata.model_construct(
+            id=row['id'],
+            domain=row['domain'],
+            data=json.loads(row['data']) if row['data'] else None,
+            table_names=json.loads(row['table_names']),
+            configuration=json.loads(row['configuration']),
+            database_config=json.loads(row['database_config']),
+            time_stamp=row['time_stamp'],
+            created_at=created_at
+        )
+
     def get_benchmark_run_table_names(self, domain: str) -> Dict[str, str]:
         """Get all table names for a benchmark run"""
         return {
@@ -19,8 +19,8 @@ class FileService:
         if not self.database_config.use_database:
             raise ValueError("Database must be enabled for FileService")
         
-        if self.database_config.database_type != 'sql':
-            raise ValueError("Only SQL database type is supported")
+        if self.database_config.database_type not in ('sql', 'sqlite'):
+            raise ValueError("Only SQL and SQLite database types are supported")
             
         self.engine = create_engine(self.database_config.database_connection)
         self._ensure_source_text_table()
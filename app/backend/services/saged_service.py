@@ -5,6 +5,7 @@ from ..schemas.run_config import RunBenchmarkConfig, RunBenchmarkResponse
 from .database_service import DatabaseService
 from .model_service import ModelService
 from sqlalchemy.exc import SQLAlchemyError
+import asyncio
 import logging
 import sys
 import io
@@ -449,25 +450,40 @@ class SagedService:
             metadata_table_name = f"metadata_benchmark_run_{domain}_{metadata_table_names['generation']}"  # Use original table name without .csv
             self.db_service.save_benchmark_run_metadata(metadata_table_name, result_dict)
             
-            # Get all results from the database using the actual table names
+            # Get all results from the database using the actual table names. The tables are independent,
+            # so they are read concurrently in worker threads rather than one after another on the event loop
             logger.debug("Retrieving results from database")
+            analyzers = config_dict['analysis']['analyzers']
+            (generation, extraction, disparity_raw, disparity_calibrated), statistics = await asyncio.gather(
+                asyncio.gather(
+                    asyncio.to_thread(self.db_service.get_benchmark_generation, domain, metadata_table_names['generation']),  # Use original table name without .csv
+                    asyncio.to_thread(self.db_service.get_benchmark_extraction, domain, table_names['extraction']),
+                    asyncio.to_thread(self.db_service.get_benchmark_disparity, domain, table_names['disparity'], is_calibrated=False),
+                    asyncio.to_thread(self.db_service.get_benchmark_disparity, domain, table_names['disparity'], is_calibrated=True)
+                ),
+                # Raw and calibrated statistics for each analyzer, in order
+                asyncio.gather(*(
+                    asyncio.to_thread(self.db_service.get_benchmark_statistics, domain, table_name, is_calibrated=is_calibrated)
+                    for analyzer in analyzers
+                    for table_name, is_calibrated in (
+                        (f"{metadata_table_names['statistics']}_{analyzer}", False),  # Use original table name without .csv
+                        (f"{metadata_table_names['statistics']}_calibrated_{analyzer}", True)
+                    )
+                ))
+            )
             results = {
-                "generation": self.db_service.get_benchmark_generation(domain, metadata_table_names['generation']),  # Use original table name without .csv
-                "extraction": self.db_service.get_benchmark_extraction(domain, table_names['extraction']),
-                "statistics": {},
+                "generation": generation,
+                "extraction": extraction,
+                "statistics": {
+                    analyzer: {"raw": statistics[2 * i], "calibrated": statistics[2 * i + 1]}
+                    for i, analyzer in enumerate(analyzers)
+                },
                 "disparity": {
-                    "raw": self.db_service.get_benchmark_disparity(domain, table_names['disparity'], is_calibrated=False),
-                    "calibrated": self.db_service.get_benchmark_disparity(domain, table_names['disparity'], is_calibrated=True)
+                    "raw": disparity_raw,
+                    "calibrated": disparity_calibrated
                 }
             }
             
-            # Get statistics for each analyzer
-            for analyzer in config_dict['analysis']['analyzers']:
-                results['statistics'][analyzer] = {
-                    "raw": self.db_service.get_benchmark_statistics(domain, f"{metadata_table_names['statistics']}_{analyzer}", is_calibrated=False),  # Use original table name without .csv
-                    "calibrated": self.db_service.get_benchmark_statistics(domain, f"{metadata_table_names['statistics']}_calibrated_{analyzer}", is_calibrated=True)  # Use original table name without .csv
-                }
-            
             # Convert all DataFrames to JSON-serializable format right before returning
             def convert_dataframe_to_dict(obj):
                 if isinstance(obj, pd.DataFrame):
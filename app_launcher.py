@@ -8,11 +8,14 @@ import os
 import sys
 import time
 import signal
+import hashlib
+import selectors
 import subprocess
 import threading
 import shutil
 import venv
 import yaml
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -31,8 +34,58 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+# Longest time to wait for a server to report it is up before checking it is still running
+SERVER_START_TIMEOUT = 30
+
+# Written into node_modules after an install, holding the hash of the package-lock.json it was installed from
+DEPS_HASH_FILE = ".saged-deps-hash"
+
+# Run inside the virtual environment: prints each requirement given as an argument
+# that no installed distribution satisfies
+DISTRIBUTION_CHECK_SCRIPT = """
+import re
+import sys
+from importlib.metadata import distributions
+try:
+    from packaging.requirements import Requirement
+except ImportError:
+    from pip._vendor.packaging.requirements import Requirement
+
+def canonical(name):
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+installed = {}
+for dist in distributions():
+    if dist.metadata['Name']:
+        installed.setdefault(canonical(dist.metadata['Name']), dist.version)
+
+for line in sys.argv[1:]:
+    req = Requirement(line)
+    version = installed.get(canonical(req.name))
+    if version is None or not req.specifier.contains(version, prereleases=True):
+        print(line)
+"""
+
+# Lines collected by print_colored inside a batched_output() block
+_output_buffer: Optional[list] = None
+
 def print_colored(message, color=Colors.ENDC):
-    print(f"{color}{message}{Colors.ENDC}")
+    if _output_buffer is not None:
+        _output_buffer.append(f"{color}{message}{Colors.ENDC}\n")
+    else:
+        print(f"{color}{message}{Colors.ENDC}")
+
+@contextmanager
+def batched_output():
+    """Collect print_colored output inside the block and write it to stdout in one go"""
+    global _output_buffer
+    _output_buffer = []
+    try:
+        yield
+    finally:
+        lines, _output_buffer = _output_buffer, None
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
 
 def print_banner():
     print_colored("""
@@ -53,6 +106,13 @@ class NewAppLauncher:
         self.settings_file = self.project_root / "settings.yaml"
         self.backend_url = "http://localhost:8000"
         self.frontend_url = "http://localhost:3000"
+        self._npm_cmd: Optional[str] = None
+        self._requirements: Optional[list] = None
+        # Set by the output handlers once each server reports it is listening
+        self._backend_ready = False
+        self._frontend_ready = False
+        # Multiplexes the output of both servers on the main thread (not supported for pipes on Windows)
+        self._output_selector = selectors.DefaultSelector() if os.name != 'nt' else None
         
     def check_python_version(self) -> bool:
         """Check if Python version is >= 3.10"""
@@ -98,6 +158,13 @@ class NewAppLauncher:
         else:  # Unix/Linux/macOS
             return str(self.venv_dir / "bin" / "pip")
     
+    def _load_requirements(self) -> list:
+        """Read the backend requirements once, skipping blank lines and comments"""
+        if self._requirements is None:
+            with open(self.backend_dir / "requirements.txt", 'r') as f:
+                self._requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        return self._requirements
+    
     def check_backend_dependencies(self) -> bool:
         """Check if all backend dependencies are installed and importable"""
         print_colored("📦 Checking backend dependencies...", Colors.OKBLUE)
@@ -115,9 +182,7 @@ class NewAppLauncher:
         try:
             venv_python = self.get_venv_python()
             
-            # Read requirements and extract package names
-            with open(req_file, 'r') as f:
-                requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            requirements = self._load_requirements()
             
             # Extract package names from requirements and map them to import names
             def extract_package_name(requirement_line):
@@ -153,18 +218,19 @@ class NewAppLauncher:
             
             # Step 1: Check distribution installation (fast check)
             print_colored("📋 Checking package distributions...", Colors.OKBLUE)
-            missing_distributions = []
-            
-            for req in requirements:
-                if not req.startswith('http') and '@' not in req:
-                    result = subprocess.run(
-                        [venv_python, "-c", f"import pkg_resources; pkg_resources.require('{req}')"],
-                        capture_output=True,
-                        text=True
-                    )
-                    if result.returncode != 0:
-                        missing_distributions.append(req)
-            
+            distribution_reqs = [req for req in requirements if not req.startswith('http') and '@' not in req]
+
+            # One interpreter scans the installed distributions once and reports every unmet requirement
+            result = subprocess.run(
+                [venv_python, "-c", DISTRIBUTION_CHECK_SCRIPT, *distribution_reqs],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                missing_distributions = distribution_reqs
+            else:
+                missing_distributions = result.stdout.splitlines()
+
             if missing_distributions:
                 print_colored(f"❌ Missing distributions: {', '.join(missing_distributions)}", Colors.WARNING)
                 return False
@@ -256,7 +322,10 @@ class NewAppLauncher:
             return False
     
     def find_npm(self) -> Optional[str]:
-        """Find npm executable"""
+        """Find npm executable, probing the candidate paths only on the first call"""
+        if self._npm_cmd:
+            return self._npm_cmd
+        
         npm_paths = [
             "npm",  # Try direct npm first
             r"C:\Program Files\nodejs\npm.cmd",  # Common Windows installation
@@ -265,21 +334,23 @@ class NewAppLauncher:
         ]
         
         for path in npm_paths:
-            try:
-                result = subprocess.run(
-                    [path, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                print_colored(f"Found npm at: {path} (version: {result.stdout.strip()})", Colors.OKGREEN)
-                return path
-            except:
-                continue
+            # A PATH lookup is enough to locate npm, no need to spawn it
+            resolved = shutil.which(path)
+            if resolved:
+                print_colored(f"Found npm at: {resolved}", Colors.OKGREEN)
+                self._npm_cmd = resolved
+                return resolved
         return None
     
+    def _package_lock_hash(self) -> Optional[str]:
+        """Hash package-lock.json, or return None if the frontend has no lockfile"""
+        package_lock = self.frontend_dir / "package-lock.json"
+        if not package_lock.exists():
+            return None
+        return hashlib.sha256(package_lock.read_bytes()).hexdigest()
+    
     def check_frontend_dependencies(self) -> bool:
-        """Check if frontend dependencies are installed"""
+        """Check if frontend dependencies are installed and match package-lock.json"""
         print_colored("📦 Checking frontend dependencies...", Colors.OKBLUE)
         
         node_modules_path = self.frontend_dir / "node_modules"
@@ -289,15 +360,22 @@ class NewAppLauncher:
             print_colored("❌ package.json not found in frontend directory", Colors.FAIL)
             return False
         
-        if node_modules_path.exists():
-            print_colored("✅ Frontend dependencies are installed", Colors.OKGREEN)
-            return True
-        else:
+        # npm writes this marker at the end of a complete install
+        if not (node_modules_path / ".package-lock.json").exists():
             print_colored("❌ Frontend dependencies not found", Colors.WARNING)
             return False
+        
+        lock_hash = self._package_lock_hash()
+        deps_hash_path = node_modules_path / DEPS_HASH_FILE
+        if lock_hash is not None and deps_hash_path.exists() and deps_hash_path.read_text().strip() != lock_hash:
+            print_colored("❌ Frontend dependencies are out of date with package-lock.json", Colors.WARNING)
+            return False
+        
+        print_colored("✅ Frontend dependencies are installed", Colors.OKGREEN)
+        return True
     
     def install_frontend_dependencies(self) -> bool:
-        """Install frontend dependencies using npm install"""
+        """Install frontend dependencies using npm ci, or npm install without a lockfile"""
         print_colored("📦 Installing frontend dependencies...", Colors.WARNING)
         
         npm_cmd = self.find_npm()
@@ -311,26 +389,23 @@ class NewAppLauncher:
             return False
         
         try:
-            # Clean install
-            print_colored("🧹 Cleaning existing installations...", Colors.OKBLUE)
-            node_modules = self.frontend_dir / "node_modules"
-            package_lock = self.frontend_dir / "package-lock.json"
-            
-            if node_modules.exists():
-                shutil.rmtree(node_modules)
-            if package_lock.exists():
-                package_lock.unlink()
-            
-            # Install dependencies
-            print_colored("📦 Running npm install...", Colors.OKBLUE)
+            # With a lockfile, npm ci installs exactly the locked versions without resolving them again,
+            # replacing any existing node_modules itself
+            install_cmd = "ci" if (self.frontend_dir / "package-lock.json").exists() else "install"
+            print_colored(f"📦 Running npm {install_cmd}...", Colors.OKBLUE)
             result = subprocess.run(
-                [npm_cmd, "install"],
+                [npm_cmd, install_cmd],
                 cwd=self.frontend_dir,
                 check=True,
                 capture_output=True,
                 text=True
             )
             
+            # Record which lockfile these dependencies were installed from
+            lock_hash = self._package_lock_hash()
+            if lock_hash is not None:
+                (self.frontend_dir / "node_modules" / DEPS_HASH_FILE).write_text(lock_hash)
+            
             print_colored("✅ Frontend dependencies installed successfully", Colors.OKGREEN)
             return True
             
@@ -372,18 +447,21 @@ class NewAppLauncher:
                 env=env
             )
             
-            # Start monitoring thread
-            backend_monitor = threading.Thread(target=self._monitor_backend_output)
-            backend_monitor.daemon = True
-            backend_monitor.start()
+            print_colored("\n📝 Backend Server Logs:", Colors.HEADER)
+            print_colored("=" * 60, Colors.HEADER)
+            self._watch_output(self.backend_process, self._handle_backend_line)
             
-            # Wait for backend to start
-            time.sleep(3)
+            # Wait for uvicorn to report it is listening, or for the server to exit
+            self._pump_output(
+                SERVER_START_TIMEOUT,
+                until=lambda: self._backend_ready or self.backend_process.poll() is not None
+            )
             
             if self.backend_process.poll() is None:
-                print_colored("✅ Backend server started successfully", Colors.OKGREEN)
-                print_colored(f"📊 Backend API: {self.backend_url}", Colors.OKCYAN)
-                print_colored(f"📋 API Docs: {self.backend_url}/docs", Colors.OKCYAN)
+                with batched_output():
+                    print_colored("✅ Backend server started successfully", Colors.OKGREEN)
+                    print_colored(f"📊 Backend API: {self.backend_url}", Colors.OKCYAN)
+                    print_colored(f"📋 API Docs: {self.backend_url}/docs", Colors.OKCYAN)
                 return True
             else:
                 print_colored("❌ Backend server failed to start", Colors.FAIL)
@@ -408,19 +486,19 @@ class NewAppLauncher:
                 [npm_cmd, "run", "dev"],
                 cwd=self.frontend_dir,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
                 bufsize=1,
                 universal_newlines=True
             )
             
-            # Start monitoring thread
-            frontend_monitor = threading.Thread(target=self._monitor_frontend_output)
-            frontend_monitor.daemon = True
-            frontend_monitor.start()
+            self._watch_output(self.frontend_process, self._handle_frontend_line)
             
-            # Wait for frontend to start
-            time.sleep(5)
+            # Wait for the dev server to print its local URL, or for it to exit
+            self._pump_output(
+                SERVER_START_TIMEOUT,
+                until=lambda: self._frontend_ready or self.frontend_process.poll() is not None
+            )
             
             if self.frontend_process.poll() is None:
                 print_colored("✅ Frontend server started successfully", Colors.OKGREEN)
@@ -433,54 +511,88 @@ class NewAppLauncher:
             print_colored(f"❌ Error starting frontend: {str(e)}", Colors.FAIL)
             return False
     
-    def _monitor_backend_output(self):
-        """Monitor backend process output"""
-        if not self.backend_process:
+    def _watch_output(self, process: subprocess.Popen, handle_line):
+        """Have each line of a server's output passed to handle_line"""
+        if self._output_selector is None:
+            monitor = threading.Thread(target=self._monitor_output, args=(process, handle_line))
+            monitor.daemon = True
+            monitor.start()
             return
-            
-        print_colored("\n📝 Backend Server Logs:", Colors.HEADER)
-        print_colored("=" * 60, Colors.HEADER)
         
-        for line in iter(self.backend_process.stdout.readline, ''):
-            if line.strip():
-                # Add timestamp to logs
-                timestamp = time.strftime("%H:%M:%S")
-                
-                if "Uvicorn running on" in line:
-                    print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.OKGREEN)
-                elif "ERROR" in line.upper():
-                    print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.FAIL)
-                elif "WARNING" in line.upper():
-                    print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.WARNING)
-                elif "INFO" in line.upper():
-                    print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.OKBLUE)
-                else:
-                    print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.ENDC)
+        os.set_blocking(process.stdout.fileno(), False)
+        self._output_selector.register(process.stdout, selectors.EVENT_READ, (handle_line, bytearray()))
     
-    def _monitor_frontend_output(self):
-        """Monitor frontend process output"""
-        if not self.frontend_process:
-            return
+    def _pump_output(self, duration: float, until=None):
+        """Handle the servers' output as it arrives for the given number of seconds, or until until() is true"""
+        deadline = time.monotonic() + duration
+        while (remaining := deadline - time.monotonic()) > 0:
+            if until is not None and until():
+                return
+            
+            if self._output_selector is None:
+                # The monitor threads handle the output
+                time.sleep(min(remaining, 0.1) if until is not None else remaining)
+                continue
             
+            # Wake up now and then in case until() turns true without new output, e.g. when a server exits
+            for key, _ in self._output_selector.select(min(remaining, 0.5) if until is not None else remaining):
+                handle_line, pending = key.data
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    # The server closed its output, so finish its last line
+                    self._output_selector.unregister(key.fileobj)
+                    chunk = b"\n"
+                
+                pending += chunk
+                *lines, rest = pending.split(b"\n")
+                pending[:] = rest
+                for line in lines:
+                    handle_line(line.decode("utf-8", errors="replace"))
+    
+    def _monitor_output(self, process: subprocess.Popen, handle_line):
+        """Pass each line of a process's output to handle_line until it exits"""
         try:
-            for line in iter(self.frontend_process.stdout.readline, ''):
-                if line.strip():
-                    if "Local:" in line and "http://localhost:" in line:
-                        # Extract the URL
-                        parts = line.split()
-                        for part in parts:
-                            if part.startswith("http://localhost:"):
-                                self.frontend_url = part.rstrip('/')
-                                print_colored(f"🌐 Frontend: {self.frontend_url}", Colors.OKCYAN)
-                                break
-                    elif "ready in" in line:
-                        print_colored(f"[FRONTEND] {line.strip()}", Colors.OKGREEN)
-                    elif "error" in line.lower():
-                        print_colored(f"[FRONTEND] {line.strip()}", Colors.FAIL)
+            for line in iter(process.stdout.readline, ''):
+                handle_line(line)
         except UnicodeDecodeError:
             # Handle encoding errors gracefully
             pass
     
+    def _handle_backend_line(self, line: str):
+        """Print a line of backend output"""
+        if line.strip():
+            # Add timestamp to logs
+            timestamp = time.strftime("%H:%M:%S")
+            
+            if "Uvicorn running on" in line:
+                self._backend_ready = True
+                print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.OKGREEN)
+            elif "ERROR" in line.upper():
+                print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.FAIL)
+            elif "WARNING" in line.upper():
+                print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.WARNING)
+            elif "INFO" in line.upper():
+                print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.OKBLUE)
+            else:
+                print_colored(f"[{timestamp}][BACKEND] {line.strip()}", Colors.ENDC)
+    
+    def _handle_frontend_line(self, line: str):
+        """Print the notable lines of frontend output"""
+        if line.strip():
+            if "Local:" in line and "http://localhost:" in line:
+                # Extract the URL
+                parts = line.split()
+                for part in parts:
+                    if part.startswith("http://localhost:"):
+                        self.frontend_url = part.rstrip('/')
+                        self._frontend_ready = True
+                        print_colored(f"🌐 Frontend: {self.frontend_url}", Colors.OKCYAN)
+                        break
+            elif "ready in" in line:
+                print_colored(f"[FRONTEND] {line.strip()}", Colors.OKGREEN)
+            elif "error" in line.lower():
+                print_colored(f"[FRONTEND] {line.strip()}", Colors.FAIL)
+    
     def cleanup(self):
         """Clean up processes on exit"""
         print_colored("\n🛑 Shutting down servers...", Colors.WARNING)
@@ -547,11 +659,12 @@ class NewAppLauncher:
     
     def prompt_for_api_key(self) -> str:
         """Prompt user for API key input"""
-        print_colored("\n🔑 API Key Configuration Required", Colors.HEADER)
-        print_colored("=" * 50, Colors.HEADER)
-        print_colored("To use the SAGED platform, you need to provide a DASHSCOPE API key.", Colors.OKBLUE)
-        print_colored("This key will be used for both deepseek-r1-distill-qwen-1.5b and qwen-turbo-latest models.", Colors.OKBLUE)
-        print("")
+        with batched_output():
+            print_colored("\n🔑 API Key Configuration Required", Colors.HEADER)
+            print_colored("=" * 50, Colors.HEADER)
+            print_colored("To use the SAGED platform, you need to provide a DASHSCOPE API key.", Colors.OKBLUE)
+            print_colored("This key will be used for both deepseek-r1-distill-qwen-1.5b and qwen-turbo-latest models.", Colors.OKBLUE)
+            print_colored("")
         
         while True:
             api_key = input("Please enter your DASHSCOPE API key (starts with 'sk-'): ").strip()
@@ -605,14 +718,21 @@ class NewAppLauncher:
         """Main execution function"""
         print_banner()
         
-        # Check basic requirements
-        if not self.backend_dir.exists():
-            print_colored(f"❌ Backend directory not found: {self.backend_dir}", Colors.FAIL)
-            return
-        
-        if not self.frontend_dir.exists():
-            print_colored(f"❌ Frontend directory not found: {self.frontend_dir}", Colors.FAIL)
-            return
+        # Check basic requirements, listing each directory once rather than stat-ing file by file
+        for label, directory, required in (
+            ("Backend", self.backend_dir, {"main.py", "requirements.txt"}),
+            ("Frontend", self.frontend_dir, {"package.json"}),
+        ):
+            try:
+                with os.scandir(directory) as entries:
+                    missing = required - {entry.name for entry in entries}
+            except FileNotFoundError:
+                print_colored(f"❌ {label} directory not found: {directory}", Colors.FAIL)
+                return
+            
+            if missing:
+                print_colored(f"❌ Missing in {label.lower()} directory: {', '.join(sorted(missing))}", Colors.FAIL)
+                return
         
         try:
             # Target 1: Initialize Backend Server
@@ -635,21 +755,22 @@ class NewAppLauncher:
                 return
             
             # Success message
-            print_colored("\n" + "="*60, Colors.OKGREEN)
-            print_colored("🎉 SAGED Platform is running successfully!", Colors.OKGREEN)
-            print_colored("="*60, Colors.OKGREEN)
-            print_colored(f"📊 Backend API: {self.backend_url}", Colors.OKCYAN)
-            print_colored(f"📋 API Documentation: {self.backend_url}/docs", Colors.OKCYAN)
-            print_colored(f"🌐 Frontend App: {self.frontend_url}", Colors.OKCYAN)
-            print_colored(f"⚙️ Settings File: {self.settings_file}", Colors.OKCYAN)
-            print_colored("="*60, Colors.OKGREEN)
-            print_colored("💡 Press Ctrl+C to stop all servers", Colors.WARNING)
-            print_colored("="*60 + "\n", Colors.OKGREEN)
-            
-            # Keep the main process alive and monitor services
+            with batched_output():
+                print_colored("\n" + "="*60, Colors.OKGREEN)
+                print_colored("🎉 SAGED Platform is running successfully!", Colors.OKGREEN)
+                print_colored("="*60, Colors.OKGREEN)
+                print_colored(f"📊 Backend API: {self.backend_url}", Colors.OKCYAN)
+                print_colored(f"📋 API Documentation: {self.backend_url}/docs", Colors.OKCYAN)
+                print_colored(f"🌐 Frontend App: {self.frontend_url}", Colors.OKCYAN)
+                print_colored(f"⚙️ Settings File: {self.settings_file}", Colors.OKCYAN)
+                print_colored("="*60, Colors.OKGREEN)
+                print_colored("💡 Press Ctrl+C to stop all servers", Colors.WARNING)
+                print_colored("="*60 + "\n", Colors.OKGREEN)
+            
+            # Keep the main process alive, printing server output and monitoring services
             try:
                 while True:
-                    time.sleep(1)
+                    self._pump_output(1)
                     # Check if processes are still running
                     if self.backend_process and self.backend_process.poll() is not None:
                         print_colored("❌ Backend process died unexpectedly", Colors.FAIL)
@@ -1,12 +1,35 @@
-from ._saged_data import SAGEDData
-from ._extractor import FeatureExtractor
-from ._diagnoser import DisparityDiagnoser
-from ._scrape import find_similar_keywords, search_wikipedia, KeywordFinder, SourceFinder, Scraper
+import importlib
+
 from ._utility import clean_list, clean_sentences_and_join, construct_non_containing_set, check_generation_function, ignore_future_warnings, check_benchmark, ensure_directory_exists, _update_configuration
-from ._assembler import PromptAssembler
-from ._generator import ResponseGenerator
-from ._pipeline import Pipeline
-from ._mpf_pipeline import MPFPipeline
+
+# Submodules that load embedding and classification models are imported on first attribute access
+_LAZY_IMPORTS = {
+    'SAGEDData': '._saged_data',
+    'FeatureExtractor': '._extractor',
+    'DisparityDiagnoser': '._diagnoser',
+    'find_similar_keywords': '._scrape',
+    'search_wikipedia': '._scrape',
+    'KeywordFinder': '._scrape',
+    'SourceFinder': '._scrape',
+    'Scraper': '._scrape',
+    'PromptAssembler': '._assembler',
+    'ResponseGenerator': '._generator',
+    'Pipeline': '._pipeline',
+    'MPFPipeline': '._mpf_pipeline',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     'SAGEDData',
@@ -31,4 +54,4 @@ __all__ = [
     'MPFPipeline',
 ]
 
-__version__ = "0.0.15"
\ No newline at end of file
+__version__ = "0.0.15"
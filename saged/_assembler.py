@@ -275,6 +275,16 @@ class PromptAssembler:
 
     @ignore_future_warnings
     def branching(self, branching_config = None):
+        # Collect the branched pieces and concatenate them once, rather than
+        # growing the result frame with a concat per concept pair
+        pieces = list(self.branching_iter(branching_config))
+        if len(pieces) > 1:
+            self.output_df = pd.concat(pieces)
+
+        return self.scraped_sentence_to_saged_data()
+
+    def branching_iter(self, branching_config = None):
+        """Yield the (source-restricted) prompts followed by one branched frame per concept pair."""
 
         df = self.output_df
         branching_config_scheme = {
@@ -499,7 +509,7 @@ class PromptAssembler:
         if branching_config['source_restriction'] is not None:
             df = df[df['source_tag'] == branching_config['source_restriction']]
 
-        df_result = df.copy()
+        yield df
         for concept_pair in tqdm(branching_pairs, desc='Branching pairs'):
             if branching_config['replacement_descriptor_require']:
                 assert gef is not None, "Generation function is required for replacement descriptor generation."
@@ -532,8 +542,4 @@ class PromptAssembler:
             df_new['source_tag'] = df_new.apply(lambda row: f'br_{row["source_tag"]}_cat_{row["concept"]}', axis=1)
             df_new['concept'] = df_new['concept'].apply(lambda x: replace_terms(x, rd))
             df_new['keyword'] = df_new['keyword'].apply(lambda x: replace_terms(x, rd))
-            df_result = pd.concat([df_result, df_new])
-
-            self.output_df = df_result
-
-        return self.scraped_sentence_to_saged_data()
\ No newline at end of file
+            yield df_new
\ No newline at end of file
@@ -55,7 +55,8 @@ class DisparityDiagnoser:
         self.target_groups = [target_groups] if isinstance(target_groups, str) else target_groups
         self.baseline = baseline
         self.group_type = group_type
-        self.benchmark = benchmark.copy()
+        # The benchmark's values are never written, a shallow copy keeps the column drop below off the caller's frame
+        self.benchmark = benchmark.copy(deep=False)
 
         # Validate that necessary columns exist
         self._validate_columns()
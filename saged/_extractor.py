@@ -43,9 +43,9 @@ class FeatureExtractor:
         for feature in features:
             for col in self.generations:
                 # if col != baseline:
-                df[f'{col}_{feature}_cbr_{baseline}'] = df.apply(lambda x: x[f'{col}_{feature}'] - x[f'{baseline}_{feature}'], axis=1)
+                df[f'{col}_{feature}_cbr_{baseline}'] = df[f'{col}_{feature}'] - df[f'{baseline}_{feature}']
             self.calibrated_features.append(f'{feature}_cbr_{baseline}')
-        self.benchmark = df.copy()
+        self.benchmark = df
         return df
 
     @staticmethod
@@ -89,7 +89,7 @@ class FeatureExtractor:
         self.classification_features.append('sentiment_score')
         if self.calibration:
             df = self._baseline_calibration(['sentiment_score'])
-        self.benchmark = df.copy()
+        self.benchmark = df
         return df
 
     @ignore_future_warnings
@@ -111,7 +111,7 @@ class FeatureExtractor:
         self.classification_features.append('regard_score')
         if self.calibration:
             df = self._baseline_calibration(['regard_score'])
-        self.benchmark = df.copy()
+        self.benchmark = df
         return df
 
     @ignore_future_warnings
@@ -144,7 +144,7 @@ class FeatureExtractor:
         self.classification_features.extend(['stereotype_gender_score', 'stereotype_religion_score', 'stereotype_profession_score', 'stereotype_race_score'])
         if self.calibration:
             df = self._baseline_calibration(['stereotype_gender_score', 'stereotype_religion_score', 'stereotype_profession_score', 'stereotype_race_score'])
-        self.benchmark = df.copy()
+        self.benchmark = df
         return df
 
     @ignore_future_warnings
@@ -180,7 +180,7 @@ class FeatureExtractor:
         self.classification_features.extend(['extraversion_score', 'neuroticism_score', 'agreeableness_score', 'conscientiousness_score', 'openness_score'])
         if self.calibration:
             df = self._baseline_calibration(['extraversion_score', 'neuroticism_score', 'agreeableness_score', 'conscientiousness_score', 'openness_score'])
-        self.benchmark = df.copy()
+        self.benchmark = df
         return df
 
     @ignore_future_warnings
@@ -204,7 +204,7 @@ class FeatureExtractor:
         self.classification_features.append('toxicity_score')
         if self.calibration:
             df = self._baseline_calibration(['toxicity_score'])
-        self.benchmark = df.copy()
+        self.benchmark = df
         return df
 
     @ignore_future_warnings
@@ -218,7 +218,7 @@ class FeatureExtractor:
         self.classification_features.append(f'{classifier_name}_score')
         if self.calibration:
             df = self._baseline_calibration([f'{classifier_name}_score'])
-        self.benchmark = df.copy()
+        self.benchmark = df
         return df
 
     @ignore_future_warnings
@@ -288,10 +288,9 @@ class FeatureExtractor:
         for col in self.generations:
             df[f'{col}_{distance_function}_distance_wrt_{self.baseline}'] = calculate_pairwise_distances(df[col], df[self.baseline])
         self.classification_features.append(f'{distance_function}_distance_wrt_{self.baseline}')
-        self.benchmark = df.copy()
         if self.calibration:
             df = self._baseline_calibration([f'{distance_function}_distance_wrt_{self.baseline}'])
-        self.benchmark = df.copy()
+        self.benchmark = df
         return df
 
     @ignore_future_warnings
@@ -330,7 +329,7 @@ class FeatureExtractor:
             def load_oxford5000(file_path='Oxford 5000.txt'):
                 """Load the Oxford 5000 word list from a file."""
                 with open(file_path, 'r') as file:
-                    oxford5000_words = [line.strip() for line in file]
+                    oxford5000_words = file.read().splitlines()
                 return oxford5000_words
 
             # Step 1: Load the Oxford 5000 word list if word_list is not provided
@@ -165,6 +165,13 @@ class ResponseGenerator:
         check_benchmark(benchmark)
         self.benchmark = benchmark
 
+    def _save_benchmark(self, save_path):
+        """Write the benchmark to save_path, as parquet for a '.parquet' path and as CSV otherwise"""
+        if save_path.lower().endswith('.parquet'):
+            self.benchmark.to_parquet(save_path, index=False, compression='zstd')
+        else:
+            self.benchmark.to_csv(save_path, index=False)
+
     @classmethod
     def prompt_template(cls, task):
         if task == 'completion':
@@ -213,7 +220,7 @@ class ResponseGenerator:
             # Save progress if path is provided
             if save_path:
                 temp_save_path = save_path
-                self.benchmark.to_csv(temp_save_path, index=False)
+                self._save_benchmark(temp_save_path)
                 print(f'Progress saved to {temp_save_path}')
 
         # Apply final transformations
@@ -235,7 +242,7 @@ class ResponseGenerator:
 
         # Save final results if path is provided
         if save_path:
-            self.benchmark.to_csv(save_path, index=False)
+            self._save_benchmark(save_path)
 
         return self.benchmark
 
@@ -326,7 +333,7 @@ class ResponseGenerator:
             
             # Save progress if path is provided
             if save_path:
-                self.benchmark.to_csv(save_path, index=False)
+                self._save_benchmark(save_path)
 
         return self.benchmark
 
@@ -443,7 +450,7 @@ Please synthesize these responses into a single coherent answer:"""
             
             # Save progress if path is provided
             if save_path:
-                self.benchmark.to_csv(save_path, index=False)
+                self._save_benchmark(save_path)
 
         return self.benchmark
 
@@ -1,15 +1,454 @@
-from ._generator import ResponseGenerator
-from ._extractor import FeatureExtractor
-from ._diagnoser import DisparityDiagnoser as Analyzer
 import pandas as pd
 from ._saged_data import SAGEDData as saged
-from ._scrape import KeywordFinder, SourceFinder, Scraper, check_generation_function
-from ._assembler import PromptAssembler as PromptMaker
-from ._utility import _update_configuration
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, JSON, Float, DateTime
+from ._utility import _cached_update_configuration, _update_configuration, _get_sqlite_url, check_generation_function
+from ._utility import _cosine_topk, _get_parquet_path
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, JSON, Float, DateTime, Index
+from sqlalchemy import select, table, literal_column, inspect
 from datetime import datetime
 import os
 from tqdm import tqdm
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import importlib
+import importlib.util
+import asyncio
+import logging
+from contextlib import contextmanager
+import hashlib
+import copy
+import pickle
+import json
+from pathlib import PurePath
+import io
+import csv
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages pull in transformers and sentence-transformers, so they are imported on first use
+_LAZY_IMPORTS = {
+    'ResponseGenerator': ('._generator', 'ResponseGenerator'),
+    'FeatureExtractor': ('._extractor', 'FeatureExtractor'),
+    'Analyzer': ('._diagnoser', 'DisparityDiagnoser'),
+    'KeywordFinder': ('._scrape', 'KeywordFinder'),
+    'SourceFinder': ('._scrape', 'SourceFinder'),
+    'Scraper': ('._scrape', 'Scraper'),
+    'PromptMaker': ('._assembler', 'PromptAssembler'),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name, __package__), attribute)
+    globals()[name] = value
+    return value
+
+
+def _lazy_import(*names):
+    """Bind lazily imported names into the module namespace, keeping any already bound (e.g. patched)"""
+    for name in names:
+        if name not in globals():
+            __getattr__(name)
+
+
+def _can_run_async():
+    """Whether the wiki scraper can run its own event loop: aiohttp is installed and no loop is running"""
+    if importlib.util.find_spec('aiohttp') is None:
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+def _suffixed_location(location, suffix=None):
+    """Split a saving location into its table name and file path, each with suffix appended to the name"""
+    path = PurePath(location)
+    extension = path.suffix if path.suffix.lower() in ('.csv', '.parquet') else ''
+    base = path.with_suffix('') if extension else path
+    name = f'{base.name}_{suffix}' if suffix else base.name
+    return str(base.with_name(name)), str(path.with_name(name + extension))
+
+
+def _content_hash(value, callable_key=None):
+    """Hash a JSON-like value, keying any callable in it by callable_key
+
+    Closures and lambdas sharing a name can't be told apart, so a value holding a callable can only be hashed
+    with an explicit callable_key standing in for it, otherwise TypeError is raised.
+    """
+    def _default(obj):
+        if callable(obj):
+            if callable_key is None:
+                raise TypeError(f"{obj!r} can't be hashed without a cache key")
+            return callable_key
+        return repr(obj)
+
+    return hashlib.blake2b(json.dumps(value, sort_keys=True, default=_default).encode()).hexdigest()
+
+
+class _PendingWrites:
+    """Database writes queued by a concept build, applied afterwards in one short transaction
+
+    Holds plain data only, so a worker process can hand it back to the parent that does the writing.
+    """
+    def __init__(self):
+        self.saves = []  # (SAGEDData, file_path) pairs
+        self.cache_rows = []  # Stage cache rows as column -> value dictionaries
+
+
+_DATABASE_CONFIG_SCHEME = {
+    'use_database': None,
+    'database_type': None,  # 'sql' or 'json' or 'sqlite' or 'parquet'
+    'database_connection': None,  # Connection string or path
+    'table_prefix': None,  # Prefix for database tables
+    'source_text_table': None,  # Table name for storing source texts
+    'stage_cache': None,  # Reuse stage outputs whose configuration and input are unchanged
+}
+
+_DATABASE_DEFAULT_CONFIG = {
+    'use_database': False,
+    'database_type': 'sqlite',
+    'database_connection': 'sqlite:///data/customized/database/saged.db',
+    'table_prefix': '',
+    'source_text_table': 'source_texts',  # Default table name for source texts
+    'stage_cache': False,
+}
+
+_LLM_INQUIRIES_CONFIG_SCHEME = {
+    'n_run': None,
+    'n_keywords': None,
+    'generation_function': None,
+    'model_name': None,
+    'embedding_model': None,
+    'show_progress': None
+}
+
+_LLM_INQUIRIES_DEFAULT_CONFIG = {
+    'n_run': 20,
+    'n_keywords': 20,
+    'generation_function': None,
+    'model_name': None,
+    'embedding_model': None,
+    'show_progress': True
+}
+
+_BRANCHING_CONFIG_SCHEME = {
+    'branching_pairs': None,
+    'direction': None,
+    'source_restriction': None,
+    'replacement_descriptor_require': None,
+    'descriptor_threshold': None,
+    'descriptor_embedding_model': None,
+    'descriptor_distance': None,
+    'replacement_description': None,
+    'replacement_description_saving': None,
+    'replacement_description_saving_location': None,
+    'counterfactual_baseline': None,
+    'generation_function': None,
+}
+_CONCEPT_BENCHMARK_CONFIG_SCHEME = {
+    'keyword_finder': {
+        'require': None,
+        'reading_location': None,
+        'method': None,
+        'keyword_number': None,
+        'hyperlinks_info': None,
+        'llm_info': _LLM_INQUIRIES_CONFIG_SCHEME,
+        'max_adjustment': None,
+        'embedding_model': None,
+        'saving': None,
+        'saving_location': None,
+        'manual_keywords': None,
+        'cache_key': None,
+    },
+    'source_finder': {
+        'require': None,
+        'reading_location': None,
+        'method': None,
+        'local_file': None,
+        'scrape_number': None,
+        'saving': None,
+        'saving_location': None,
+        'scrape_backlinks': None,
+        'manual_sources': None,  # List of direct file paths to use
+    },
+    'scraper': {
+        'require': None,
+        'reading_location': None,
+        'saving': None,
+        'method': None,  # This is related to the source_finder method,
+        'saving_location': None,
+        'max_workers': None},
+    'prompt_assembler': {
+        'require': None,
+        'method': None,
+        'generation_function': None,
+        'keyword_list': None,
+        'answer_check': None,
+        'saving_location': None,
+        'max_benchmark_length': None,
+        'cache_key': None,
+    },
+}
+_DOMAIN_BENCHMARK_CONFIG_SCHEME = {
+    'concepts': None,
+    'branching': None,
+    # If branching is False, then branching_config is not taken into account
+    'branching_config': None,
+    'shared_config': None,
+    'concept_specified_config': None,
+    'saving': None,
+    # If saving is False, then saving_location is not taken into account
+    'saving_location': None,
+    'database_config': _DATABASE_CONFIG_SCHEME,
+    'max_workers': None,
+    'checkpoint_interval': None,
+}
+_BRANCHING_DEFAULT_CONFIG = {
+    'branching_pairs': 'not_all',
+    'direction': 'both',
+    'source_restriction': None,
+    'replacement_descriptor_require': False,
+    'descriptor_threshold': 'Auto',
+    'descriptor_embedding_model': 'paraphrase-Mpnet-base-v2',
+    'descriptor_distance': 'cosine',
+    'replacement_description': {},
+    'replacement_description_saving': True,
+    'replacement_description_saving_location': f'data/customized/benchmark/replacement_description.json',
+    'counterfactual_baseline': True,
+    'generation_function': None,
+}
+_CONCEPT_BENCHMARK_DEFAULT_CONFIG = {
+    'keyword_finder': {
+        'require': True,
+        'reading_location': 'default',
+        'method': 'embedding_on_wiki',  # 'embedding_on_wiki' or 'llm_inquiries' or 'hyperlinks_on_wiki'
+        'keyword_number': 7,  # keyword_number works for both embedding_on_wiki and hyperlinks_on_wiki
+        'hyperlinks_info': [],
+        # If hyperlinks_info is method chosen, can give more info... format='Paragraph', link=None, page_name=None, name_filter=False, col_info=None, depth=None, source_tag='default', max_keywords = None). col_info format is [{'table_num': value, 'column_name':List}]
+        'llm_info': _LLM_INQUIRIES_DEFAULT_CONFIG,
+        # If llm_inequiries is method chosen, can give more info... self, n_run=20,n_keywords=20, generation_function=None, model_name=None, embedding_model=None, show_progress=True
+        'max_adjustment': 150,
+        # max_adjustment for embedding_on_wiki. If max_adjustment is equal to -1, then max_adjustment is not taken into account.
+        'embedding_model': 'paraphrase-Mpnet-base-v2',
+        'saving': True,
+        'saving_location': 'default',
+        'manual_keywords': None,
+        # Version string standing in for the embedding model or generation function in the stage cache key.
+        # Bump it when they change; without one a stage using a function or model object isn't cached
+        'cache_key': None,
+    },
+    'source_finder': {
+        'require': True,
+        'reading_location': 'default',
+        'method': 'wiki',  # 'wiki' or 'local_files',
+        'local_file': None,
+        'scrape_number': 5,
+        'saving': True,
+        'saving_location': 'default',
+        'scrape_backlinks': 0,
+        'manual_sources': [],  # Default empty list for manual sources
+    },
+    'scraper': {
+        'require': True,
+        'reading_location': 'default',
+        'saving': True,
+        'method': 'wiki',  # This is related to the source_finder method,
+        'saving_location': 'default',
+        # Processes scraping local files side by side, 1 scrapes them in this process
+        'max_workers': 1},
+    'prompt_assembler': {
+        'require': True,
+        'method': 'split_sentences',  # can also have "questions" as a method
+        # prompt_assembler_generation_function and prompt_assembler_keyword_list are needed for questions
+        'generation_function': None,
+        # prompt_assembler_keyword_list must contain at least one keyword. The first keyword must be the keyword
+        # of the original scraped data.
+        'keyword_list': None,
+        # User will enter False if they don't want their questions answer checked.
+        'answer_check': False,
+        'saving_location': 'default',
+        'max_benchmark_length': 500,
+        # Version string standing in for generation_function in the stage cache key, see keyword_finder
+        'cache_key': None,
+    },
+}
+_DOMAIN_BENCHMARK_DEFAULT_CONFIG = {
+    'concepts': [],
+    'branching': False,  # If branching is False, then branching_config is not taken into account
+    'branching_config': _BRANCHING_DEFAULT_CONFIG,
+    'shared_config': _CONCEPT_BENCHMARK_DEFAULT_CONFIG,
+    'concept_specified_config': {},
+    'saving': True,  # If saving is False, then saving_location is not taken into account
+    'saving_location': 'default',
+    'database_config': _DATABASE_DEFAULT_CONFIG,
+    # Number of worker processes building concepts concurrently. With more than one worker, the concept
+    # configurations (including any generation functions and embedding models) must be picklable, so lambdas
+    # and closures don't qualify; otherwise the concepts are built sequentially.
+    'max_workers': 1,
+    # Also save the benchmark merged so far every checkpoint_interval concepts, 0 only saves the finished one
+    'checkpoint_interval': 0,
+}
+_ANALYTICS_CONFIG_SCHEME = {
+    "database_config": _DATABASE_DEFAULT_CONFIG,
+    "benchmark": None,
+    "generation": {
+        "require": None,
+        "generate_dict": None,
+        "generation_saving_location": None,
+        "generation_list": None,
+        "cache_location": None,
+        "cache_keys": None,
+    },
+    "extraction": {
+        "feature_extractors": None,
+        'extractor_configs': None,
+        "calibration": None,
+        "extraction_saving_location": None,
+        "max_workers": None,
+    },
+    "analysis": {
+        "specifications": None,
+        "analyzers": None,
+        "analyzer_configs": None,
+        'statistics_saving_location': None,
+        "disparity_saving_location": None,
+    }
+}
+_ANALYTICS_DEFAULT_CONFIG = {
+    "database_config": _DATABASE_DEFAULT_CONFIG,
+    "generation": {
+        "require": True,
+        "generate_dict": {},
+        "generation_saving_location": 'data/customized/' + '_' + 'sbg_benchmark.csv',
+        "generation_list": [],
+        "baseline": 'baseline',
+        # Directory reusing earlier generations of the same prompts. None disables it
+        "cache_location": None,
+        # Generation name -> version string identifying the model and settings behind its function, which is
+        # part of the cache key. Bump it when they change; generations without one are never cached
+        "cache_keys": {},
+    },
+    "extraction": {
+        "feature_extractors": [
+            'personality_classification',
+            'toxicity_classification',
+            'sentiment_classification',
+            'stereotype_classification',
+            'regard_classification'
+        ],
+        'extractor_configs': {},
+        "calibration": True,
+        "extraction_saving_location": 'data/customized/' + '_' + 'sbge_benchmark.csv',
+        # Number of threads running the column feature extractors side by side. Each thread holds its own copy
+        # of the benchmark and loads its own classification model
+        "max_workers": 1,
+    },
+    "analysis": {
+        "specifications": ['concept', 'source_tag'],
+        "analyzers": ['mean', 'selection_rate', 'precision'],
+        "analyzer_configs": {
+            'selection_rate': {'standard_by': 'mean'},
+            'precision': {'tolerance': 0.1}
+        },
+        'statistics_saving_location': 'data/customized/' + '_' + 'sbgea_statistics.csv',
+        "disparity_saving_location": 'data/customized/' + '_' + 'sbgea_disparity.csv',
+    }
+}
+
+# Methods accepted by each stage of a concept benchmark configuration
+_VALID_KEYWORD_FINDER_METHODS = frozenset({'embedding_on_wiki', 'llm_inquiries', 'hyperlinks_on_wiki'})
+_VALID_SOURCE_FINDER_METHODS = frozenset({'wiki', 'local_files'})
+_VALID_SCRAPER_METHODS = frozenset({'wiki', 'local_files'})
+_VALID_PROMPT_ASSEMBLER_METHODS = frozenset({'split_sentences', 'questions'})
+
+# Feature extractors that only add columns to the benchmark rows, so their outputs can be computed apart and joined
+_COLUMN_FEATURE_EXTRACTORS = frozenset({
+    'sentiment_classification', 'regard_classification', 'stereotype_classification',
+    'personality_classification', 'toxicity_classification', 'customized_classification', 'embedding_distance'})
+
+# Errors from a single extractor or analyzer method that are reported and skipped rather than ending the run
+_RECOVERABLE_METHOD_ERRORS = (ValueError, KeyError, TypeError, RuntimeError)
+
+# Lookups used to unpack each section of a concept benchmark configuration
+_get_keyword_finder_items = itemgetter(
+    'require', 'reading_location', 'method', 'keyword_number', 'hyperlinks_info',
+    'llm_info', 'max_adjustment', 'embedding_model', 'saving', 'saving_location',
+    'manual_keywords')
+_get_source_finder_items = itemgetter(
+    'require', 'reading_location', 'method', 'local_file', 'saving',
+    'saving_location', 'scrape_number', 'scrape_backlinks', 'manual_sources')
+_get_scraper_items = itemgetter('require', 'reading_location', 'saving', 'method', 'saving_location')
+_get_prompt_assembler_items = itemgetter(
+    'require', 'method', 'generation_function', 'keyword_list', 'answer_check',
+    'saving_location', 'max_benchmark_length')
+
+
+class _BulkSink:
+    """Collect the DataFrames saved by a benchmark run and write each table once on exit
+
+    With a SQL database every table is written in a single transaction, otherwise each location is written once.
+    Frames bound for a '.parquet' location share one file, tagged with their suffix in a '__variant__' column.
+    """
+
+    def __init__(self, pipeline, database_config):
+        self.pipeline = pipeline
+        self.database_config = database_config
+        self.tables = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Write what was collected even if the run failed part way, like the per-call saves did
+        self.flush()
+        return False
+
+    def add(self, df, location, suffix=None):
+        """Queue a DataFrame for the table or file named by location and suffix"""
+        if self.database_config['use_database']:
+            name = self.pipeline._get_table_name(_suffixed_location(location, suffix)[0], self.database_config)
+        elif location.endswith('.parquet'):
+            name = location
+            df = df.assign(__variant__=suffix or '')
+        else:
+            name = _suffixed_location(location, suffix)[1]
+        self.tables.setdefault(name, []).append(df)
+
+    def flush(self):
+        tables = {name: pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+                  for name, frames in self.tables.items()}
+        self.tables = {}
+        if not tables:
+            return True
+
+        if not self.database_config['use_database']:
+            for location, df in tables.items():
+                if location.endswith('.parquet'):
+                    df.to_parquet(location, index=False, compression='zstd')
+                else:
+                    df.to_csv(location, index=False)
+                print(f"Data saved to {location}")
+            return True
+
+        engine = self.pipeline._get_database_connection(self.database_config)
+        if not engine:
+            # Not a SQL database, e.g. parquet, which has no transactions to share
+            return all(self.pipeline._save_to_database(df, table_name, self.database_config)
+                       for table_name, df in tables.items())
+
+        try:
+            with engine.begin() as conn:
+                for table_name, df in tables.items():
+                    df.to_sql(table_name, conn, if_exists='replace', index=False,
+                              **self.pipeline._get_to_sql_options(df, engine))
+            return True
+        except Exception as e:
+            print(f"Error saving to database: {e}")
+            return False
+
 
 class Pipeline:
     _branching_config_scheme = {}
@@ -25,6 +464,11 @@ class Pipeline:
     _llm_inquiries_config_scheme = {}
     _llm_inquiries_default_config = {}
     database_config = {}
+    _config_initialized = False
+    # Rows per multi-row INSERT issued by _save_to_database
+    _to_sql_chunksize = 10_000
+    # SQLite builds before 3.32 cap bound parameters per statement at 999
+    _sqlite_max_variables = 999
 
     def __init__(self):
         """Initialize Pipeline with database configuration
@@ -36,234 +480,26 @@ class Pipeline:
 
     @classmethod
     def _set_config(cls):
-        cls._database_config_scheme = {
-            'use_database': None,
-            'database_type': None,  # 'sql' or 'json' or 'sqlite'
-            'database_connection': None,  # Connection string or path
-            'table_prefix': None,  # Prefix for database tables
-            'source_text_table': None,  # Table name for storing source texts
-        }
-        
-        cls._database_default_config = {
-            'use_database': False,
-            'database_type': 'json',
-            'database_connection': 'data/customized/database',
-            'table_prefix': '',
-            'source_text_table': 'source_texts',  # Default table name for source texts
-        }
-
-        cls._llm_inquiries_config_scheme = {
-            'n_run': None,
-            'n_keywords': None,
-            'generation_function': None,
-            'model_name': None,
-            'embedding_model': None,
-            'show_progress': None
-        }
-
-        cls._llm_inquiries_default_config = {
-            'n_run': 20,
-            'n_keywords': 20,
-            'generation_function': None,
-            'model_name': None,
-            'embedding_model': None,
-            'show_progress': True
-        }
-
-        cls._branching_config_scheme = {
-            'branching_pairs': None,
-            'direction': None,
-            'source_restriction': None,
-            'replacement_descriptor_require': None,
-            'descriptor_threshold': None,
-            'descriptor_embedding_model': None,
-            'descriptor_distance': None,
-            'replacement_description': None,
-            'replacement_description_saving': None,
-            'replacement_description_saving_location': None,
-            'counterfactual_baseline': None,
-            'generation_function': None,
-        }
-        cls._concept_benchmark_config_scheme = {
-            'keyword_finder': {
-                'require': None,
-                'reading_location': None,
-                'method': None,
-                'keyword_number': None,
-                'hyperlinks_info': None,
-                'llm_info': cls._llm_inquiries_config_scheme,
-                'max_adjustment': None,
-                'embedding_model': None,
-                'saving': None,
-                'saving_location': None,
-                'manual_keywords': None,
-            },
-            'source_finder': {
-                'require': None,
-                'reading_location': None,
-                'method': None,
-                'local_file': None,
-                'scrape_number': None,
-                'saving': None,
-                'saving_location': None,
-                'scrape_backlinks': None,
-                'manual_sources': None,  # List of direct file paths to use
-            },
-            'scraper': {
-                'require': None,
-                'reading_location': None,
-                'saving': None,
-                'method': None,  # This is related to the source_finder method,
-                'saving_location': None},
-            'prompt_assembler': {
-                'require': None,
-                'method': None,
-                'generation_function': None,
-                'keyword_list': None,
-                'answer_check': None,
-                'saving_location': None,
-                'max_benchmark_length': None,
-            },
-        }
-        cls._domain_benchmark_config_scheme = {
-            'concepts': None,
-            'branching': None,
-            # If branching is False, then branching_config is not taken into account
-            'branching_config': None,
-            'shared_config': None,
-            'concept_specified_config': None,
-            'saving': None,
-            # If saving is False, then saving_location is not taken into account
-            'saving_location': None,
-            'database_config': cls._database_config_scheme,
-        }
-        cls._branching_default_config = {
-            'branching_pairs': 'not_all',
-            'direction': 'both',
-            'source_restriction': None,
-            'replacement_descriptor_require': False,
-            'descriptor_threshold': 'Auto',
-            'descriptor_embedding_model': 'paraphrase-Mpnet-base-v2',
-            'descriptor_distance': 'cosine',
-            'replacement_description': {},
-            'replacement_description_saving': True,
-            'replacement_description_saving_location': f'data/customized/benchmark/replacement_description.json',
-            'counterfactual_baseline': True,
-            'generation_function': None,
-        }
-        cls._concept_benchmark_default_config = {
-            'keyword_finder': {
-                'require': True,
-                'reading_location': 'default',
-                'method': 'embedding_on_wiki',  # 'embedding_on_wiki' or 'llm_inquiries' or 'hyperlinks_on_wiki'
-                'keyword_number': 7,  # keyword_number works for both embedding_on_wiki and hyperlinks_on_wiki
-                'hyperlinks_info': [],
-                # If hyperlinks_info is method chosen, can give more info... format='Paragraph', link=None, page_name=None, name_filter=False, col_info=None, depth=None, source_tag='default', max_keywords = None). col_info format is [{'table_num': value, 'column_name':List}]
-                'llm_info': cls._llm_inquiries_default_config,
-                # If llm_inequiries is method chosen, can give more info... self, n_run=20,n_keywords=20, generation_function=None, model_name=None, embedding_model=None, show_progress=True
-                'max_adjustment': 150,
-                # max_adjustment for embedding_on_wiki. If max_adjustment is equal to -1, then max_adjustment is not taken into account.
-                'embedding_model': 'paraphrase-Mpnet-base-v2',
-                'saving': True,
-                'saving_location': 'default',
-                'manual_keywords': None,
-            },
-            'source_finder': {
-                'require': True,
-                'reading_location': 'default',
-                'method': 'wiki',  # 'wiki' or 'local_files',
-                'local_file': None,
-                'scrape_number': 5,
-                'saving': True,
-                'saving_location': 'default',
-                'scrape_backlinks': 0,
-                'manual_sources': [],  # Default empty list for manual sources
-            },
-            'scraper': {
-                'require': True,
-                'reading_location': 'default',
-                'saving': True,
-                'method': 'wiki',  # This is related to the source_finder method,
-                'saving_location': 'default'},
-            'prompt_assembler': {
-                'require': True,
-                'method': 'split_sentences',  # can also have "questions" as a method
-                # prompt_assembler_generation_function and prompt_assembler_keyword_list are needed for questions
-                'generation_function': None,
-                # prompt_assembler_keyword_list must contain at least one keyword. The first keyword must be the keyword
-                # of the original scraped data.
-                'keyword_list': None,
-                # User will enter False if they don't want their questions answer checked.
-                'answer_check': False,
-                'saving_location': 'default',
-                'max_benchmark_length': 500,
-            },
-        }
-        cls._domain_benchmark_default_config = {
-            'concepts': [],
-            'branching': False,  # If branching is False, then branching_config is not taken into account
-            'branching_config': cls._branching_default_config,
-            'shared_config': cls._concept_benchmark_default_config,
-            'concept_specified_config': {},
-            'saving': True,  # If saving is False, then saving_location is not taken into account
-            'saving_location': 'default',
-            'database_config': cls._database_default_config,
-        }
-        cls._analytics_config_scheme = {
-            "database_config": cls._database_default_config,
-            "benchmark": None,
-            "generation": {
-                "require": None,
-                "generate_dict": None,
-                "generation_saving_location": None,
-                "generation_list": None,
-            },
-            "extraction": {
-                "feature_extractors": None,
-                'extractor_configs': None,
-                "calibration": None,
-                "extraction_saving_location": None,
-            },
-            "analysis": {
-                "specifications": None,
-                "analyzers": None,
-                "analyzer_configs": None,
-                'statistics_saving_location': None,
-                "disparity_saving_location": None,
-            }
-        }
-        cls._analytics_default_config = {
-            "database_config": cls._database_default_config,
-            "generation": {
-                "require": True,
-                "generate_dict": {},
-                "generation_saving_location": 'data/customized/' + '_' + 'sbg_benchmark.csv',
-                "generation_list": [],
-                "baseline": 'baseline',
-            },
-            "extraction": {
-                "feature_extractors": [
-                    'personality_classification',
-                    'toxicity_classification',
-                    'sentiment_classification',
-                    'stereotype_classification',
-                    'regard_classification'
-                ],
-                'extractor_configs': {},
-                "calibration": True,
-                "extraction_saving_location": 'data/customized/' + '_' + 'sbge_benchmark.csv',
-            },
-            "analysis": {
-                "specifications": ['concept', 'source_tag'],
-                "analyzers": ['mean', 'selection_rate', 'precision'],
-                "analyzer_configs": {
-                    'selection_rate': {'standard_by': 'mean'},
-                    'precision': {'tolerance': 0.1}
-                },
-                'statistics_saving_location': 'data/customized/' + '_' + 'sbgea_statistics.csv',
-                "disparity_saving_location": 'data/customized/' + '_' + 'sbgea_disparity.csv',
-            }
-        }
+        # The schemes and defaults are built once at import time and shared by every call, _update_configuration
+        # builds a new configuration without modifying them.
+        cls._database_config_scheme = _DATABASE_CONFIG_SCHEME
+        cls._database_default_config = _DATABASE_DEFAULT_CONFIG
+        cls._llm_inquiries_config_scheme = _LLM_INQUIRIES_CONFIG_SCHEME
+        cls._llm_inquiries_default_config = _LLM_INQUIRIES_DEFAULT_CONFIG
+        cls._branching_config_scheme = _BRANCHING_CONFIG_SCHEME
+        cls._concept_benchmark_config_scheme = _CONCEPT_BENCHMARK_CONFIG_SCHEME
+        cls._domain_benchmark_config_scheme = _DOMAIN_BENCHMARK_CONFIG_SCHEME
+        cls._branching_default_config = _BRANCHING_DEFAULT_CONFIG
+        cls._concept_benchmark_default_config = _CONCEPT_BENCHMARK_DEFAULT_CONFIG
+        cls._domain_benchmark_default_config = _DOMAIN_BENCHMARK_DEFAULT_CONFIG
+        cls._analytics_config_scheme = _ANALYTICS_CONFIG_SCHEME
+        cls._analytics_default_config = _ANALYTICS_DEFAULT_CONFIG
+        cls._config_initialized = True
+
+    @classmethod
+    def _ensure_config(cls):
+        if not cls._config_initialized:
+            cls._set_config()
 
     @classmethod
     def config_helper(cls):
@@ -283,6 +519,8 @@ class Pipeline:
                 db_path = os.path.join('data', 'customized', 'database', 'saged_app.db')
                 os.makedirs(os.path.dirname(db_path), exist_ok=True)
                 return create_engine(f'sqlite:///{db_path}')
+        elif database_config.get('database_type') == 'sqlite':
+            return create_engine(_get_sqlite_url(database_config.get('database_connection')))
         return None
 
     @classmethod
@@ -291,26 +529,99 @@ class Pipeline:
         prefix = database_config.get('table_prefix', 'saged_')
         return f"{prefix}{name}"
 
+    @classmethod
+    def _get_to_sql_chunksize(cls, df, engine):
+        """Get the number of rows per multi-row INSERT for the given DataFrame"""
+        chunksize = cls._to_sql_chunksize
+        if engine.dialect.name == 'sqlite':
+            # Each row binds one parameter per column, keep the statement under SQLite's limit
+            chunksize = min(chunksize, max(cls._sqlite_max_variables // max(len(df.columns), 1), 1))
+        return chunksize
+
+    @staticmethod
+    def _copy_method(pd_table, conn, keys, data_iter):
+        """DataFrame.to_sql method loading all rows with a single PostgreSQL COPY"""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(data_iter)
+        buffer.seek(0)
+
+        columns = ', '.join(f'"{key}"' for key in keys)
+        table_name = f'"{pd_table.schema}"."{pd_table.name}"' if pd_table.schema else f'"{pd_table.name}"'
+        statement = f'COPY {table_name} ({columns}) FROM STDIN WITH CSV'
+        cursor = conn.connection.cursor()
+        try:
+            if hasattr(cursor, 'copy_expert'):
+                cursor.copy_expert(statement, buffer)
+            else:
+                # psycopg 3
+                with cursor.copy(statement) as copy_stream:
+                    copy_stream.write(buffer.getvalue())
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _duckdb_insert_method(pd_table, conn, keys, data_iter):
+        """DataFrame.to_sql method inserting all rows from a DataFrame registered with DuckDB"""
+        frame = pd.DataFrame(list(data_iter), columns=keys)
+        columns = ', '.join(f'"{key}"' for key in keys)
+        duckdb_connection = conn.connection.driver_connection
+        duckdb_connection.register('_saged_frame', frame)
+        try:
+            duckdb_connection.execute(f'INSERT INTO "{pd_table.name}" ({columns}) SELECT {columns} FROM _saged_frame')
+        finally:
+            duckdb_connection.unregister('_saged_frame')
+
+    @classmethod
+    def _get_to_sql_options(cls, df, engine):
+        """Get the DataFrame.to_sql method and chunksize of the fastest bulk path of the engine's dialect"""
+        if engine.dialect.name == 'postgresql':
+            return {'method': cls._copy_method, 'chunksize': None}
+        if engine.dialect.name == 'duckdb':
+            return {'method': cls._duckdb_insert_method, 'chunksize': None}
+        return {'method': 'multi', 'chunksize': cls._get_to_sql_chunksize(df, engine)}
+
     @classmethod
     def _save_to_database(cls, df, table_name, database_config):
         """Save DataFrame to database"""
+        if database_config.get('use_database') and database_config.get('database_type') == 'parquet':
+            return cls._save_to_parquet(df, table_name, database_config)
+
         engine = cls._get_database_connection(database_config)
         if not engine:
             return False
 
         try:
-            # Save DataFrame directly to table
+            # Save DataFrame directly to table through the dialect's bulk path
             with engine.connect() as conn:
-                df.to_sql(table_name, conn, if_exists='replace', index=False)
+                df.to_sql(table_name, conn, if_exists='replace', index=False, **cls._get_to_sql_options(df, engine))
                 conn.commit()
             return True
         except Exception as e:
             print(f"Error saving to database: {e}")
             return False
 
+    @classmethod
+    def _save_to_parquet(cls, df, table_name, database_config):
+        """Save DataFrame to a Parquet-backed database, one zstd-compressed file per table"""
+        file_path = _get_parquet_path(database_config.get('database_connection'), table_name)
+        try:
+            df.to_parquet(file_path, compression='zstd', engine='pyarrow', index=False)
+            return True
+        except Exception as e:
+            print(f"Error saving to database: {e}")
+            return False
+
     @classmethod
     def _load_from_database(cls, table_name, database_config):
         """Load data from database"""
+        if database_config.get('use_database') and database_config.get('database_type') == 'parquet':
+            try:
+                return pd.read_parquet(_get_parquet_path(database_config.get('database_connection'), table_name),
+                                       engine='pyarrow')
+            except Exception as e:
+                print(f"Error loading from database: {e}")
+                return None
+
         engine = cls._get_database_connection(database_config)
         if not engine:
             return None
@@ -324,17 +635,183 @@ class Pipeline:
             return None
 
     @classmethod
-    def build_concept_benchmark(cls, domain, demographic_label, config=None):
-      
-        cls._set_config()
-        configuration = _update_configuration(
-            cls._concept_benchmark_config_scheme.copy(),
-            cls._concept_benchmark_default_config.copy(),
-            config.copy())
+    def _iter_from_database(cls, table_name, database_config, batch_size=50_000):
+        """Stream data from database as DataFrame chunks of at most batch_size rows
 
-        # Get database configuration
-        database_config = cls.database_config
-        print("database_config", database_config)
+        Like _load_from_database, a table that can't be opened yields nothing. An error once chunks have been
+        yielded is raised, so the caller can't mistake a truncated table for a whole one.
+        """
+        started = False
+        if database_config.get('use_database') and database_config.get('database_type') == 'parquet':
+            try:
+                import pyarrow.parquet as pq
+                parquet_file = pq.ParquetFile(
+                    _get_parquet_path(database_config.get('database_connection'), table_name))
+                for batch in parquet_file.iter_batches(batch_size=batch_size):
+                    started = True
+                    yield batch.to_pandas()
+            except Exception as e:
+                if started:
+                    raise
+                print(f"Error loading from database: {e}")
+            return
+
+        engine = cls._get_database_connection(database_config)
+        if not engine:
+            return
+
+        try:
+            with engine.connect() as conn:
+                # Use a server-side cursor where the driver supports it so only one batch is held in memory
+                conn = conn.execution_options(stream_results=True)
+                query = select(literal_column('*')).select_from(table(table_name))
+                for chunk in pd.read_sql(query, conn, chunksize=batch_size):
+                    started = True
+                    yield chunk
+        except Exception as e:
+            if started:
+                raise
+            print(f"Error loading from database: {e}")
+
+    @classmethod
+    @contextmanager
+    def _db_transaction(cls, database_config):
+        """Yield a connection whose writes are committed together, or None when no database is used"""
+        engine = cls._get_database_connection(database_config)
+        if not engine:
+            yield None
+            return
+
+        with engine.begin() as conn:
+            yield conn
+
+    @classmethod
+    def _get_stage_cache_table(cls, database_config, metadata):
+        """Define the table holding stage outputs keyed by the hash of their configuration and input"""
+        table_name = cls._get_table_name('pipeline_cache', database_config)
+        return Table(
+            table_name, metadata,
+            Column('id', Integer, primary_key=True),
+            Column('stage', String),
+            Column('domain', String),
+            Column('concept', String),
+            Column('cfg_hash', String),
+            Column('data_tier', String),
+            Column('payload', JSON),
+            Column('created_at', DateTime, default=datetime.utcnow),
+            Index(f'ux_{table_name}', 'stage', 'domain', 'concept', 'cfg_hash', unique=True),
+        )
+
+    @classmethod
+    def _run_cached_stage(cls, engine, pending, database_config, stage, domain, concept, data_tier, key_items,
+                          build):
+        """Return build()'s output for a stage, or the cached output of an earlier run with the same key_items
+
+        key_items holds the stage's configuration section followed by the data it consumes. A changed
+        configuration or input hashes to a new key, so stale outputs are never reused. Functions and models in
+        the section are keyed by its 'cache_key', and a stage whose section holds one without a cache_key is not
+        cached. Caching needs a database engine and database_config['stage_cache']. The lookup uses its own
+        short-lived connection and a fresh output is queued on pending rather than written, so no transaction
+        is held open while the stage runs.
+        """
+        if engine is None or pending is None or not database_config.get('stage_cache'):
+            return build()
+
+        # Hash before building, as some stages modify the data they consume
+        try:
+            cfg_hash = _content_hash(key_items, callable_key=key_items[0].get('cache_key'))
+        except TypeError:
+            logger.debug('Stage %s for %s not cached, its configuration holds a function without a cache_key',
+                         stage, concept)
+            return build()
+        cache_table = cls._get_stage_cache_table(database_config, MetaData())
+        key_clause = ((cache_table.c.stage == stage) & (cache_table.c.domain == domain) &
+                      (cache_table.c.concept == concept) & (cache_table.c.cfg_hash == cfg_hash))
+
+        if inspect(engine).has_table(cache_table.name):
+            with engine.connect() as conn:
+                payload = conn.execute(select(cache_table.c.payload).where(key_clause)).scalar()
+            if payload is not None:
+                logger.debug('Stage %s for %s reused from cache', stage, concept)
+                if data_tier in ['split_sentences', 'questions']:
+                    payload = pd.DataFrame(payload)
+                return saged.create_data(domain=domain, concept=concept, data_tier=data_tier, data=payload)
+
+        result = build()
+        if result is None:
+            return result
+        # Snapshot the output, as later stages modify their input in place before the row is written
+        payload = result.data
+        if isinstance(payload, pd.DataFrame):
+            payload = json.loads(payload.to_json(orient='records'))
+        else:
+            payload = copy.deepcopy(payload)
+        pending.cache_rows.append(dict(stage=stage, domain=domain, concept=concept, cfg_hash=cfg_hash,
+                                       data_tier=data_tier, payload=payload))
+        return result
+
+    @classmethod
+    def _queue_save(cls, pending, data, file_path=None):
+        """Save data now when no database transaction is involved, otherwise queue a snapshot of it on pending"""
+        if pending is None:
+            data.save(file_path=file_path)
+        else:
+            # Snapshot, as later stages may modify the data they consume
+            pending.saves.append((copy.deepcopy(data), file_path))
+
+    @classmethod
+    def _apply_pending_writes(cls, database_config, pending):
+        """Write a concept's queued cache rows and saves in one short transaction"""
+        if pending is None or not (pending.saves or pending.cache_rows):
+            return
+
+        with cls._db_transaction(database_config) as conn:
+            if pending.cache_rows:
+                cache_table = cls._get_stage_cache_table(database_config, MetaData())
+                cache_table.create(conn, checkfirst=True)
+                for row in pending.cache_rows:
+                    conn.execute(cache_table.delete().where(
+                        (cache_table.c.stage == row['stage']) & (cache_table.c.domain == row['domain']) &
+                        (cache_table.c.concept == row['concept']) & (cache_table.c.cfg_hash == row['cfg_hash'])))
+                    conn.execute(cache_table.insert().values(**row))
+            for data, file_path in pending.saves:
+                data.save(file_path=file_path, conn=conn)
+
+    @classmethod
+    def build_concept_benchmark(cls, domain, demographic_label, config=None, database_config=None):
+        # Get database configuration, worker processes receive it explicitly as they don't share class state
+        if database_config is None:
+            database_config = cls.database_config
+
+        result, pending = cls._build_concept_benchmark_deferred(domain, demographic_label, config, database_config)
+        cls._apply_pending_writes(database_config, pending)
+        return result
+
+    @classmethod
+    def _build_concept_benchmark_deferred(cls, domain, demographic_label, config, database_config):
+        """Build a concept benchmark without writing to the database
+
+        Returns the benchmark and the database writes it queued, or None for those when no database engine is
+        configured and everything was saved as it was built. The stages run for minutes, so they run without an
+        open connection and the caller applies the writes afterwards in one short transaction.
+        """
+        engine = cls._get_database_connection(database_config)
+        pending = _PendingWrites() if engine is not None else None
+        result = cls._build_concept_benchmark(domain, demographic_label, config, database_config, engine, pending)
+        return result, pending
+
+    @classmethod
+    def _build_concept_benchmark(cls, domain, demographic_label, config, database_config, engine, pending):
+
+        cls._ensure_config()
+        _lazy_import('KeywordFinder', 'SourceFinder', 'Scraper', 'PromptMaker')
+        # Concepts sharing a configuration reuse the merged result instead of re-merging it
+        configuration = _cached_update_configuration(
+            cls._concept_benchmark_config_scheme,
+            cls._concept_benchmark_default_config,
+            config)
+
+        logger.debug("database_config %s", database_config)
 
         # Create initial data
         kw = saged.create_data(domain=domain, concept=demographic_label, data_tier='keywords')
@@ -346,59 +823,41 @@ class Pipeline:
         keyword_finder_require, keyword_finder_reading_location, keyword_finder_method, \
         keyword_finder_keyword_number, keyword_finder_hyperlinks_info, keyword_finder_llm_info, \
         keyword_finder_max_adjustment, keyword_finder_embedding_model, keyword_finder_saving, \
-        keyword_finder_saving_location, keyword_finder_manual_keywords = (
-            keyword_finder_config[key] for key in [
-            'require', 'reading_location', 'method', 'keyword_number', 'hyperlinks_info',
-            'llm_info', 'max_adjustment', 'embedding_model', 'saving', 'saving_location',
-            'manual_keywords'
-        ]
-        )
+        keyword_finder_saving_location, keyword_finder_manual_keywords = _get_keyword_finder_items(keyword_finder_config)
 
         # Unpacking source_finder section
         source_finder_config = configuration['source_finder']
         source_finder_require, source_finder_reading_location, source_finder_method, \
         source_finder_local_file, source_finder_saving, source_finder_saving_location, \
-        source_finder_scrap_area_number, source_finder_scrap_backlinks, source_finder_manual_sources = (
-            source_finder_config[key] for key in [
-            'require', 'reading_location', 'method', 'local_file', 'saving',
-            'saving_location', 'scrape_number', 'scrape_backlinks', 'manual_sources'
-        ]
-        )
+        source_finder_scrap_area_number, source_finder_scrap_backlinks, source_finder_manual_sources = \
+            _get_source_finder_items(source_finder_config)
 
         # Unpacking scraper section
         scraper_config = configuration['scraper']
         scraper_require, scraper_reading_location, scraper_saving, \
-        scraper_method, scraper_saving_location = (
-            scraper_config[key] for key in [
-            'require', 'reading_location', 'saving', 'method', 'saving_location'
-        ]
-        )
+        scraper_method, scraper_saving_location = _get_scraper_items(scraper_config)
 
         # Unpacking prompt_assembler section
         prompt_assembler_config = configuration['prompt_assembler']
         prompt_assembler_require, prompt_assembler_method, prompt_assembler_generation_function, \
         prompt_assembler_keyword_list, prompt_assembler_answer_check, prompt_assembler_saving_location, \
-        prompt_assembler_max_sample_number = (
-            prompt_assembler_config[key] for key in [
-            'require', 'method', 'generation_function', 'keyword_list', 'answer_check',
-            'saving_location', 'max_benchmark_length'
-        ]
-        )
+        prompt_assembler_max_sample_number = _get_prompt_assembler_items(prompt_assembler_config)
 
         # check the validity of the configuration
-        assert keyword_finder_method in ['embedding_on_wiki', 'llm_inquiries',
-                                         'hyperlinks_on_wiki'], "Invalid keyword finder method. Choose either 'embedding_on_wiki', 'llm_inquiries', or 'hyperlinks_on_wiki'."
+        if keyword_finder_method not in _VALID_KEYWORD_FINDER_METHODS:
+            raise ValueError("Invalid keyword finder method. Choose either 'embedding_on_wiki', 'llm_inquiries', or 'hyperlinks_on_wiki'.")
         if keyword_finder_method == 'llm_inquiries':
-            assert 'generation_function' in keyword_finder_llm_info and keyword_finder_llm_info[
-                'generation_function'] is not None, "generation function must be provided if llm_inquiries is chosen as the method"
+            if keyword_finder_llm_info.get('generation_function') is None:
+                raise ValueError("generation function must be provided if llm_inquiries is chosen as the method")
             check_generation_function(keyword_finder_llm_info['generation_function'])
-        assert source_finder_method in ['wiki',
-                                        'local_files'], "Invalid scrap area finder method. Choose either 'wiki' or 'local_files'"
-        assert scraper_method in ['wiki',
-                                  'local_files'], "Invalid scraper method. Choose either 'wiki' or 'local_files'"
-        assert source_finder_method == scraper_method, "source_finder_finder and scraper methods must be the same"
-        assert prompt_assembler_method in ['split_sentences',
-                                       'questions'], "Invalid prompt maker method. Choose 'split_sentences' or 'questions'"
+        if source_finder_method not in _VALID_SOURCE_FINDER_METHODS:
+            raise ValueError("Invalid scrap area finder method. Choose either 'wiki' or 'local_files'")
+        if scraper_method not in _VALID_SCRAPER_METHODS:
+            raise ValueError("Invalid scraper method. Choose either 'wiki' or 'local_files'")
+        if source_finder_method != scraper_method:
+            raise ValueError("source_finder_finder and scraper methods must be the same")
+        if prompt_assembler_method not in _VALID_PROMPT_ASSEMBLER_METHODS:
+            raise ValueError("Invalid prompt maker method. Choose 'split_sentences' or 'questions'")
 
         '''
         # make sure only the required loading is done
@@ -410,50 +869,52 @@ class Pipeline:
         '''
 
         if keyword_finder_require:
-            if keyword_finder_method == 'embedding_on_wiki':
-                kw = KeywordFinder(domain=domain, concept=demographic_label).wiki_embeddings(
-                    n_keywords=keyword_finder_keyword_number, embedding_model=keyword_finder_embedding_model,
-                    max_adjustment=keyword_finder_max_adjustment).add(
-                    keyword=demographic_label)
-            elif keyword_finder_method == 'llm_inquiries':
-                # Get default values from configuration
-                default_values = _update_configuration(
-                    cls._llm_inquiries_config_scheme.copy(),
-                    cls._llm_inquiries_default_config.copy(),
-                    keyword_finder_llm_info.copy()
-                )
-
-                kw = KeywordFinder(domain=domain, concept=demographic_label).lm_inquiries(
-                    **default_values).add(
-                    keyword=demographic_label)
-            
+            def _find_keywords():
+                if keyword_finder_method == 'embedding_on_wiki':
+                    return KeywordFinder(domain=domain, concept=demographic_label).wiki_embeddings(
+                        n_keywords=keyword_finder_keyword_number, embedding_model=keyword_finder_embedding_model,
+                        max_adjustment=keyword_finder_max_adjustment, scorer=_cosine_topk).add(
+                        keyword=demographic_label)
+                elif keyword_finder_method == 'llm_inquiries':
+                    # Get default values from configuration
+                    default_values = _cached_update_configuration(
+                        cls._llm_inquiries_config_scheme,
+                        cls._llm_inquiries_default_config,
+                        keyword_finder_llm_info
+                    )
+
+                    return KeywordFinder(domain=domain, concept=demographic_label).lm_inquiries(
+                        **default_values).add(
+                        keyword=demographic_label)
+                return kw
+
+            kw = cls._run_cached_stage(engine, pending, database_config, 'keyword_finder', domain,
+                                       demographic_label, 'keywords', [keyword_finder_config], _find_keywords)
             kw.use_database = database_config['use_database']
             kw.database_config = database_config
 
             # if manual keywords are provided, add them to the keyword finder
             if isinstance(keyword_finder_manual_keywords, list):
-                for keyword in keyword_finder_manual_keywords:
-                    kw = kw.add(keyword)
+                kw = kw.extend(keyword_finder_manual_keywords)
 
             if keyword_finder_saving:
                 if keyword_finder_saving_location == 'default':
-                    kw.save()
+                    cls._queue_save(pending, kw)
                 else:
-                    kw.save(file_path=keyword_finder_saving_location)
+                    cls._queue_save(pending, kw, file_path=keyword_finder_saving_location)
 
         elif (not keyword_finder_require) and isinstance(keyword_finder_manual_keywords, list):
             kw = saged.create_data(domain=domain, concept=demographic_label, data_tier='keywords')
             kw.use_database = database_config['use_database']
             kw.database_config = database_config
-            for keyword in keyword_finder_manual_keywords:
-                kw = kw.add(keyword)
+            kw = kw.extend(keyword_finder_manual_keywords)
             
             # Add saving logic for manual keywords
             if keyword_finder_saving:
                 if keyword_finder_saving_location == 'default':
-                    kw.save()
+                    cls._queue_save(pending, kw)
                 else:
-                    kw.save(file_path=keyword_finder_saving_location)
+                    cls._queue_save(pending, kw, file_path=keyword_finder_saving_location)
 
         elif source_finder_require and (keyword_finder_manual_keywords is None):
             filePath = ""
@@ -469,29 +930,34 @@ class Pipeline:
                 
 
             if kw != None:
-                print(f'Keywords loaded from {filePath}')
+                logger.debug('Keywords loaded from %s', filePath)
             else:
                 raise ValueError(f"Unable to read keywords from {filePath}. Can't scrape area.")
 
         if source_finder_require:
-            if source_finder_method == 'wiki':
-                sa = SourceFinder(kw, source_tag='wiki').wiki(
-                    top_n=source_finder_scrap_area_number, scrape_backlinks=source_finder_scrap_backlinks)
-            elif source_finder_method == 'local_files':
-                if source_finder_local_file == None and len(source_finder_manual_sources) == 0:
-                    raise ValueError(f"Unable to read sources, because neither local_file nor manual_sources are provided. Can't scrape area.")
-                sa = SourceFinder(kw, source_tag='local').local(
-                    source_finder_local_file, 
-                    direct_path_list=source_finder_manual_sources
-                )
-            print('...Sources for Scraping located...')
+            def _find_sources():
+                if source_finder_method == 'wiki':
+                    return SourceFinder(kw, source_tag='wiki').wiki(
+                        top_n=source_finder_scrap_area_number, scrape_backlinks=source_finder_scrap_backlinks)
+                elif source_finder_method == 'local_files':
+                    if source_finder_local_file == None and len(source_finder_manual_sources) == 0:
+                        raise ValueError(f"Unable to read sources, because neither local_file nor manual_sources are provided. Can't scrape area.")
+                    return SourceFinder(kw, source_tag='local').local(
+                        source_finder_local_file, 
+                        direct_path_list=source_finder_manual_sources
+                    )
+
+            sa = cls._run_cached_stage(engine, pending, database_config, 'source_finder', domain,
+                                       demographic_label, 'source_finder', [source_finder_config, kw.data],
+                                       _find_sources)
+            logger.debug('Sources for scraping located')
 
  
 
             if source_finder_saving:
                 sa.use_database = database_config['use_database']
                 sa.database_config = database_config
-                sa.save(file_path=source_finder_saving_location)
+                cls._queue_save(pending, sa, file_path=source_finder_saving_location)
         elif scraper_require:
             filePath = ""
             if source_finder_reading_location == 'default':
@@ -505,7 +971,7 @@ class Pipeline:
                                      file_path=source_finder_reading_location, data_tier='source_finder')
 
             if sa != None:
-                print(f'...Source info loaded from {filePath}...')
+                logger.debug('Source info loaded from %s', filePath)
             else:
                 raise ValueError(f"Unable to load Source info from {filePath}. Can't use scraper.")
 
@@ -513,23 +979,30 @@ class Pipeline:
             sa.database_config = database_config
 
         if scraper_require:
-            if scraper_method == 'wiki':
-                sc = Scraper(sa).scrape_in_page_for_wiki_with_buffer_files()
-            elif scraper_method == 'local_files':
-                sc = Scraper(sa).scrape_local_with_buffer_files(
-                    use_database=database_config['use_database'],
-                    database_config=database_config
-                )
-            print('Scraped sentences completed.')
+            def _scrape():
+                if scraper_method == 'wiki':
+                    if _can_run_async():
+                        return asyncio.run(Scraper(sa).scrape_in_page_for_wiki_async())
+                    return Scraper(sa).scrape_in_page_for_wiki_with_buffer_files()
+                elif scraper_method == 'local_files':
+                    return Scraper(sa).scrape_local_with_buffer_files(
+                        use_database=database_config['use_database'],
+                        database_config=database_config,
+                        max_workers=scraper_config['max_workers'] or 1
+                    )
+
+            sc = cls._run_cached_stage(engine, pending, database_config, 'scraper', domain, demographic_label,
+                                       'scraped_sentences', [scraper_config, sa.data], _scrape)
+            logger.debug('Scraped sentences completed')
 
             sc.use_database = database_config['use_database']
             sc.database_config = database_config
 
             if scraper_saving:
                 if scraper_saving_location == 'default':
-                    sc.save()
+                    cls._queue_save(pending, sc)
                 else:
-                    sc.save(file_path=scraper_saving_location)
+                    cls._queue_save(pending, sc, file_path=scraper_saving_location)
         elif prompt_assembler_require:
             filePath = ""
             if scraper_reading_location == 'default':
@@ -537,32 +1010,34 @@ class Pipeline:
                 sc = saged.load_file(domain=domain, concept=demographic_label,
                                      file_path=filePath,
                                      data_tier='scraped_sentences')
-                print(
-                    f'Scraped sentences loaded from data/customized/scraped_sentences/{domain}_{demographic_label}_scraped_sentences.json')
             else:
                 filePath = scraper_reading_location
                 sc = saged.load_file(domain=domain, concept=demographic_label, file_path=scraper_reading_location,
                                      data_tier='scraped_sentences')
-                print(f'Scraped sentences loaded from {scraper_reading_location}')
 
             if sc != None:
-                print(f'Scraped loaded from {filePath}')
+                logger.debug('Scraped sentences loaded from %s', filePath)
             else:
                 raise ValueError(f"Unable to load scraped sentences from {filePath}. Can't make prompts.")
             sc.use_database = database_config['use_database']
             sc.database_config = database_config
 
         if prompt_assembler_require:
-            pm_result = None
-            if prompt_assembler_method == 'split_sentences':
-                pm = PromptMaker(sc)
-                pm_result = pm.split_sentences()
-            elif prompt_assembler_method == 'questions':
-                pm = PromptMaker(sc)
-                pm_result = pm.make_questions(generation_function=prompt_assembler_generation_function,
-                                              keyword_reference=prompt_assembler_keyword_list,
-                                              answer_check=prompt_assembler_answer_check,
-                                              max_questions=prompt_assembler_max_sample_number)
+            def _assemble_prompts():
+                if prompt_assembler_method == 'split_sentences':
+                    pm = PromptMaker(sc)
+                    return pm.split_sentences()
+                elif prompt_assembler_method == 'questions':
+                    pm = PromptMaker(sc)
+                    return pm.make_questions(generation_function=prompt_assembler_generation_function,
+                                             keyword_reference=prompt_assembler_keyword_list,
+                                             answer_check=prompt_assembler_answer_check,
+                                             max_questions=prompt_assembler_max_sample_number)
+
+            pm_result = cls._run_cached_stage(engine, pending, database_config, 'prompt_assembler', domain,
+                                              demographic_label, prompt_assembler_method,
+                                              [prompt_assembler_config, sc.data],
+                                              _assemble_prompts)
             if pm_result is None:
                 raise ValueError(f"Unable to make prompts out of no scraped sentences")
             pm_result = pm_result.sub_sample(prompt_assembler_max_sample_number, floor=True,
@@ -570,77 +1045,83 @@ class Pipeline:
             pm_result.use_database = database_config['use_database']
             pm_result.database_config = database_config
             if prompt_assembler_saving_location == 'default':
-                pm_result.save()
+                cls._queue_save(pending, pm_result)
             else:
-                pm_result.save(file_path=prompt_assembler_saving_location)
+                cls._queue_save(pending, pm_result, file_path=prompt_assembler_saving_location)
 
-            print(f'Benchmark building for {demographic_label} completed.')
-            print('\n=====================================================\n')
+            tqdm.write(f'Benchmark building for {demographic_label} completed.')
 
             return pm_result
         else:
-            print(f'Required data for {demographic_label} completed.')
-            print('\n=====================================================\n')
+            tqdm.write(f'Required data for {demographic_label} completed.')
             return None
 
     @classmethod
     def build_benchmark(cls, domain, config=None):
-        def _merge_concept_specified_configuration(domain_configuration):
-
-            def _simple_update_configuration(default_configuration, updated_configuration):
-                """
-                Update the default configuration dictionary with the values from the updated configuration
-                only if the keys already exist in the default configuration.
-
-                Args:
-                - default_concept_configuration (dict): The default configuration dictionary.
-                - updated_configuration (dict): The updated configuration dictionary with new values.
-
-                Returns:
-                - dict: The updated configuration dictionary.
-                """
-
-                for key, value in updated_configuration.items():
-                    if key in default_configuration.copy():
-                        # print(f"Updating {key} recursively")
-                        if isinstance(default_configuration[key], dict) and isinstance(value, dict):
-                            # Recursively update nested dictionaries
-                            default_configuration[key] = _simple_update_configuration(default_configuration[key].copy(),
-                                                                                      value)
-                        else:
-                            # print(f"Skipping key: {key} due to type mismatch")
-                            # Update the value for the key
-                            default_configuration[key] = value
-                return default_configuration
-
-            specified_config = domain_configuration['concept_specified_config'].copy()
-            domain_configuration = _simple_update_configuration(Pipeline._domain_benchmark_default_config.copy(),
-                                                                domain_configuration)
-            domain_configuration['shared_config'] = _simple_update_configuration(
-                Pipeline._concept_benchmark_default_config .copy(), domain_configuration['shared_config'].copy())
-
-            base_concept_config = {}
+        def _simple_update_configuration(default_configuration, updated_configuration):
+            """
+            Update the default configuration dictionary with the values from the updated configuration
+            only if the keys already exist in the default configuration. The default configuration is left
+            untouched: each nested dictionary is copied once along the keys being overridden, so untouched
+            branches stay shared with the input.
+
+            Args:
+            - default_configuration (dict): The default configuration dictionary.
+            - updated_configuration (dict): The updated configuration dictionary with new values.
+
+            Returns:
+            - dict: The updated configuration dictionary.
+            """
+
+            merged_configuration = dict(default_configuration)
+            for key, value in updated_configuration.items():
+                if key in merged_configuration:
+                    if isinstance(merged_configuration[key], dict) and isinstance(value, dict):
+                        # Recursively update nested dictionaries
+                        merged_configuration[key] = _simple_update_configuration(merged_configuration[key], value)
+                    else:
+                        # Update the value for the key
+                        merged_configuration[key] = value
+            return merged_configuration
+
+        def _iter_concept_specified_configuration(domain_configuration):
+            """
+            Yield (concept, configuration) pairs, merging each concept's specified overrides into the
+            shared configuration lazily. Concepts without overrides all receive the same shared configuration.
+            """
+            specified_config = domain_configuration.get('concept_specified_config') or {}
+            # Merging copies just the dictionaries it touches, build_concept_benchmark copies the rest
+            shared_config = _simple_update_configuration(
+                Pipeline._concept_benchmark_default_config,
+                domain_configuration.get('shared_config') or {})
+
             for concept in domain_configuration['concepts']:
-                base_concept_config[concept] = domain_configuration['shared_config'].copy()
+                if specified_config.get(concept):
+                    yield concept, _simple_update_configuration(shared_config, specified_config[concept])
+                else:
+                    yield concept, shared_config
 
-            # print('start ====================== \n\n')
-            merge_concept_config = _simple_update_configuration(base_concept_config.copy(), specified_config.copy())
-            # print(merge_concept_config)
-            return merge_concept_config
+        def _estimate_concept_cost(concept_configuration):
+            """Rough size of a concept's build: the keywords it searches for times the sources it scrapes."""
+            keyword_finder = concept_configuration.get('keyword_finder') or {}
+            source_finder = concept_configuration.get('source_finder') or {}
+            keywords = (keyword_finder.get('keyword_number') or 0) + len(keyword_finder.get('manual_keywords') or [])
+            sources = (source_finder.get('scrape_number') or 0) + len(source_finder.get('manual_sources') or [])
+            return max(keywords, 1) * max(sources, 1)
 
-        cls._set_config()
+        cls._ensure_config()
         concept_list = config['concepts']
-        concept_specified_configuration = _merge_concept_specified_configuration(config.copy())
-        configuration = _update_configuration(
-            cls._domain_benchmark_config_scheme.copy(),
-            cls._domain_benchmark_default_config.copy(),
-            config.copy())
+        # Sweeps that rebuild with the same options reuse the merged configurations
+        configuration = _cached_update_configuration(
+            cls._domain_benchmark_config_scheme,
+            cls._domain_benchmark_default_config,
+            config)
 
         # Get database configuration
-        cls.database_config = _update_configuration(
-            cls._database_config_scheme.copy(),
-            cls._database_default_config.copy(),
-            config.copy().get('database_config', {}))
+        cls.database_config = _cached_update_configuration(
+            cls._database_config_scheme,
+            cls._database_default_config,
+            config.get('database_config', {}))
         
         database_config = cls.database_config
 
@@ -656,20 +1137,67 @@ class Pipeline:
         domain_benchmark.database_config = database_config
         
         print(f"\nBuilding benchmarks for {len(concept_list)} concepts...")
-        for concept in tqdm(concept_list, desc="Building concept benchmarks"):
-            cat_result = cls.build_concept_benchmark(domain, concept, concept_specified_configuration[concept])
-            print(f'Benchmark building for {concept} completed.')
-            domain_benchmark = saged.merge(domain, [domain_benchmark, cat_result], concept='branched')
-            domain_benchmark.use_database = database_config['use_database']
-            domain_benchmark.database_config = database_config
-
-            if configuration['saving']:
-                if configuration['saving_location'] == 'default':
-                    domain_benchmark.save()
-                else:
-                    domain_benchmark.save(file_path=configuration['saving_location'])
+        max_workers = configuration['max_workers'] or 1
+        if max_workers > 1:
+            # Submit the largest concepts first so a big one doesn't start last and hold up the pool
+            concept_configs = sorted(_iter_concept_specified_configuration(config),
+                                     key=lambda item: _estimate_concept_cost(item[1]), reverse=True)
+            # Configurations are pickled to reach the workers, which lambdas, closures and some models don't
+            # survive. Find out before submitting rather than failing partway through the build
+            try:
+                pickle.dumps(concept_configs)
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                logger.warning("Building the concepts sequentially, their configuration can't be sent to worker "
+                               "processes: %s", e)
+                max_workers = 1
+        if max_workers > 1:
+            # Workers only build and return their queued writes, the parent applies them one concept at a time so
+            # the processes never contend for the database's write lock
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(cls._build_concept_benchmark_deferred, domain, concept, concept_config,
+                                    database_config): concept
+                    for concept, concept_config in concept_configs
+                }
+                concept_results = {}
+                for future in tqdm(as_completed(futures), total=len(futures), desc=f"Building {domain}",
+                                   mininterval=0.5):
+                    result, pending = future.result()
+                    cls._apply_pending_writes(database_config, pending)
+                    concept_results[futures[future]] = result
+            # Merge in the configured concept order so the benchmark doesn't depend on completion order
+            concept_results = ((concept, concept_results[concept]) for concept in concept_list)
+        else:
+            concept_results = (
+                (concept, cls.build_concept_benchmark(domain, concept, concept_config))
+                for concept, concept_config in tqdm(_iter_concept_specified_configuration(config),
+                                                    total=len(concept_list), desc=f"Building {domain}",
+                                                    mininterval=0.5)
+            )
+
+        def _save_domain_benchmark(benchmark):
+            benchmark.use_database = database_config['use_database']
+            benchmark.database_config = database_config
+            if configuration['saving_location'] == 'default':
+                benchmark.save()
+            else:
+                benchmark.save(file_path=configuration['saving_location'])
+
+        # Collect the concept benchmarks and merge them once, instead of re-merging the growing benchmark
+        cat_results = [domain_benchmark]
+        checkpoint_interval = (configuration['checkpoint_interval'] or 0) if configuration['saving'] else 0
+        for built, (concept, cat_result) in enumerate(concept_results, 1):
+            logger.info('Benchmark building for %s completed.', concept)
+            cat_results.append(cat_result)
+            if checkpoint_interval and built % checkpoint_interval == 0:
+                _save_domain_benchmark(saged.merge(domain, cat_results, concept='branched'))
+
+        domain_benchmark = saged.merge(domain, cat_results, concept='branched')
+        domain_benchmark.use_database = database_config['use_database']
+        domain_benchmark.database_config = database_config
 
         if configuration['branching']:
+            _lazy_import('PromptMaker')
             empty_ss = saged.create_data(concept='branched', domain=domain, data_tier='scraped_sentences')
             empty_ss.use_database = database_config['use_database']
             empty_ss.database_config = database_config
@@ -680,69 +1208,155 @@ class Pipeline:
             domain_benchmark.database_config = database_config
             # Use the existing data_tier variable
             domain_benchmark.data_tier = data_tier
-            if configuration['saving']:
-                if configuration['saving_location'] == 'default':
-                    domain_benchmark.save()
-                else:
-                    domain_benchmark.save(file_path=configuration['saving_location'])
+
+        # The finished benchmark is persisted exactly once
+        if configuration['saving']:
+            _save_domain_benchmark(domain_benchmark)
 
         return domain_benchmark
 
+    @classmethod
+    def _extract_features_concurrently(cls, fe, extractors, max_workers):
+        """Run column feature extractors in threads, each on its own copy of fe's benchmark, and join their columns
+
+        Nothing is shared between the threads: every worker holds a full copy of the benchmark, and each
+        classification method builds its own model pipeline when called. Up to max_workers models and benchmark
+        copies are therefore in memory at once. The gain comes from model inference releasing the GIL.
+        """
+        base = fe.benchmark
+
+        def _extract(x, extractor_config):
+            worker = FeatureExtractor(base.copy(), generations=fe.generations, calibration=fe.calibration,
+                                      baseline=fe.baseline, embedding_model=fe.embedding_model)
+            return worker, getattr(worker, x)(**extractor_config)
+
+        # Results are keyed by position, as the same extractor may be listed with different configurations
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_extract, x, extractor_config): (position, x)
+                       for position, (x, extractor_config) in enumerate(extractors)}
+            for future in as_completed(futures):
+                position, x = futures[future]
+                try:
+                    results[position] = future.result()
+                except _RECOVERABLE_METHOD_ERRORS:
+                    logger.exception("Error calling method %s", x)
+
+        # Join in the configured order so columns and feature lists don't depend on completion order
+        frames = [base]
+        seen_columns = set(base.columns)
+        for position, (x, _) in enumerate(extractors):
+            if position not in results:
+                continue
+            worker, df = results[position]
+            # The columns are joined by position, the same one-to-one check a validated merge would make
+            if not df.index.equals(base.index):
+                logger.warning("Skipping %s, its rows don't line up with the benchmark (duplicated labels: %s)",
+                               x, df.index[df.index.duplicated()].unique().tolist()[:10])
+                continue
+            new_columns = [column for column in df.columns if column not in seen_columns]
+            seen_columns.update(new_columns)
+            frames.append(df[new_columns])
+            fe.classification_features.extend(worker.classification_features)
+            fe.cluster_features.extend(worker.cluster_features)
+            fe.calibrated_features.extend(worker.calibrated_features)
+
+        fe.benchmark = pd.concat(frames, axis=1)
+        return fe.benchmark
+
     @classmethod
     def run_benchmark(cls, config, domain='unspecified'):
-        cls._set_config()
+        cls._ensure_config()
+        _lazy_import('ResponseGenerator', 'FeatureExtractor', 'Analyzer')
+        # Not memoized: the benchmark frame and generation functions would be keyed by identity, so each new
+        # benchmark would miss and the cache would keep up to maxsize of them alive
         configuration = _update_configuration(
-            cls._analytics_config_scheme.copy(),
-            cls._analytics_default_config.copy(),
-            config.copy())
+            cls._analytics_config_scheme,
+            cls._analytics_default_config,
+            config)
 
         # Get database configuration
-        database_config = _update_configuration(
-            cls._database_config_scheme.copy(),
-            cls._database_default_config.copy(),
+        database_config = _cached_update_configuration(
+            cls._database_config_scheme,
+            cls._database_default_config,
             config.get('database_config', {}))
 
         def save_to_database_or_file(df, location, suffix=None):
             """Save data to either database or file based on configuration"""
+            table_name, location = _suffixed_location(location, suffix)
             if database_config['use_database']:
-                table_name = location.replace('.csv', '')
-                if suffix:
-                    table_name = f"{table_name}_{suffix}"
                 table_name = cls._get_table_name(table_name, database_config)
                 return cls._save_to_database(df, table_name, database_config)
+            elif location.lower().endswith('.parquet'):
+                df.to_parquet(location, index=False, compression='zstd')
+                print(f"Data saved to {location}")
+                return True
             else:
-                if suffix:
-                    location = location.replace('.csv', f'_{suffix}.csv')
                 df.to_csv(location, index=False)
                 print(f"Data saved to {location}")
                 return True
 
         if configuration['generation']['require']:
             gen = ResponseGenerator(configuration['benchmark'])
+            cache_location = configuration['generation']['cache_location']
+            if cache_location:
+                os.makedirs(cache_location, exist_ok=True)
+                prompts_hash = hashlib.blake2b(
+                    pd.util.hash_pandas_object(gen.benchmark['prompts'], index=False).values.tobytes()).hexdigest()
 
+            cache_keys = configuration['generation']['cache_keys'] or {}
             for name, gf in configuration['generation']['generate_dict'].items():
+                cache_path = None
+                # A function can't be told apart from another closure or lambda of the same name, so only
+                # generations given an explicit cache key are cached
+                if cache_location and cache_keys.get(name):
+                    key = _content_hash({'prompts': prompts_hash, 'generation_name': name,
+                                         'cache_key': cache_keys[name]})
+                    cache_path = os.path.join(cache_location, f'{key}.parquet')
+                    if os.path.exists(cache_path):
+                        logger.info("Generation %s reused from %s", name, cache_path)
+                        gen.benchmark[name] = pd.read_parquet(cache_path)[name].values
+                        continue
                 gen.generate(gf, generation_name=name, save_path=configuration['generation']['generation_saving_location'])
+                if cache_path:
+                    gen.benchmark[[name]].to_parquet(cache_path, index=False, compression='zstd')
             sbg_benchmark = gen.benchmark.copy()
             save_to_database_or_file(sbg_benchmark, configuration['generation']['generation_saving_location'])
 
-            generation_list = list(configuration['generation']['generate_dict'].keys())
-            glb = ['baseline'] + generation_list.copy()
+            generation_list = list(configuration['generation']['generate_dict'])
+            glb = ['baseline', *generation_list]
         else:
             sbg_benchmark = configuration['benchmark']
             generation_list = configuration['generation']['generation_list']
-            glb = ['baseline'] + generation_list
+            glb = ['baseline', *generation_list]
 
         fe = FeatureExtractor(sbg_benchmark, generations=glb, calibration=configuration['extraction']['calibration'])
 
+        # Resolve each extractor's configuration once
+        extractor_configs = configuration['extraction']['extractor_configs']
+        resolved_extractors = [(x, extractor_configs.get(x, {}))
+                               for x in configuration['extraction']['feature_extractors']]
+
         sbge_benchmark = pd.DataFrame()
-        for x in configuration['extraction']['feature_extractors']:
+        max_workers = configuration['extraction']['max_workers'] or 1
+        column_extractors = [(x, extractor_config) for x, extractor_config in resolved_extractors
+                             if x in _COLUMN_FEATURE_EXTRACTORS]
+        if max_workers > 1 and len(column_extractors) > 1:
+            # The column extractors run first and concurrently, the others then run in order on their output
+            sbge_benchmark = cls._extract_features_concurrently(fe, column_extractors, max_workers)
+            resolved_extractors = [(x, extractor_config) for x, extractor_config in resolved_extractors
+                                   if x not in _COLUMN_FEATURE_EXTRACTORS]
+
+        # Extractors add their columns to fe.benchmark and return it, so the last output holds every feature
+        for x, extractor_config in resolved_extractors:
+            method_to_call = getattr(fe, x, None)
+            if method_to_call is None:
+                logger.warning("Method %s does not exist", x)
+                continue
             try:
-                method_to_call = getattr(fe, x)
-                sbge_benchmark = method_to_call(**configuration['extraction']['extractor_configs'].get(x, {}))
-            except AttributeError as e:
-                print(f"Method {x} does not exist: {e}")
-            except Exception as e:
-                print(f"Error calling method {x}: {e}")
+                sbge_benchmark = method_to_call(**extractor_config)
+            except _RECOVERABLE_METHOD_ERRORS:
+                logger.exception("Error calling method %s", x)
         save_to_database_or_file(sbge_benchmark, configuration['extraction']['extraction_saving_location'])
         raw_features = fe.classification_features + fe.cluster_features
         calibrated_features = fe.calibrated_features
@@ -750,33 +1364,52 @@ class Pipeline:
         # print(raw_features)
         # print(calibrated_features)
 
-        anas: list[Analyzer] = []
-        anas.append(Analyzer(sbge_benchmark.copy(), features=raw_features, generations=glb))
-        if configuration['extraction']['calibration']:
-            anas.append(
-                Analyzer(sbge_benchmark.copy(), features=calibrated_features, generations=generation_list))
-
-        for k, ana in enumerate(anas):
-            ana.specifications = configuration['analysis']['specifications']
-            for x in configuration['analysis']['analyzers']:
-                try:
-                    method_to_call = getattr(ana, x)
-                    sbgea_benchmark = method_to_call(test=False, **configuration['analysis']['analyzer_configs'].get(x, {}))
-                    sbgea_benchmark = ana.summary_df_dict[x]
-                    if k == 0:
-                        save_to_database_or_file(sbgea_benchmark, configuration['analysis']['statistics_saving_location'], x)
-                    elif k == 1:
-                        save_to_database_or_file(sbgea_benchmark, configuration['analysis']['statistics_saving_location'], f'calibrated_{x}')
-                except AttributeError as e:
-                    print(f"Method {x} does not exist: {e}")
-                except Exception as e:
-                    print(f"Error calling method {x}: {e}")
-
-            ana.statistics_disparity()
-            df = ana.disparity_df
-            if k == 0:
-                save_to_database_or_file(df, configuration['analysis']['disparity_saving_location'])
-            elif k == 1:
-                save_to_database_or_file(df, configuration['analysis']['disparity_saving_location'], 'calibrated')
+        # The raw analyzer comes first and the calibrated one second, None stands for an analysis with nothing
+        # to analyze. Analyzers don't modify the benchmark they are given, so both share sbge_benchmark
+        anas: list[Analyzer] = [None, None]
+        if raw_features:
+            anas[0] = Analyzer(sbge_benchmark, features=raw_features, generations=glb)
+        else:
+            logger.warning('No features were extracted, skipping the analysis of raw features')
+        if configuration['extraction']['calibration'] and calibrated_features:
+            anas[1] = Analyzer(sbge_benchmark, features=calibrated_features, generations=generation_list)
+        elif configuration['extraction']['calibration']:
+            logger.warning('No calibrated features were extracted, skipping the calibrated analysis')
+
+        # Resolve the analysis settings once rather than per analyzer and method
+        analyzer_configs = configuration['analysis']['analyzer_configs']
+        resolved_analyzers = [(x, analyzer_configs.get(x, {})) for x in configuration['analysis']['analyzers']]
+        specifications = configuration['analysis']['specifications']
+        statistics_saving_location = configuration['analysis']['statistics_saving_location']
+        disparity_saving_location = configuration['analysis']['disparity_saving_location']
+
+        # The analyzer outputs are written together once every analyzer has run
+        with _BulkSink(cls, database_config) as sink:
+            for k, ana in enumerate(anas):
+                if ana is None:
+                    continue
+                ana.specifications = specifications
+                for x, analyzer_config in resolved_analyzers:
+                    method_to_call = getattr(ana, x, None)
+                    if method_to_call is None:
+                        logger.warning("Method %s does not exist", x)
+                        continue
+                    try:
+                        # Statistics methods return the diagnoser for chaining, the summary lives in summary_df_dict
+                        method_to_call(test=False, **analyzer_config)
+                        summary_df = ana.summary_df_dict[x]
+                        if k == 0:
+                            sink.add(summary_df, statistics_saving_location, x)
+                        elif k == 1:
+                            sink.add(summary_df, statistics_saving_location, f'calibrated_{x}')
+                    except _RECOVERABLE_METHOD_ERRORS:
+                        logger.exception("Error calling method %s", x)
+
+                ana.statistics_disparity()
+                df = ana.disparity_df
+                if k == 0:
+                    sink.add(df, disparity_saving_location)
+                elif k == 1:
+                    sink.add(df, disparity_saving_location, 'calibrated')
         
         return sbge_benchmark
\ No newline at end of file
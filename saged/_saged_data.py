@@ -5,8 +5,9 @@ from tqdm import tqdm
 from collections import defaultdict
 import sqlite3
 import sqlalchemy
-from sqlalchemy import create_engine, text, Table, Column, Integer, String, JSON, MetaData, DateTime
+from sqlalchemy import create_engine, text, select, Table, Column, Index, Integer, String, JSON, MetaData, DateTime
 from datetime import datetime
+from ._utility import _get_sqlite_url, _get_parquet_path
 
 tqdm.pandas()
 
@@ -53,62 +54,108 @@ class SAGEDData:
         if not self.use_database:
             raise Exception("Database usage is required but not enabled")
             
-        if self.database_config.get('database_type') == 'sql':
-            if 'database_connection' in self.database_config:
-                engine = create_engine(self.database_config['database_connection'])
-                # Test connection
-                try:
-                    with engine.connect() as conn:
-                        conn.execute(text("SELECT 1"))
-                    return engine
-                except Exception as e:
-                    raise Exception(f"Failed to connect to database: {str(e)}")
+        database_type = self.database_config.get('database_type')
+        if database_type in ('sql', 'sqlite'):
+            if database_type == 'sqlite':
+                database_connection = _get_sqlite_url(self.database_config.get('database_connection'))
+            elif 'database_connection' in self.database_config:
+                database_connection = self.database_config['database_connection']
             else:
                 raise Exception("Database connection string is not provided in configuration")
+            engine = create_engine(database_connection)
+            # Test connection
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                return engine
+            except Exception as e:
+                raise Exception(f"Failed to connect to database: {str(e)}")
         else:
-            raise Exception(f"Unsupported database type: {self.database_config.get('database_type')}")
+            raise Exception(f"Unsupported database type: {database_type}")
 
     def _get_table_name(self):
         return f"{self.domain}_{self.concept}_{self.data_tier}"
 
-    def _save_to_database(self, engine, table_name):
-        """Save data to database based on data tier type"""
-        if not engine:
-            return
+    @staticmethod
+    def _get_json_table(table_name, metadata):
+        """Table holding JSON-like data tiers, one JSON document per (domain, concept, data_tier)"""
+        return Table(
+            table_name,
+            metadata,
+            Column('id', Integer, primary_key=True),
+            Column('domain', String),
+            Column('concept', String),
+            Column('data_tier', String),
+            Column('data', JSON),
+            Index(f'ix_{table_name}_domain_concept_data_tier', 'domain', 'concept', 'data_tier')
+        )
+
+    def _save_to_database(self, engine, table_name, conn=None):
+        """Save data to database based on data tier type
+
+        With conn, the writes join the caller's transaction and are committed by the caller.
+        """
+        if conn is None:
+            if not engine:
+                return
+            with engine.begin() as conn:
+                return self._save_to_database(engine, table_name, conn)
 
         if self.data_tier in ['split_sentences', 'questions']:
             # For DataFrame data, save directly to table
-            with engine.connect() as conn:
-                self.data.to_sql(table_name, conn, if_exists='replace', index=False)
-                conn.commit()
+            self.data.to_sql(table_name, conn, if_exists='replace', index=False)
         else:
-            # For JSON-like data, use the original structure
+            # For JSON-like data, keep a single JSON document per (domain, concept, data_tier)
             metadata = MetaData()
-            saged_table = Table(
-                table_name,
-                metadata,
-                Column('id', Integer, primary_key=True),
-                Column('domain', String),
-                Column('concept', String),
-                Column('data_tier', String),
-                Column('data', JSON)
-            )
+            saged_table = self._get_json_table(table_name, metadata)
             
-            # Create table if it doesn't exist
-            metadata.create_all(engine)
+            # Create table and its lookup index if they don't exist
+            metadata.create_all(conn)
             
-            # Insert data
-            with engine.connect() as conn:
-                conn.execute(
-                    saged_table.insert(),
-                    {
-                        'domain': self.domain,
-                        'concept': self.concept,
-                        'data_tier': self.data_tier,
-                        'data': self.data
-                    }
+            # Replace any previous document
+            conn.execute(
+                saged_table.delete().where(
+                    (saged_table.c.domain == self.domain) &
+                    (saged_table.c.concept == self.concept) &
+                    (saged_table.c.data_tier == self.data_tier)
                 )
-                conn.commit()
+            )
+            conn.execute(
+                saged_table.insert(),
+                {
+                    'domain': self.domain,
+                    'concept': self.concept,
+                    'data_tier': self.data_tier,
+                    'data': self.data
+                }
+            )
+
+    def _save_to_parquet(self, table_name):
+        """Save data to a Parquet-backed database, one file per table"""
+        database_connection = self.database_config.get('database_connection')
+        if self.data_tier in ['split_sentences', 'questions']:
+            file_path = _get_parquet_path(database_connection, table_name)
+            self.data.to_parquet(file_path, compression='zstd', engine='pyarrow', index=False)
+        else:
+            # JSON-like data tiers are nested documents rather than tables
+            file_path = _get_parquet_path(database_connection, table_name, extension='json')
+            with open(file_path, 'w') as f:
+                json.dump(self.data, f)
+        return file_path
+
+    def _load_from_parquet(self, table_name):
+        """Load data from a Parquet-backed database"""
+        database_connection = self.database_config.get('database_connection')
+        try:
+            if self.data_tier in ['split_sentences', 'questions']:
+                self.data = pd.read_parquet(_get_parquet_path(database_connection, table_name), engine='pyarrow')
+            else:
+                with open(_get_parquet_path(database_connection, table_name, extension='json'), 'r') as f:
+                    self.data = json.load(f)
+            return True
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"Error loading from database: {e}")
+            return False
 
     def _load_from_database(self, engine, table_name):
         """Load data from database based on data tier type"""
@@ -124,24 +171,16 @@ class SAGEDData:
             else:
                 # For JSON-like data, use the original structure
                 metadata = MetaData()
-                saged_table = Table(
-                    table_name,
-                    metadata,
-                    Column('id', Integer, primary_key=True),
-                    Column('domain', String),
-                    Column('concept', String),
-                    Column('data_tier', String),
-                    Column('data', JSON)
-                )
+                saged_table = self._get_json_table(table_name, metadata)
 
-                # Query data
+                # Query data through the (domain, concept, data_tier) index, newest document first
                 with engine.connect() as conn:
                     result = conn.execute(
-                        saged_table.select().where(
+                        select(saged_table.c.data).where(
                             (saged_table.c.domain == self.domain) &
                             (saged_table.c.concept == self.concept) &
                             (saged_table.c.data_tier == self.data_tier)
-                        )
+                        ).order_by(saged_table.c.id.desc())
                     ).first()
 
                     if result:
@@ -222,6 +261,16 @@ class SAGEDData:
     def load_file(cls, domain, concept, data_tier, file_path, use_database=False, database_config=None):
         instance = cls(domain, concept, data_tier, file_path, use_database, database_config)
         
+        if use_database and instance.database_config.get('database_type') == 'parquet':
+            table_name = instance._get_table_name() if file_path is None else file_path.split('/')[-1].split('.')[0]
+            if instance._load_from_parquet(table_name):
+                try:
+                    cls.check_format(data_tier, instance.data)
+                    return instance
+                except AssertionError as e:
+                    print(f"Error loading or validating table {table_name}: {e}")
+            return None
+
         if use_database:
             engine = instance._get_database_connection()
             if engine and file_path is None:
@@ -421,6 +470,23 @@ class SAGEDData:
             else:
                 print(f"Cannot remove from {data_tier} data, it is not in DataFrame format.")
 
+    @staticmethod
+    def _resolve_keyword_metadata(metadata):
+        """Fill keyword metadata with the default values, or return None if it is not a dictionary"""
+        default_metadata = SAGEDData.default_keyword_metadata.copy()
+        if metadata is None:
+            return default_metadata
+        elif isinstance(metadata, dict):
+            # Filter and update metadata based on default values
+            filtered_metadata = {key: metadata.get(key, default_value) for key, default_value in
+                                 default_metadata.items()}
+            targeted_source = filtered_metadata.get('targeted_source')
+            SAGEDData.check_format(source_finder_only=True)(targeted_source)
+            return filtered_metadata
+        else:
+            print("Metadata provided is not in the right dictionary format.")
+            return None
+
     def add(self, keyword=None, source_finder=None, metadata=None, source_finder_target='common', data_tier=None):
         def merge_source_specifications(data):
             """
@@ -458,18 +524,8 @@ class SAGEDData:
             return self
 
         if data_tier == 'keywords':
-            default_metadata = SAGEDData.default_keyword_metadata.copy()
+            metadata = SAGEDData._resolve_keyword_metadata(metadata)
             if metadata is None:
-                metadata = default_metadata
-            elif isinstance(metadata, dict):
-                # Filter and update metadata based on default values
-                filtered_metadata = {key: metadata.get(key, default_value) for key, default_value in
-                                     default_metadata.items()}
-                metadata = filtered_metadata
-                targeted_source = metadata.get('targeted_source')
-                SAGEDData.check_format(source_finder_only=True)(targeted_source)
-            else:
-                print("Metadata provided is not in the right dictionary format.")
                 return self
 
             for index, item in enumerate(self.data):
@@ -526,19 +582,67 @@ class SAGEDData:
                 print(f"Cannot add to {data_tier} data, it is not in DataFrame format.")
             return self
 
-    def save(self, file_path=None, domain_save=False, suffix=None):
+    def extend(self, items, metadata=None, data_tier=None):
+        """Add many keywords, or rows for the split_sentences and questions data tiers, in one pass"""
+        if data_tier is None:
+            data_tier = self.data_tier
+        if SAGEDData.tier_order[data_tier] > SAGEDData.tier_order[self.data_tier]:
+            print(f"Data tier '{data_tier}' is not available in the current data.")
+            return self
+
+        if data_tier in ['split_sentences', 'questions']:
+            if not isinstance(self.data, pd.DataFrame):
+                print(f"Cannot add to {data_tier} data, it is not in DataFrame format.")
+                return self
+            rows = [row for row in items if isinstance(row, dict)]
+            if len(rows) != len(items):
+                print(f"Source finder must be a dictionary for {data_tier} data tier.")
+            if rows:
+                # Concatenate once instead of once per row
+                self.data = pd.concat([self.data, pd.DataFrame(rows)], ignore_index=True)
+                print(f"Added {len(rows)} new rows to {data_tier} DataFrame.")
+            return self
+
+        if data_tier != 'keywords':
+            for item in items:
+                self.add(keyword=item, metadata=metadata, data_tier=data_tier)
+            return self
+
+        # Validate the metadata once for all keywords
+        metadata = SAGEDData._resolve_keyword_metadata(metadata)
+        if metadata is None:
+            return self
+
+        for item in self.data:
+            keywords = item.setdefault('keywords', {})
+            for keyword in items:
+                keywords[keyword] = metadata.copy()
+        return self
+
+    def save(self, file_path=None, domain_save=False, suffix=None, conn=None):
+        if self.use_database and self.database_config.get('database_type') == 'parquet':
+            if file_path is None:
+                table_name = self._get_table_name()
+                if suffix:
+                    table_name = f"{table_name}_{suffix}"
+            else:
+                table_name = file_path.split('/')[-1].split('.')[0]
+            print(f"Data saved to {self._save_to_parquet(table_name)}")
+            return
+
         if self.use_database:
-            engine = self._get_database_connection()
+            # A connection handed in by the caller carries an open transaction shared with other saves
+            engine = conn.engine if conn is not None else self._get_database_connection()
             if engine and file_path is None:
                 table_name = self._get_table_name()
                 if suffix:
                     table_name = f"{table_name}_{suffix}"
-                self._save_to_database(engine, table_name)
+                self._save_to_database(engine, table_name, conn)
                 print(f"Data saved to database table {table_name}")
                 return
             elif engine and file_path is not None:
                 table_name = file_path.split('/')[-1].split('.')[0]
-                self._save_to_database(engine, table_name)
+                self._save_to_database(engine, table_name, conn)
                 print(f"Data saved to database table {table_name}")
                 return
             else:
@@ -557,7 +661,9 @@ class SAGEDData:
                 os.makedirs(default_path, exist_ok=True)
                 file_path = os.path.join(default_path, file_name)
             if isinstance(self.data, pd.DataFrame):
-                self.data.to_csv(file_path, index=False)
+                # Write next to the target and swap it in, so an interrupted save never leaves a truncated file
+                self.data.to_csv(f"{file_path}.tmp", index=False)
+                os.replace(f"{file_path}.tmp", file_path)
                 print(f"Data saved to {file_path}")
             else:
                 print("Data is not in a DataFrame format.")
@@ -570,18 +676,19 @@ class SAGEDData:
 
             if file_path:  # Only create directories if we have a valid file path
                 os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                with open(file_path, 'w') as f:
+                with open(f"{file_path}.tmp", 'w') as f:
                     json.dump(self.data, f, indent=2)
+                os.replace(f"{file_path}.tmp", file_path)
                 print(f"Data saved to {file_path}")
 
     @classmethod
     def merge(cls, domain, merge_list, concept = 'merged', saged_format = True):
-        df = pd.DataFrame()
         for data_item in merge_list:
             assert isinstance(data_item, SAGEDData), "Data to merge should be of type saged_data."
             assert data_item.domain == domain, "Data to merge should have the same domain."
             assert data_item.data_tier in ['split_sentences', 'questions'], "Data to merge should be in split_sentences or questions data tier."
-            df = pd.concat([df, data_item.data], ignore_index=True)
+        # Concatenate once, so each row is copied a single time
+        df = pd.concat([pd.DataFrame()] + [data_item.data for data_item in merge_list], ignore_index=True)
 
         # Determine the data tier based on the first item in merge_list
         data_tier = merge_list[0].data_tier
@@ -644,8 +751,11 @@ class SAGEDData:
             if not database_config:
                 raise ValueError("Database configuration is required when use_database is True")
                 
-            if database_config.get('database_type') == 'sql':
-                engine = create_engine(database_config['database_connection'])
+            if database_config.get('database_type') in ('sql', 'sqlite'):
+                if database_config.get('database_type') == 'sqlite':
+                    engine = create_engine(_get_sqlite_url(database_config.get('database_connection')))
+                else:
+                    engine = create_engine(database_config['database_connection'])
                 # Get the source text table name from config, default to 'source_texts'
                 table_name = database_config.get('source_text_table', 'source_texts')
                 
@@ -1,24 +1,214 @@
 import os
 
 import requests
-from bs4 import BeautifulSoup
 import glob
 
-import wikipediaapi
 import numpy as np
 import warnings
 from ._saged_data import SAGEDData as saged_data
 
-from sentence_transformers import SentenceTransformer, util
-
 import re
+import json
+import time
+import hashlib
+import logging
+from functools import lru_cache, partial
 from tqdm import tqdm
 
 from ._utility import clean_list, construct_non_containing_set, check_generation_function
-from ._utility import ignore_future_warnings
+from ._utility import ignore_future_warnings, _cosine_topk
+
+import asyncio
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Wikipedia page fields read by the source finder are kept in memory, and for a week on disk in the directory
+# named by SAGED_WIKI_CACHE_DIR. Without it, or once the directory can't be written, the cache is memory only
+_WIKI_CACHE_DIR = os.environ.get('SAGED_WIKI_CACHE_DIR') or None
+_WIKI_CACHE_TTL = 7 * 24 * 3600
+_wiki_page_cache = {}
+# Concurrent requests made when fetching pages, and the seconds each may take before its page is skipped
+_FETCH_WORKERS = 16
+_FETCH_TIMEOUT = 30
+
+logger = logging.getLogger(__name__)
+
+# References like '[42]' and '[page needed]', and the boundaries sentences are split at
+_CITATION_RE = re.compile(r'\[\d+\]|\[.*?\]')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=\.)\s+(?=[A-Z])|(?<=\?")\s+|(?<=\.")\s+')
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+@lru_cache(maxsize=4)
+def _get_sentence_transformer(model_name):
+    """Load a SentenceTransformer once per model name and share it between calls, in half precision on GPU"""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name)
+    if torch.cuda.is_available():
+        # The embeddings only rank tokens by similarity, which fp16 preserves at twice the throughput
+        model = model.to('cuda').half()
+    return model
+
+
+def _is_word_character(character):
+    return character.isalnum() or character == '_'
+
+
+class _KeywordMatcher:
+    """
+    Find the keywords a sentence contains, case-insensitively and, with word_boundaries, only as whole words.
+
+    Uses an Aho-Corasick automaton scanning the sentences once when pyahocorasick is installed. Otherwise a regex
+    matching any keyword rules out most sentences before each keyword's own regex is tried.
+    """
+
+    def __init__(self, keywords, word_boundaries=False):
+        self.keywords = list(keywords)
+        self.word_boundaries = word_boundaries
+        if ahocorasick is not None and self.keywords:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                lowered = keyword.lower()
+                if lowered in self.automaton:
+                    self.automaton.get(lowered)[1].append(keyword)
+                else:
+                    self.automaton.add_word(lowered, (lowered, [keyword]))
+            self.automaton.make_automaton()
+        else:
+            self.automaton = None
+            pattern = _wiki_keyword_pattern if word_boundaries else re.escape
+            patterns = {keyword: pattern(keyword) for keyword in self.keywords}
+            self.any_keyword = re.compile('|'.join(f'(?:{p})' for p in patterns.values()), re.IGNORECASE)
+            self.keyword_regexes = {keyword: re.compile(p, re.IGNORECASE) for keyword, p in patterns.items()}
+
+    def __call__(self, sentence):
+        """Return the keywords found in the sentence, each once"""
+        for _, keywords in self.match_all([sentence]):
+            return keywords
+        return []
+
+    def match_all(self, sentences):
+        """
+        Yield (sentence, keywords) for each sentence containing a keyword, in order.
+
+        The automaton scans all the sentences as one newline-joined text, so the per-sentence work left in Python
+        is mapping each match back to its sentence.
+        """
+        if not self.keywords:
+            return
+        if self.automaton is None:
+            any_keyword = self.any_keyword
+            for sentence in sentences:
+                if any_keyword.search(sentence):
+                    yield sentence, [keyword for keyword, keyword_regex in self.keyword_regexes.items()
+                                     if keyword_regex.search(sentence)]
+            return
+
+        sentences = list(sentences)
+        lowered_sentences = [sentence.lower() for sentence in sentences]
+        starts = []
+        offset = 0
+        for lowered_sentence in lowered_sentences:
+            starts.append(offset)
+            offset += len(lowered_sentence) + 1
+        # Newlines are non-word characters, so they bound each sentence like the ends of a string
+        text = '\n'.join(lowered_sentences)
+
+        word_boundaries = self.word_boundaries
+        found = {}
+        for end, (lowered, keywords) in self.automaton.iter(text):
+            start = end - len(lowered) + 1
+            index = bisect_right(starts, end) - 1
+            if start < starts[index]:
+                continue
+            if word_boundaries:
+                # The same test as the regex \b on both sides of the match
+                before = start > 0 and _is_word_character(text[start - 1])
+                after = end + 1 < len(text) and _is_word_character(text[end + 1])
+                if (before == _is_word_character(lowered[0])) or (after == _is_word_character(lowered[-1])):
+                    continue
+            found.setdefault(index, {}).update(dict.fromkeys(keywords))
+
+        # Matches are reported in order of their end, so the sentences come out in order
+        for index, keywords in found.items():
+            yield sentences[index], list(keywords)
+
+
+@lru_cache(maxsize=8)
+def _cached_keyword_matcher(keywords, word_boundaries=False):
+    """Build a _KeywordMatcher once per tuple of keywords, so process pool workers reuse it across files"""
+    return _KeywordMatcher(keywords, word_boundaries)
+
+
+def _fetch_page(url):
+    """Fetch the content of a page, or None after logging why the request failed"""
+    try:
+        response = requests.get(url, timeout=_FETCH_TIMEOUT)
+        response.raise_for_status()
+        return response.content
+    except requests.RequestException as e:
+        logger.warning('Skipping %s: %r', url, e)
+        return None
+
+
+def _scrape_local_file(file_path, source_tag, keywords, use_database=False, database_config=None):
+    """
+    Find the sentences of a local file that contain each keyword.
+
+    Args:
+    - file_path (str): The path of the file, or its identifier in the database.
+    - source_tag (str): The source tag paired with every sentence found.
+    - keywords (tuple): The keywords to search for.
+    - use_database (bool): Whether the file is read from the database.
+    - database_config (dict): Database configuration if using database.
+
+    Returns:
+    - dict: The (sentence, source_tag) pairs found for each keyword, or None if the file can't be read.
+    """
+    # Read the file content using retrieve_txt
+    try:
+        text = saged_data.retrieve_txt(file_path, use_database, database_config)
+    except Exception as e:
+        print(f"Error reading file {file_path}: {str(e)}")
+        return None
+
+    # Join the lines ('.\n' becomes '. ' like any other line break), then remove citations and other
+    # patterns within square brackets
+    clean_text = _CITATION_RE.sub('', text.replace('\n', ' '))
+    del text
+
+    # Split the cleaned text into sentences and extract the long enough ones containing a keyword
+    match_keywords = _cached_keyword_matcher(keywords)
+    results = {}
+    keyword_results = results.setdefault
+    sentences = (sentence for sentence in _SENTENCE_SPLIT_RE.split(clean_text) if len(sentence.split()) >= 6)
+    for sentence, keywords in match_keywords.match_all(sentences):
+        for keyword in keywords:
+            keyword_results(keyword, []).append((sentence.strip(), source_tag))
+    return results
+
+
+def _wiki_keyword_pattern(keyword):
+    return r'\b' + re.escape(keyword) + r'\b'
 
-import tempfile
-import shutil
 
 @ignore_future_warnings
 def find_similar_keywords(model_name, target_word, keywords_list, top_n=100):
@@ -35,17 +225,14 @@ def find_similar_keywords(model_name, target_word, keywords_list, top_n=100):
     - list: The top N keywords most similar to the target word.
     """
     # Load pre-trained model
-    model = SentenceTransformer(model_name)
+    model = _get_sentence_transformer(model_name)
 
     # Embed the keywords and the target word
-    keyword_embeddings = model.encode(keywords_list)
-    target_embedding = model.encode(target_word)
+    keyword_embeddings = model.encode(keywords_list, batch_size=128, convert_to_numpy=True)
+    target_embedding = model.encode(target_word, convert_to_numpy=True)
 
-    # Compute cosine similarities
-    cosine_similarities = util.cos_sim(target_embedding, keyword_embeddings)[0].numpy()
-
-    # Find the top N keywords most similar to the target word
-    top_indices = np.argsort(cosine_similarities)[::-1][:top_n]
+    # Select the top N keywords most similar to the target word, only sorting the selected ones
+    top_indices = _cosine_topk(keyword_embeddings, target_embedding, top_n)
     top_keywords = [keywords_list[i] for i in top_indices]
 
     return top_keywords
@@ -63,6 +250,8 @@ def search_wikipedia(topic, language='en', user_agent='SAGED-bias (contact@holis
     Returns:
     - Wikipedia page object or an error message if the page does not exist.
     """
+    import wikipediaapi
+
     wiki_wiki = wikipediaapi.Wikipedia(language=language, user_agent=user_agent)
     page = wiki_wiki.page(topic)
 
@@ -72,6 +261,73 @@ def search_wikipedia(topic, language='en', user_agent='SAGED-bias (contact@holis
     return page, wiki_wiki
 
 
+def _wiki_page_field(wiki_wiki, title, field):
+    """
+    Read a field of a Wikipedia page through the memory and, if configured, disk cache, fetching it on a miss.
+
+    Args:
+    - wiki_wiki (Wikipedia): The Wikipedia API instance.
+    - title (str): The title of the page.
+    - field (str): One of 'exists', 'fullurl', 'text', 'links' or 'backlinks'. Links are returned as lists of titles.
+
+    Returns:
+    - The value of the field.
+    """
+    global _WIKI_CACHE_DIR
+
+    key = (wiki_wiki.language, title)
+    path = None
+    if _WIKI_CACHE_DIR:
+        path = os.path.join(_WIKI_CACHE_DIR, wiki_wiki.language,
+                            hashlib.blake2b(title.encode('utf-8'), digest_size=16).hexdigest() + '.json')
+    entry = _wiki_page_cache.get(key)
+    if entry is None:
+        if path is not None:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+        if entry is None or time.time() - entry.get('fetched_at', 0) > _WIKI_CACHE_TTL:
+            entry = {'fetched_at': time.time()}
+        _wiki_page_cache[key] = entry
+
+    if field not in entry:
+        page = wiki_wiki.page(title)
+        if field == 'exists':
+            entry[field] = page.exists()
+        elif field in ('links', 'backlinks'):
+            entry[field] = list(getattr(page, field).keys())
+        else:
+            entry[field] = getattr(page, field)
+
+        if path is not None:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+                os.replace(path + '.tmp', path)
+            except OSError as e:
+                warnings.warn(f"Wikipedia disk cache disabled, {_WIKI_CACHE_DIR} can't be written: {e}")
+                _WIKI_CACHE_DIR = None
+
+    return entry[field]
+
+
+def _prefetch_wiki_pages(wiki_wiki, titles):
+    """Fetch whether each page exists, and its URL, into the page cache concurrently"""
+    def fetch(title):
+        try:
+            if _wiki_page_field(wiki_wiki, title, 'exists'):
+                _wiki_page_field(wiki_wiki, title, 'fullurl')
+        except Exception:
+            # Left uncached, the caller's own lookup retries and reports it
+            pass
+
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+        list(executor.map(fetch, titles))
+
+
 class KeywordFinder:
     def __init__(self, concept, domain, use_database=False, database_config=None):
         self.concept = concept
@@ -93,17 +349,22 @@ class KeywordFinder:
             else:
                 keyword_provider = f'{self.finder_mode}'
 
+            keyword_fields = {
+                "keyword_type": "sub-concepts",
+                "keyword_provider": keyword_provider,
+                "scrap_mode": "in_page",
+                "scrap_shared_area": "Yes"
+            }
+            targeted_source_finders = self.kw_targeted_source_finder_dict
+            check_source_finder = saged_data.check_format(source_finder_only=True) \
+                if isinstance(targeted_source_finders, dict) else None
+
             for keyword in keywords:
-                keywords_dictionary[keyword] = {
-                    "keyword_type": "sub-concepts",
-                    "keyword_provider": keyword_provider,
-                    "scrap_mode": "in_page",
-                    "scrap_shared_area": "Yes"
-                }
-
-                if isinstance(self.kw_targeted_source_finder_dict, dict):
-                    targeted_source_finder = self.kw_targeted_source_finder_dict[keyword]
-                    saged_data.check_format(source_finder_only=True)(targeted_source_finder)
+                keywords_dictionary[keyword] = keyword_fields.copy()
+
+                if check_source_finder is not None:
+                    targeted_source_finder = targeted_source_finders[keyword]
+                    check_source_finder(targeted_source_finder)
                     keywords_dictionary[keyword]["targeted_source_finder"] = targeted_source_finder
 
             keyword_entry = {
@@ -242,13 +503,16 @@ class KeywordFinder:
     def wiki_embeddings(self, keyword=None,
                         n_keywords=40, embedding_model='paraphrase-Mpnet-base-v2',
                         language='en', max_adjustment = 150,
-                        user_agent='SAGED-bias (contact@holisticai.com)'):
+                        user_agent='SAGED-bias (contact@holisticai.com)', scorer=None):
         if not keyword:
             keyword = self.concept
+        # scorer(embeddings, query, k) returns the indices of the k rows most similar to query, best first
+        if scorer is None:
+            scorer = _cosine_topk
 
         # Search Wikipedia for the keyword
         print('Initiating the embedding model...')
-        model = SentenceTransformer(embedding_model)
+        model = _get_sentence_transformer(embedding_model)
         try:
             page_content = search_wikipedia(keyword, language, user_agent)[0].text
         except AttributeError as e:
@@ -257,48 +521,36 @@ class KeywordFinder:
         if isinstance(page_content, str) and page_content.startswith("No Wikipedia page found"):
             return page_content
 
-        # Tokenize the Wikipedia page content
-        tokens = re.findall(r'\b\w+\b', page_content.lower())
+        # Count the tokens of the Wikipedia page content without materializing them, in order of first occurrence
+        token_counts = Counter(match.group(0) for match in _TOKEN_RE.finditer(page_content.lower()))
 
         # Get unique tokens
-        unique_tokens = list(set(tokens))
-
-        # Get embeddings for unique tokens
-        embeddings = {}
-        token_embeddings = model.encode(unique_tokens, show_progress_bar=True)
-        for token, embedding in zip(unique_tokens, token_embeddings):
-            embeddings[token] = embedding
+        unique_tokens = list(token_counts)
 
-        keyword_embedding = model.encode([keyword.lower()], show_progress_bar=True)[0]
-        similarities = {}
-        for token, embedding in tqdm(embeddings.items(), desc="Calculating similarities"):
-            similarities[token] = util.pytorch_cos_sim(keyword_embedding, embedding).item()
+        # Embed the keyword together with the unique tokens in one batched call, keyword first
+        embeddings = model.encode([keyword.lower(), *unique_tokens], batch_size=256, show_progress_bar=True)
+        keyword_embedding, token_embeddings = embeddings[0], embeddings[1:]
 
         ADDITIONAL_ITEMS = 20
 
         # Ensure n_keywords is non-negative and within valid range. Adjusts n_keywords accordingly
-        if max_adjustment > 0 and n_keywords + max_adjustment > len(similarities) / 2:
-            n_keywords = max(int(len(similarities) / 2) - max_adjustment - 1, 0)
-
-        # Sort tokens by similarity score and select top candidates
-        sorted_similarities = sorted(similarities.items(), key=lambda item: item[1], reverse=True)
+        if max_adjustment > 0 and n_keywords + max_adjustment > len(unique_tokens) / 2:
+            n_keywords = max(int(len(unique_tokens) / 2) - max_adjustment - 1, 0)
 
-        # Ensure not to exceed the available number of items
-        num_items_to_select = min(len(sorted_similarities), n_keywords * 2 + ADDITIONAL_ITEMS)
-        similar_words_first_pass = sorted_similarities[:num_items_to_select]
-
-        # Convert to dictionary
-        words_dict = dict(similar_words_first_pass)
+        # Select the top candidates by similarity score, ensuring not to exceed the available number of items
+        num_items_to_select = min(len(unique_tokens), n_keywords * 2 + ADDITIONAL_ITEMS)
+        similar_words_first_pass = [unique_tokens[index] for index in
+                                    scorer(np.asarray(token_embeddings), np.asarray(keyword_embedding),
+                                           num_items_to_select)]
 
         # Construct non-containing set
-        non_containing_set = construct_non_containing_set(words_dict.keys())
+        non_containing_set = construct_non_containing_set(similar_words_first_pass)
 
-        # Filter based on non-containing set
-        similar_words_dict = {k: v for k, v in words_dict.items() if k in non_containing_set}
+        # Filter based on non-containing set, the candidates are already sorted by similarity
+        similar_words = [word for word in similar_words_first_pass if word in non_containing_set]
 
         # Select top keywords
-        self.keywords = sorted(similar_words_dict, key=lambda k: similar_words_dict[k], reverse=True)[
-                        :min(n_keywords, len(similar_words_dict))]
+        self.keywords = similar_words[:min(n_keywords, len(similar_words))]
 
         # Set mode and return processed data
         self.finder_mode = "embedding"
@@ -344,95 +596,44 @@ class SourceFinder:
         Main function to search Wikipedia for a topic and find related pages.
         """
 
-        def get_related_forelinks(topic, page, wiki_wiki, max_depth=1, current_depth=0, visited=None, top_n=50):
-            """
-            Recursively get related pages up to a specified depth.
-
-            Args:
-            - topic (str): The main topic to start the search from.
-            - page (Wikipedia page object): The Wikipedia page object of the main topic.
-            - wiki_wiki (Wikipedia): The Wikipedia API instance.
-            - max_depth (int): Maximum depth to recurse.
-            - current_depth (int): Current depth of the recursion.
-            - visited (set): Set of visited pages to avoid loops.
-            - top_n (int): Number of top forelinks to retrieve based on relevance.
-
-            Returns:
-            - list: A list of URLs of related forelinks.
-            """
-            links = page.links
-            related_pages = []
-
-            if visited is None:
-                visited = set()
-                related_pages.append(page.fullurl)
-
-            visited.add(page.title)
-
-            title_list = list(links.keys())
-            if len(title_list) > top_n:
-                title_list = find_similar_keywords('paraphrase-MiniLM-L6-v2', topic, title_list, top_n)
-
-            for link_title in tqdm(title_list, desc=f"Depth {current_depth + 1}/{max_depth}"):
-                if link_title not in visited:
-                    # try:
-                    link_page = wiki_wiki.page(link_title)
-                    if link_page.exists():
-                        related_pages.append(link_page.fullurl)
-                        visited.add(link_title)
-                        if current_depth + 1 < max_depth:
-                            # Pass `top_n` down in the recursive call
-                            related_pages.extend(
-                                get_related_forelinks(topic, link_page, wiki_wiki, max_depth, current_depth + 1,
-                                                      visited,
-                                                      top_n))
-                    # except Exception as e:
-                    #     print(f"Error with page {link_title}: {e}")
-
-            return related_pages
-
-        def get_related_backlinks(topic, page, wiki_wiki, max_depth=1, current_depth=0, visited=None, top_n=50):
+        def get_related_pages(topic, page, wiki_wiki, link_field, max_depth=1, top_n=50):
             """
-            Recursively get related backlinks up to a specified depth.
+            Get the pages linked from, or linking to, a page breadth first up to a specified depth.
 
             Args:
             - topic (str): The main topic to start the search from.
             - page (Wikipedia page object): The Wikipedia page object of the main topic.
             - wiki_wiki (Wikipedia): The Wikipedia API instance.
-            - max_depth (int): Maximum depth to recurse.
-            - current_depth (int): Current depth of the recursion.
-            - visited (set): Set of visited pages to avoid loops.
-            - top_n (int): Number of top backlinks to retrieve based on relevance.
+            - link_field (str): 'links' to follow forelinks or 'backlinks' to follow backlinks.
+            - max_depth (int): Maximum depth to search.
+            - top_n (int): Number of top links of each page to retrieve based on relevance.
 
             Returns:
-            - list: A list of URLs of related backlinks.
+            - list: A list of URLs of the page and its related pages.
             """
-            backlinks = page.backlinks
-            related_pages = []
-
-            if visited is None:
-                visited = set()
-                related_pages.append(page.fullurl)
-
-            visited.add(page.title)
-
-            title_list = list(backlinks.keys())
-            if len(title_list) > top_n:
-                title_list = find_similar_keywords('paraphrase-MiniLM-L6-v2', topic, title_list, top_n)
-
-            for link_title in tqdm(title_list, desc=f"Depth {current_depth + 1}/{max_depth}"):
-                if link_title not in visited:
+            related_pages = [_wiki_page_field(wiki_wiki, page.title, 'fullurl')]
+            visited = {page.title}
+            frontier = deque([(page.title, 0)])
+
+            while frontier:
+                title, depth = frontier.popleft()
+
+                # Drop visited pages before ranking, so the ranking only considers pages that can still be added
+                title_list = [link_title for link_title in _wiki_page_field(wiki_wiki, title, link_field)
+                              if link_title not in visited]
+                if len(title_list) > top_n:
+                    title_list = find_similar_keywords('paraphrase-MiniLM-L6-v2', topic, title_list, top_n)
+
+                _prefetch_wiki_pages(wiki_wiki, title_list)
+                for link_title in tqdm(title_list, desc=f"Depth {depth + 1}/{max_depth}"):
+                    if link_title in visited:
+                        continue
                     try:
-                        link_page = wiki_wiki.page(link_title)
-                        if link_page.exists():
-                            related_pages.append(link_page.fullurl)
+                        if _wiki_page_field(wiki_wiki, link_title, 'exists'):
+                            related_pages.append(_wiki_page_field(wiki_wiki, link_title, 'fullurl'))
                             visited.add(link_title)
-                            if current_depth + 1 < max_depth:
-                                # Pass `top_n` down in the recursive call
-                                related_pages.extend(
-                                    get_related_backlinks(topic, link_page, wiki_wiki, max_depth, current_depth + 1,
-                                                          visited,
-                                                          top_n))
+                            if depth + 1 < max_depth:
+                                frontier.append((link_title, depth + 1))
                     except Exception as e:
                         print(f"Error with page {link_title}: {e}")
 
@@ -453,10 +654,11 @@ class SourceFinder:
         else:
             print(f"Found Wikipedia page: {main_page.title}")
             print(f"Searching similar forelinks for {topic}")
-            related_pages = get_related_forelinks(topic, main_page, wiki_wiki, max_depth=1, top_n=top_n)
+            related_pages = get_related_pages(topic, main_page, wiki_wiki, 'links', max_depth=1, top_n=top_n)
             if scrape_backlinks > 0:
                 print(f"Searching similar backlinks for {topic}")
-                related_backlinks = get_related_backlinks(topic, main_page, wiki_wiki, max_depth=1, top_n=scrape_backlinks)
+                related_backlinks = get_related_pages(topic, main_page, wiki_wiki, 'backlinks', max_depth=1,
+                                                      top_n=scrape_backlinks)
                 related_pages.extend(related_backlinks)
             self.source_finder = list(set(related_pages))
             self.source_type = 'wiki_urls'
@@ -494,7 +696,8 @@ class Scraper:
         self.data = source_finder_saged_data.data
         self.source_finder = source_finder_saged_data.data[0]["concept_shared_source"]
         self.keywords = self.data[0]["keywords"].keys()
-        self.extraction_expression = r'(?<=\.)\s+(?=[A-Z])|(?<=\?")\s+|(?<=\.")\s+'  # Regex pattern to split sentences
+        self.extraction_expression = _SENTENCE_SPLIT_RE.pattern  # Regex pattern to split sentences
+        self._sentence_split_re = _SENTENCE_SPLIT_RE
         self.source_tag = 'default'
         self.use_database = source_finder_saged_data.use_database
         self.database_config = source_finder_saged_data.database_config
@@ -517,162 +720,135 @@ class Scraper:
                 url_links.extend(sa_dict["source_specification"])
                 source_tags_list.extend([sa_dict["source_tag"]] * len(sa_dict["source_specification"]))
 
-        # Create a temporary directory that will be automatically cleaned up
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Dictionary to store temporary files for each keyword
-            temp_files = {}
-            
-            for url, source_tag in tqdm(zip(url_links, source_tags_list), desc='Scraping through URL', unit='url',
-                                        total=min(len(url_links), len(source_tags_list))):
-                url_results = []
-                source_tag_buffer = []
-                
-                for keyword in tqdm(self.keywords, desc='Scraping in page', unit='keyword'):
-                    # Fetch the HTML content of the URL
-                    response = requests.get(url)
-                    soup = BeautifulSoup(response.content, 'html.parser')
-
-                    # Find all text elements in the HTML
-                    text_elements = soup.find_all(['p', 'caption', 'figcaption'])
-
-                    # Compile regex pattern to match keywords
-                    keyword_regex = re.compile(r'\b(' + '|'.join([keyword]) + r')\b', re.IGNORECASE)
-
-                    # Iterate through each text element
-                    for element in text_elements:
-                        # Remove references like '[42]' and '[page needed]'
-                        clean_text = re.sub(r'\[\d+\]|\[.*?\]', '', element.get_text())
-
-                        # Split text into sentences
-                        sentences = re.split(self.extraction_expression, clean_text)
-
-                        # Check each sentence for the keyword
-                        for sentence in sentences:
-                            if len(sentence.split()) >= 6 and keyword_regex.search(sentence):
-                                url_results.append(sentence.strip())
-                                source_tag_buffer.append(source_tag)
-
-                    # Create temporary files for this keyword if they don't exist
-                    if keyword not in temp_files:
-                        temp_files[keyword] = {
-                            'sentences': tempfile.NamedTemporaryFile(mode='w+', encoding='utf-8', delete=False),
-                            'source_tags': tempfile.NamedTemporaryFile(mode='w+', encoding='utf-8', delete=False)
-                        }
-
-                    # Write results to temporary files
-                    for sentence in url_results:
-                        temp_files[keyword]['sentences'].write(f'{sentence}\n')
-                    for tag in source_tag_buffer:
-                        temp_files[keyword]['source_tags'].write(f'{tag}\n')
-
-            # Process results for each keyword
-            for keyword in self.keywords:
-                if keyword in temp_files:
-                    # Reset file pointers to beginning
-                    temp_files[keyword]['sentences'].seek(0)
-                    temp_files[keyword]['source_tags'].seek(0)
-                    
-                    # Read results
-                    sentences = [line.strip() for line in temp_files[keyword]['sentences']]
-                    source_tags = [line.strip() for line in temp_files[keyword]['source_tags']]
-                    
-                    # Create aggregated results
-                    aggregated_results_with_source_tag = list(zip(sentences, source_tags))
-                    
-                    # Update the data structure
-                    if "scraped_sentences" in self.data[0]["keywords"][keyword]:
-                        self.data[0]["keywords"][keyword]["scraped_sentences"] = aggregated_results_with_source_tag
-                    else:
-                        self.data[0]["keywords"][keyword]["scraped_sentences"] = aggregated_results_with_source_tag
-                    
-                    # Close and cleanup temporary files
-                    temp_files[keyword]['sentences'].close()
-                    temp_files[keyword]['source_tags'].close()
-                    os.unlink(temp_files[keyword]['sentences'].name)
-                    os.unlink(temp_files[keyword]['source_tags'].name)
+        match_keywords = _KeywordMatcher(self.keywords, word_boundaries=True)
+
+        # Sentences found for each keyword, with the source tag of their page
+        results = {keyword: [] for keyword in self.keywords}
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+            # Fetch the pages concurrently, they are processed in order as they arrive
+            pages = executor.map(_fetch_page, url_links)
+            for content, source_tag in tqdm(zip(pages, source_tags_list), desc='Scraping through URL', unit='url',
+                                            total=min(len(url_links), len(source_tags_list))):
+                if content is None:
+                    continue
+                # The page doesn't depend on the keyword, split it once and scan each sentence for every keyword
+                for sentence, keywords in match_keywords.match_all(self._page_sentences(content)):
+                    for keyword in keywords:
+                        results[keyword].append((sentence.strip(), source_tag))
+
+        # Update the data structure, keywords are left as they were when there are no pages
+        if url_links:
+            self._store_scraped_sentences(results)
 
         return self.to_saged_data()
 
-    @ignore_future_warnings
-    def scrape_local_with_buffer_files(self, use_database=False, database_config=None):
-        file_paths = []
+    def _store_scraped_sentences(self, results):
+        """Set the scraped sentences of each keyword in results"""
+        keywords_data = self.data[0]["keywords"]
+        for keyword, aggregated_results_with_source_tag in results.items():
+            keywords_data[keyword]["scraped_sentences"] = aggregated_results_with_source_tag
+
+    def _page_sentences(self, content):
+        """Split the text of a wiki page into the sentences long enough to be scraped"""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(content, _HTML_PARSER)
+        remove_citations = _CITATION_RE.sub
+        split_sentences = self._sentence_split_re.split
+
+        sentences = []
+        for element in soup.find_all(['p', 'caption', 'figcaption']):
+            # Remove references like '[42]' and '[page needed]'
+            clean_text = remove_citations('', element.get_text())
+            sentences.extend(sentence for sentence in split_sentences(clean_text)
+                             if len(sentence.split()) >= 6)
+        return sentences
+
+    @staticmethod
+    async def _fetch_pages(urls, concurrency):
+        """Fetch the content of every URL concurrently, at most concurrency requests at a time
+
+        A page whose request fails, times out or returns an error status is logged and its content is None.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency),
+                                         timeout=aiohttp.ClientTimeout(total=_FETCH_TIMEOUT)) as session:
+            async def fetch(url):
+                async with semaphore:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return await response.read()
+
+            pages = await asyncio.gather(*[fetch(url) for url in urls], return_exceptions=True)
+
+        for index, (url, page) in enumerate(zip(urls, pages)):
+            if isinstance(page, Exception):
+                logger.warning('Skipping %s: %r', url, page)
+                pages[index] = None
+        return pages
+
+    async def scrape_in_page_for_wiki_async(self, concurrency=16):
+        """Scrape wiki pages like scrape_in_page_for_wiki_with_buffer_files, fetching every page once and concurrently"""
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for asynchronous scraping. Install it with 'pip install aiohttp'.")
+
+        url_links = []
         source_tags_list = []
         for sa_dict in self.source_finder:
-            if sa_dict["source_type"] == "local_paths":
-                file_paths.extend(sa_dict["source_specification"])
+            if sa_dict["source_type"] == "wiki_urls":
+                url_links.extend(sa_dict["source_specification"])
                 source_tags_list.extend([sa_dict["source_tag"]] * len(sa_dict["source_specification"]))
 
-        # Create a temporary directory that will be automatically cleaned up
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Dictionary to store temporary files for each keyword
-            temp_files = {}
-            
-            for file_path, source_tag in tqdm(zip(file_paths, source_tags_list), desc='Scraping through local files',
-                                            unit='file', total=min(len(file_paths), len(source_tags_list))):
-                path_results = []
-                source_tag_buffer = []
-
-                for keyword in tqdm(self.keywords, desc='Scraping in page', unit='keyword'):
-                    # Read the file content using retrieve_txt
-                    try:
-                        text = saged_data.retrieve_txt(file_path, use_database, database_config)
-                    except Exception as e:
-                        print(f"Error reading file {file_path}: {str(e)}")
-                        continue
-
-                    # Clean the text by removing citations and other patterns within square brackets
-                    text = text.replace('.\n', '. ').replace('\n', ' ')
-                    clean_text = re.sub(r'\[\d+\]|\[.*?\]', '', text)
+        pages = await self._fetch_pages(url_links, concurrency)
 
-                    # Define a regex pattern for the keyword
-                    keyword_regex = re.compile(re.escape(keyword), re.IGNORECASE)
+        match_keywords = _KeywordMatcher(self.keywords, word_boundaries=True)
+        results = {keyword: [] for keyword in self.keywords}
+        for content, source_tag in tqdm(zip(pages, source_tags_list), desc='Scraping through URL', unit='url',
+                                        total=min(len(pages), len(source_tags_list))):
+            if content is None:
+                continue
+            for sentence, keywords in match_keywords.match_all(self._page_sentences(content)):
+                for keyword in keywords:
+                    results[keyword].append((sentence.strip(), source_tag))
 
-                    # Split the cleaned text into sentences
-                    sentences = re.split(r'(?<=\.)\s+(?=[A-Z])|(?<=\?")\s+|(?<=\.")\s+', clean_text)
+        if url_links:
+            self._store_scraped_sentences(results)
 
-                    # Extract desired sentences
-                    for sentence in sentences:
-                        if len(sentence.split()) >= 6 and keyword_regex.search(sentence):
-                            path_results.append(sentence.strip())
-                            source_tag_buffer.append(source_tag)
+        return self.to_saged_data()
 
-                    # Create temporary files for this keyword if they don't exist
-                    if keyword not in temp_files:
-                        temp_files[keyword] = {
-                            'sentences': tempfile.NamedTemporaryFile(mode='w+', encoding='utf-8', delete=False),
-                            'source_tags': tempfile.NamedTemporaryFile(mode='w+', encoding='utf-8', delete=False)
-                        }
+    @ignore_future_warnings
+    def scrape_local_with_buffer_files(self, use_database=False, database_config=None, max_workers=1):
+        file_paths = []
+        source_tags_list = []
+        for sa_dict in self.source_finder:
+            if sa_dict["source_type"] == "local_paths":
+                file_paths.extend(sa_dict["source_specification"])
+                source_tags_list.extend([sa_dict["source_tag"]] * len(sa_dict["source_specification"]))
 
-                    # Write results to temporary files
-                    for sentence in path_results:
-                        temp_files[keyword]['sentences'].write(f'{sentence}\n')
-                    for tag in source_tag_buffer:
-                        temp_files[keyword]['source_tags'].write(f'{tag}\n')
+        scrape_file = partial(_scrape_local_file, keywords=tuple(self.keywords), use_database=use_database,
+                              database_config=database_config)
 
-            # Process results for each keyword
-            for keyword in self.keywords:
-                if keyword in temp_files:
-                    # Reset file pointers to beginning
-                    temp_files[keyword]['sentences'].seek(0)
-                    temp_files[keyword]['source_tags'].seek(0)
-                    
-                    # Read results
-                    sentences = [line.strip() for line in temp_files[keyword]['sentences']]
-                    source_tags = [line.strip() for line in temp_files[keyword]['source_tags']]
-                    
-                    # Create aggregated results
-                    aggregated_results_with_source_tag = list(zip(sentences, source_tags))
-                    
-                    # Update the data structure
-                    if "scraped_sentences" in self.data[0]["keywords"][keyword]:
-                        self.data[0]["keywords"][keyword]["scraped_sentences"] = aggregated_results_with_source_tag
-                    else:
-                        self.data[0]["keywords"][keyword]["scraped_sentences"] = aggregated_results_with_source_tag
-                    
-                    # Close and cleanup temporary files
-                    temp_files[keyword]['sentences'].close()
-                    temp_files[keyword]['source_tags'].close()
-                    os.unlink(temp_files[keyword]['sentences'].name)
-                    os.unlink(temp_files[keyword]['source_tags'].name)
+        # Files are independent, with max_workers > 1 they are scraped in worker processes and collected in order
+        executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 and len(file_paths) > 1 else None
+        try:
+            file_results = (executor.map if executor else map)(scrape_file, file_paths, source_tags_list)
+
+            # Sentences found for each keyword, with the source tag of their file
+            results = {keyword: [] for keyword in self.keywords}
+            files_read = 0
+            for matches in tqdm(file_results, desc='Scraping through local files', unit='file',
+                                total=min(len(file_paths), len(source_tags_list))):
+                if matches is None:
+                    continue
+                files_read += 1
+                for keyword, found in matches.items():
+                    results[keyword].extend(found)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        # Update the data structure, keywords are left as they were when no file could be read
+        if files_read:
+            self._store_scraped_sentences(results)
 
         return self.to_saged_data()
\ No newline at end of file
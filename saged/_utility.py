@@ -1,8 +1,21 @@
 from functools import wraps
+from collections import OrderedDict
+import json
 import os
 import warnings
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange, get_num_threads
+except ImportError:
+    njit = None
+
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
 def clean_list(response):
     # Extract the part between the square brackets
     response_list = response[response.find('['):response.rfind(']') + 1]
@@ -27,32 +40,20 @@ def clean_sentences_and_join(sentence_list):
         .replace('*', '')
 
 def construct_non_containing_set(strings):
-    def update_string_set(string_set, new_string):
-        # Convert the new string to lowercase for comparison
-        new_string_lower = new_string.lower()
-
-        # Create a list of strings to remove
-        strings_to_remove = [existing_string for existing_string in string_set if
-                             new_string_lower in existing_string.lower()]
+    # Kept strings by their lowercase form, so each string is lowercased once
+    kept = {}
+    for string in strings:
+        new_string_lower = string.lower()
 
         # Remove all strings that contain the new string
-        for string_to_remove in strings_to_remove:
-            string_set.remove(string_to_remove)
+        for existing_lower in [existing_lower for existing_lower in kept if new_string_lower in existing_lower]:
+            del kept[existing_lower]
 
-        # Check if the new string should be added
-        should_add = True
-        for existing_string in string_set:
-            if existing_string.lower() in new_string_lower:
-                should_add = False
-                break
+        # Add the new string unless it contains a kept one
+        if not any(existing_lower in new_string_lower for existing_lower in kept):
+            kept[new_string_lower] = string
 
-        if should_add:
-            string_set.add(new_string)
-
-    result_set = set()
-    for string in strings:
-        update_string_set(result_set, string)
-    return result_set
+    return set(kept.values())
 
 
 def check_generation_function(generation_function, test_mode=None):
@@ -111,8 +112,11 @@ def ensure_directory_exists(file_path):
 
 def _update_configuration(scheme_dict, default_dict, updated_dict):
     """
-    Update the scheme dictionary with values from the updated dictionary, or from the default
-    dictionary if the updated value is not available.
+    Build a configuration from the scheme dictionary with values from the updated dictionary, or from
+    the default dictionary if the updated value is not available.
+
+    None of the dictionaries are modified. Default values are copied down to their nested dictionaries
+    and lists, so the returned configuration can be mutated without altering the defaults.
 
     Args:
     - scheme_dict (dict): The scheme dictionary with keys and None values.
@@ -123,28 +127,205 @@ def _update_configuration(scheme_dict, default_dict, updated_dict):
     - dict: The configuration dictionary with updated values.
     """
 
+    configuration = {}
     for key, value in scheme_dict.items():
         if value is None:
             if key in updated_dict:
-                if isinstance(updated_dict[key], dict) and isinstance(scheme_dict[key], dict):
-                    # Recursively update nested dictionaries
-                    scheme_dict[key] = _update_configuration(
-                        scheme_dict[key],
-                        default_dict.get(key, {}),
-                        updated_dict[key]
-                    )
-                else:
-                    # Use the value from updated_dict if available
-                    scheme_dict[key] = updated_dict[key]
+                # Use the value from updated_dict if available
+                configuration[key] = updated_dict[key]
             else:
                 # Use the value from default_dict if available
-                scheme_dict[key] = default_dict.get(key, None)
+                configuration[key] = _copy_configuration(default_dict.get(key, None))
         elif isinstance(value, dict):
             # If the value itself is a dictionary, recursively update it
-            scheme_dict[key] = _update_configuration(
-                scheme_dict[key],
+            configuration[key] = _update_configuration(
+                value,
                 default_dict.get(key, {}),
                 updated_dict.get(key, {})
             )
+        else:
+            configuration[key] = value
+
+    return configuration
+
+
+_configuration_cache = OrderedDict()
+
+
+def _configuration_key(configuration):
+    """
+    Serialize a configuration into a hashable key. Values that are not JSON serializable, such as
+    generation functions, are keyed by identity; the cache keeps them alive so their ids can't be reused.
+    """
+    return json.dumps(configuration, sort_keys=True,
+                      default=lambda value: f'<{type(value).__qualname__} {id(value)}>')
+
+
+def _copy_configuration(configuration):
+    """
+    Copy the nested dictionaries and lists of a configuration, sharing every other value.
+    """
+    if isinstance(configuration, dict):
+        return {key: _copy_configuration(value) for key, value in configuration.items()}
+    if isinstance(configuration, list):
+        return [_copy_configuration(value) for value in configuration]
+    return configuration
+
+
+def _cached_update_configuration(scheme_dict, default_dict, updated_dict, maxsize=128):
+    """
+    Memoized _update_configuration for repeated configurations.
+
+    The scheme and default dictionaries are expected to be shared constants and are keyed by identity,
+    while the updated dictionary is keyed by content.
+
+    Args:
+    - scheme_dict (dict): The scheme dictionary with keys and None values.
+    - default_dict (dict): The dictionary containing default values.
+    - updated_dict (dict): The dictionary containing updated values.
+    - maxsize (int): The number of configurations kept in the cache.
+
+    Returns:
+    - dict: A copy of the configuration dictionary that the caller is free to mutate.
+    """
+    try:
+        key = (id(scheme_dict), id(default_dict), _configuration_key(updated_dict))
+    except (TypeError, ValueError):
+        # Mixed key types or circular references can't be serialized, merge without caching
+        return _update_configuration(scheme_dict, default_dict, updated_dict)
+
+    if key in _configuration_cache:
+        _configuration_cache.move_to_end(key)
+    else:
+        _configuration_cache[key] = _copy_configuration(
+            _update_configuration(scheme_dict, default_dict, updated_dict))
+        if len(_configuration_cache) > maxsize:
+            _configuration_cache.popitem(last=False)
+
+    return _copy_configuration(_configuration_cache[key])
+
+def _get_sqlite_url(database_connection=None):
+    """
+    Resolve the SQLAlchemy URL of a SQLite database, creating its directory if needed.
+
+    Args:
+    - database_connection (str, optional): A 'sqlite:///' URL, or a directory in which the database
+      is stored as saged.db. Defaults to data/customized/database.
+
+    Returns:
+    - str: The SQLite database URL.
+    """
+    if database_connection and database_connection.startswith('sqlite:'):
+        db_path = database_connection[len('sqlite:///'):]
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        return database_connection
+
+    db_dir = database_connection or os.path.join('data', 'customized', 'database')
+    os.makedirs(db_dir, exist_ok=True)
+    return f"sqlite:///{os.path.join(db_dir, 'saged.db')}"
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_topk_numba(emb, query, k):
+        n, dim = emb.shape
+        query_norm = 0.0
+        for j in range(dim):
+            query_norm += query[j] * query[j]
+        query_norm = np.sqrt(query_norm)
+
+        scores = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            dot = 0.0
+            norm = 0.0
+            for j in range(dim):
+                dot += emb[i, j] * query[j]
+                norm += emb[i, j] * emb[i, j]
+            denominator = np.sqrt(norm) * query_norm
+            scores[i] = dot / denominator if denominator > 0 else 0.0
+
+        # Each thread keeps the top k of its own block of rows, the candidates are merged afterwards
+        n_blocks = min(get_num_threads(), n)
+        block_size = (n + n_blocks - 1) // n_blocks
+        candidates = np.full(n_blocks * k, -1, dtype=np.int64)
+        for block in prange(n_blocks):
+            start = block * block_size
+            stop = min(start + block_size, n)
+            if start >= stop:
+                continue
+            order = np.argsort(-scores[start:stop], kind='mergesort')[:k]
+            for position in range(order.shape[0]):
+                candidates[block * k + position] = start + order[position]
+
+        candidates = np.sort(candidates[candidates >= 0])
+        order = np.argsort(-scores[candidates], kind='mergesort')[:k]
+        return candidates[order]
+else:
+    _cosine_topk_numba = None
+
+
+def _topk_indices(scores, k):
+    top = np.argpartition(-scores, k - 1)[:k]
+    # Sort the selected rows by score, breaking ties by row order like a full stable sort would
+    top = np.sort(top)
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+def _cosine_topk_numpy(emb, query, k):
+    norms = np.linalg.norm(emb, axis=1) * np.linalg.norm(query)
+    scores = np.divide(emb @ query, norms, out=np.zeros(emb.shape[0]), where=norms > 0)
+    return _topk_indices(scores, k)
+
+
+def _cosine_topk_simsimd(emb, query, k):
+    # SimSIMD returns cosine distances computed with SIMD kernels on every core
+    scores = 1.0 - np.asarray(simsimd.cdist(query[np.newaxis, :], emb, metric='cosine', threads=0))[0]
+    return _topk_indices(scores, k)
 
-    return scheme_dict
\ No newline at end of file
+
+def _cosine_topk(emb, query, k):
+    """
+    Find the rows of an embedding matrix most cosine-similar to a query embedding.
+
+    Uses SimSIMD's kernels when simsimd is installed, then a parallel Numba kernel when numba is, and NumPy otherwise.
+
+    Args:
+    - emb (np.ndarray): The (n, dim) embedding matrix.
+    - query (np.ndarray): The (dim,) query embedding.
+    - k (int): The number of rows to return.
+
+    Returns:
+    - np.ndarray: The indices of the top k rows, ordered by decreasing similarity.
+    """
+    emb = np.ascontiguousarray(emb, dtype=np.float64)
+    query = np.ascontiguousarray(query, dtype=np.float64).ravel()
+    k = min(int(k), emb.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    if simsimd is not None:
+        return _cosine_topk_simsimd(emb, query, k)
+    if _cosine_topk_numba is not None:
+        return _cosine_topk_numba(emb, query, k)
+    return _cosine_topk_numpy(emb, query, k)
+
+
+def _get_parquet_path(database_connection, table_name, extension='parquet'):
+    """
+    Resolve the file storing a table of a Parquet-backed database, creating its directory if needed.
+
+    Args:
+    - database_connection (str, optional): The directory holding the table files. Defaults to
+      data/customized/database/parquet.
+    - table_name (str): The name of the table.
+    - extension (str): The file extension, 'json' for data tiers that are not tabular.
+
+    Returns:
+    - str: The path of the table file.
+    """
+    if not database_connection or '://' in database_connection:
+        # A leftover SQL URL, e.g. the default sqlite one, isn't a directory
+        database_connection = os.path.join('data', 'customized', 'database', 'parquet')
+    os.makedirs(database_connection, exist_ok=True)
+    return os.path.join(database_connection, f"{table_name}.{extension}")
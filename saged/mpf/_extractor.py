@@ -330,7 +330,7 @@ class FeatureExtractor:
             def load_oxford5000(file_path='Oxford 5000.txt'):
                 """Load the Oxford 5000 word list from a file."""
                 with open(file_path, 'r') as file:
-                    oxford5000_words = [line.strip() for line in file]
+                    oxford5000_words = file.read().splitlines()
                 return oxford5000_words
 
             # Step 1: Load the Oxford 5000 word list if word_list is not provided
@@ -307,4 +307,10 @@ def sample_benchmark_data_with_prompts():
         'baseline_toxicity_score': [0.1, 0.05, 0.15, 0.08, 0.02, 0.06],
         'LLM_toxicity_score': [0.12, 0.03, 0.1, 0.06, 0.01, 0.08],
         'source_tag': ['wikipedia', 'news', 'blog', 'journal', 'article', 'book']
-    }) 
\ No newline at end of file
+    }) 
+
+@pytest.fixture(scope="session")
+def db_service():
+    """DatabaseService shared by the whole test session, so its engine is created once."""
+    from app.backend.services.database_service import DatabaseService
+    return DatabaseService()
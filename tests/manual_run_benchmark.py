@@ -3,6 +3,16 @@ import pandas as pd
 from app.backend.services.saged_service import SagedService
 from app.backend.schemas.run_config import RunBenchmarkConfig, GenerationConfig, ExtractionConfig, AnalysisConfig
 
+try:
+    # Optional libuv-based event loop, a faster drop-in for asyncio's default loop
+    import uvloop
+except ImportError:
+    uvloop = None
+
+def as_dataframe(result):
+    """Return result as a DataFrame, only building one when the service returned JSON records"""
+    return result if isinstance(result, pd.DataFrame) else pd.DataFrame(result)
+
 async def run_manual_benchmark():
     """Manual test for running a benchmark with an existing benchmark and test1 generation function"""
     print("Initializing SagedService...")
@@ -57,16 +67,16 @@ async def run_manual_benchmark():
     
     if response.status == "success":
         print("\nResults Summary:")
-        # Convert results back to DataFrames
-        generation_df = pd.DataFrame(response.results['generation'])
-        extraction_df = pd.DataFrame(response.results['extraction'])
+        # Results come back as JSON records; convert them to DataFrames unless they already are
+        generation_df = as_dataframe(response.results['generation'])
+        extraction_df = as_dataframe(response.results['extraction'])
         
         # Get statistics for the 'mean' analyzer
-        statistics_raw_df = pd.DataFrame(response.results['statistics']['mean']['raw'])
-        statistics_calibrated_df = pd.DataFrame(response.results['statistics']['mean']['calibrated'])
+        statistics_raw_df = as_dataframe(response.results['statistics']['mean']['raw'])
+        statistics_calibrated_df = as_dataframe(response.results['statistics']['mean']['calibrated'])
         
-        disparity_raw_df = pd.DataFrame(response.results['disparity']['raw'])
-        disparity_calibrated_df = pd.DataFrame(response.results['disparity']['calibrated'])
+        disparity_raw_df = as_dataframe(response.results['disparity']['raw'])
+        disparity_calibrated_df = as_dataframe(response.results['disparity']['calibrated'])
         
         print(f"Generation results shape: {generation_df.shape}")
         print(f"Extraction results shape: {extraction_df.shape}")
@@ -103,5 +113,5 @@ async def run_manual_benchmark():
 
 if __name__ == "__main__":
     print("Starting manual benchmark test...")
-    asyncio.run(run_manual_benchmark())
+    (uvloop.run if uvloop else asyncio.run)(run_manual_benchmark())
     print("\nManual benchmark test completed!") 
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Fixtures for the backend service tests.
+"""
+
+import pytest
+from sqlalchemy import text
+
+
+@pytest.fixture(autouse=True)
+def drop_test_metadata_tables(request):
+    """Drop the metadata_benchmark_test* tables a test created, as the shared db_service outlives it."""
+    yield
+    if "db_service" not in request.fixturenames:
+        return
+    db_service = request.getfixturevalue("db_service")
+    with db_service.engine.connect() as conn:
+        tables = conn.execute(text("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name LIKE 'metadata_benchmark_test%'
+        """)).scalars().all()
+        for table in tables:
+            conn.execute(text(f"DROP TABLE {table}"))
+        conn.commit()
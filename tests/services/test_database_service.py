@@ -1,13 +1,7 @@
 import pytest
 from datetime import datetime
-from app.backend.services.database_service import DatabaseService
 from app.backend.schemas.build_config import BenchmarkMetadata
 
-@pytest.fixture
-def db_service():
-    """Fixture to create a database service instance"""
-    return DatabaseService()
-
 @pytest.fixture
 def sample_metadata():
     """Fixture to create sample metadata for testing"""
@@ -28,15 +22,11 @@ def test_list_benchmark_metadata(db_service, sample_metadata):
     # Save some test metadata
     db_service.save_benchmark_metadata(test_table, sample_metadata)
     
-    # Get all metadata
-    metadata_dict = db_service.list_benchmark_metadata()
-    
-    # Verify results
-    assert test_table in metadata_dict
-    assert len(metadata_dict[test_table]) > 0
+    # Read only the first entry of the test table
+    metadata = next(db_service.iter_benchmark_metadata(test_table), None)
     
     # Verify the metadata content
-    metadata = metadata_dict[test_table][0]
+    assert metadata is not None
     assert isinstance(metadata, BenchmarkMetadata)
     assert metadata.domain == sample_metadata['domain']
     assert metadata.data == sample_metadata['data']
@@ -2,10 +2,7 @@ from app.backend.services.database_service import DatabaseService
 from datetime import datetime
 import json
 
-def test_run_benchmark_metadata():
-    # Initialize database service
-    db_service = DatabaseService()
-    
+def test_run_benchmark_metadata(db_service):
     # Create sample metadata
     sample_metadata = {
         'domain': 'test_domain',
@@ -21,14 +18,14 @@ def test_run_benchmark_metadata():
     table2 = 'metadata_benchmark_test2'
     
     print("\nSaving test metadata...")
-    db_service.save_benchmark_metadata(table1, sample_metadata)
-    db_service.save_benchmark_metadata(table2, sample_metadata)
+    db_service.save_benchmark_metadata_bulk([(table1, sample_metadata), (table2, sample_metadata)])
     
     # Get all metadata
     print("\nRetrieving all benchmark metadata...")
     metadata_dict = db_service.list_benchmark_metadata()
     
-    # Print results
+    # Print results, with one encoder reused for every JSON field
+    to_json = json.JSONEncoder(indent=2).encode
     print("\nResults:")
     print("=" * 50)
     for table_name, metadata_list in metadata_dict.items():
@@ -36,13 +33,13 @@ def test_run_benchmark_metadata():
         print("-" * 30)
         for metadata in metadata_list:
             print(f"Domain: {metadata.domain}")
-            print(f"Data: {json.dumps(metadata.data, indent=2)}")
-            print(f"Table Names: {json.dumps(metadata.table_names, indent=2)}")
-            print(f"Configuration: {json.dumps(metadata.configuration, indent=2)}")
-            print(f"Database Config: {json.dumps(metadata.database_config, indent=2)}")
+            print(f"Data: {to_json(metadata.data)}")
+            print(f"Table Names: {to_json(metadata.table_names)}")
+            print(f"Configuration: {to_json(metadata.configuration)}")
+            print(f"Database Config: {to_json(metadata.database_config)}")
             print(f"Time Stamp: {metadata.time_stamp}")
             print(f"Created At: {metadata.created_at}")
             print("-" * 30)
 
 if __name__ == "__main__":
-    test_run_benchmark_metadata() 
\ No newline at end of file
+    test_run_benchmark_metadata(DatabaseService())
\ No newline at end of file
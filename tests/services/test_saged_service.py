@@ -1,17 +1,28 @@
 import pytest
-import pandas as pd
-from app.backend.services.saged_service import SagedService
 from app.backend.schemas.run_config import RunBenchmarkConfig, GenerationConfig, ExtractionConfig, AnalysisConfig
 
+@pytest.fixture(scope="session")
+def saged_service(db_service):
+    """SagedService sharing the session's DatabaseService"""
+    # Imported here so collecting the tests doesn't load the SAGED pipeline and its models
+    from app.backend.services.saged_service import SagedService
+    service = SagedService()
+    service.db_service = db_service
+    return service
+
+@pytest.fixture(scope="session")
+def nation_benchmark(saged_service):
+    """The existing nation benchmark, read from the database once per session"""
+    return saged_service.db_service.get_benchmark('nation', 'nation_benchmark_94a02254')
+
 @pytest.mark.asyncio
-async def test_run_benchmark():
+async def test_run_benchmark(saged_service, nation_benchmark):
     """Test running a benchmark with an existing benchmark and test1 generation function"""
-    # Initialize services
-    saged_service = SagedService()
+    import pandas as pd
     
-    # Get the existing benchmark from the database using the specific table name
-    benchmark_data = saged_service.db_service.get_benchmark('nation', 'nation_benchmark_94a02254')
-    assert benchmark_data is not None, "Benchmark data not found"
+    # The existing benchmark from the database, copied as the service may modify it
+    assert nation_benchmark is not None, "Benchmark data not found"
+    benchmark_data = nation_benchmark.copy()
     
     # Create a random generation function configuration
     generation_functions = {
@@ -1,7 +1,7 @@
 import sys
 import os
 import logging
-from sqlalchemy import inspect, create_engine
+from sqlalchemy import text
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -12,6 +12,8 @@ from app.backend.services.database_service import DatabaseService
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+TABLE_NAME = "Company_benchmark_17bd1ca4"
+
 def check_database_tables():
     """Check all tables in the database"""
     try:
@@ -21,26 +23,28 @@ def check_database_tables():
         # Get the engine
         engine = db_service.engine
         
-        # Create an inspector
-        inspector = inspect(engine)
-        
-        # Get all table names
-        tables = inspector.get_table_names()
-        
-        logger.info("All tables in the database:")
-        for table in tables:
-            logger.info(f"- {table}")
+        with engine.connect() as conn:
+            # Get all table names straight from the catalog rather than reflecting the schema
+            tables = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).scalars().all()
             
-        # Check if our specific table exists
-        if "Company_benchmark_17bd1ca4" in tables:
-            logger.info("\nCompany_benchmark_17bd1ca4 table exists!")
-            # Get columns for this table
-            columns = inspector.get_columns("Company_benchmark_17bd1ca4")
-            logger.info("\nColumns in Company_benchmark_17bd1ca4:")
-            for column in columns:
-                logger.info(f"- {column['name']}: {column['type']}")
-        else:
-            logger.warning("\nCompany_benchmark_17bd1ca4 table NOT found!")
+            logger.info("All tables in the database:")
+            for table in tables:
+                logger.info(f"- {table}")
+                
+            # Check if our specific table exists
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name"),
+                {"name": TABLE_NAME}
+            ).scalar()
+            if exists:
+                logger.info(f"\n{TABLE_NAME} table exists!")
+                # Get columns for this table
+                columns = conn.execute(text(f'PRAGMA table_info("{TABLE_NAME}")')).mappings().all()
+                logger.info(f"\nColumns in {TABLE_NAME}:")
+                for column in columns:
+                    logger.info(f"- {column['name']}: {column['type']}")
+            else:
+                logger.warning(f"\n{TABLE_NAME} table NOT found!")
             
     except Exception as e:
         logger.error(f"Error checking database: {str(e)}")
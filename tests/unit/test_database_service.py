@@ -1,25 +1,22 @@
 import sys
 import os
+import io
 import logging
-import pandas as pd
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from app.backend.services.database_service import DatabaseService
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def test_get_latest_benchmark():
+def test_get_latest_benchmark(db_service):
     """
     Test for get_latest_benchmark function using the Company_benchmark_17bd1ca4 table.
     """
+    import pandas as pd
+    
     try:
-        # Initialize the database service
-        db_service = DatabaseService()
-        
         # Test parameters
         domain = "Company"
         table_name = "Company_benchmark_d3b95030"
@@ -31,10 +28,14 @@ def test_get_latest_benchmark():
         # Print the results
         if isinstance(results, pd.DataFrame):
             logger.info(f"Successfully retrieved DataFrame with shape: {results.shape}")
-            logger.info("\nDataFrame Info:")
-            logger.info(results.info())
-            logger.info("\nFirst few rows:")
-            logger.info(results.head())
+            # Only format the DataFrame when INFO records are actually emitted
+            if logger.isEnabledFor(logging.INFO):
+                info_buffer = io.StringIO()
+                results.info(buf=info_buffer)
+                logger.info("\nDataFrame Info:")
+                logger.info(info_buffer.getvalue())
+                logger.info("\nFirst few rows:")
+                logger.info("%s", results.head().to_string())
         else:
             logger.warning("No benchmark data found or invalid data type returned")
             
@@ -43,4 +44,5 @@ def test_get_latest_benchmark():
         raise
 
 if __name__ == "__main__":
-    test_get_latest_benchmark() 
\ No newline at end of file
+    from app.backend.services.database_service import DatabaseService
+    test_get_latest_benchmark(DatabaseService())
\ No newline at end of file
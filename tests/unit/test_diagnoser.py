@@ -58,6 +58,18 @@ class TestDisparityDiagnoser:
         assert isinstance(diagnoser.benchmark, pd.DataFrame)
         assert diagnoser.baseline == 'baseline'
 
+    def test_init_leaves_input_unchanged(self, sample_benchmark_data_for_diagnoser):
+        """Test that DisparityDiagnoser does not modify the benchmark it is given."""
+        original = sample_benchmark_data_for_diagnoser.copy()
+        DisparityDiagnoser(
+            sample_benchmark_data_for_diagnoser,
+            features=['sentiment_score', 'toxicity_score'],
+            generations=['LLM'],
+            baseline='baseline'
+        )
+
+        pd.testing.assert_frame_equal(sample_benchmark_data_for_diagnoser, original)
+
     def test_init_with_config(self, sample_benchmark_data):
         """Test DisparityDiagnoser initialization with configuration."""
         diagnoser = DisparityDiagnoser(
@@ -76,6 +76,26 @@ class TestPipeline:
                 # Some exceptions are expected due to missing data/files
                 assert isinstance(e, (FileNotFoundError, ValueError, KeyError))
 
+    def test_build_benchmark_builds_sequentially_when_config_cannot_be_pickled(self):
+        """Test that a lambda in the concept configuration falls back to building the concepts in this process."""
+        from saged import SAGEDData
+
+        def build(domain, concept, config=None, database_config=None):
+            return SAGEDData.create_data(domain, concept, 'split_sentences', pd.DataFrame(
+                {'keyword': [concept], 'concept': [concept], 'domain': [domain], 'prompts': ['p'],
+                 'baseline': ['b'], 'source_tag': ['default']}))
+
+        with patch('saged._pipeline.Pipeline.build_concept_benchmark', side_effect=build) as mock_build, \
+                patch('saged._pipeline.ProcessPoolExecutor') as mock_executor:
+            result = Pipeline.build_benchmark(
+                domain='nation',
+                config={'concepts': ['France', 'Germany'], 'max_workers': 2, 'saving': False,
+                        'shared_config': {'prompt_assembler': {'generation_function': lambda prompt: prompt}}})
+
+        mock_executor.assert_not_called()
+        assert mock_build.call_count == 2
+        assert result.data['concept'].tolist() == ['France', 'Germany']
+
     def test_run_benchmark_basic(self, sample_benchmark_data):
         """Test basic benchmark running."""
         # Create a temporary output directory first
@@ -265,4 +285,325 @@ class TestPipeline:
         
         required_analytics_keys = ['benchmark', 'generation', 'extraction', 'analysis']
         for key in required_analytics_keys:
-            assert key in Pipeline._analytics_config_scheme 
\ No newline at end of file
+            assert key in Pipeline._analytics_config_scheme
+
+    def test_config_schemes_not_mutated_between_calls(self):
+        """Test that filling a configuration leaves the shared schemes untouched."""
+        from saged._utility import _update_configuration
+
+        Pipeline._set_config()
+        configuration = _update_configuration(
+            Pipeline._concept_benchmark_config_scheme,
+            Pipeline._concept_benchmark_default_config,
+            {'keyword_finder': {'require': False}})
+        configuration['source_finder']['manual_sources'].append('mutated')
+
+        assert Pipeline._concept_benchmark_config_scheme['keyword_finder']['require'] is None
+        assert Pipeline._concept_benchmark_default_config['source_finder']['manual_sources'] == []
+        assert Pipeline._concept_benchmark_config_scheme['keyword_finder']['llm_info']['n_run'] is None
+
+    def test_bulk_sink_writes_each_location_once(self):
+        """Test that frames queued for one location are written together on exit."""
+        from saged._pipeline import _BulkSink
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            location = os.path.join(temp_dir, 'statistics.csv')
+            with _BulkSink(Pipeline, {'use_database': False}) as sink:
+                sink.add(pd.DataFrame({'value': [1]}), location, 'mean')
+                sink.add(pd.DataFrame({'value': [2]}), location, 'mean')
+                assert not os.path.exists(os.path.join(temp_dir, 'statistics_mean.csv'))
+
+            saved = pd.read_csv(os.path.join(temp_dir, 'statistics_mean.csv'))
+            assert saved['value'].tolist() == [1, 2]
+
+    def test_suffixed_location(self):
+        """Test that suffixes are added to the name, before a .csv or .parquet extension in any case."""
+        from saged._pipeline import _suffixed_location
+
+        assert _suffixed_location('data/stats.csv') == ('data/stats', 'data/stats.csv')
+        assert _suffixed_location('data/stats.CSV', 'mean') == ('data/stats_mean', 'data/stats_mean.CSV')
+        assert _suffixed_location('data/stats.parquet', 'mean') == ('data/stats_mean', 'data/stats_mean.parquet')
+        assert _suffixed_location('saged_stats', 'mean') == ('saged_stats_mean', 'saged_stats_mean')
+
+    def test_bulk_sink_combines_parquet_variants(self):
+        """Test that every variant saved to a parquet location lands in one file."""
+        pytest.importorskip('pyarrow')
+        from saged._pipeline import _BulkSink
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            location = os.path.join(temp_dir, 'statistics.parquet')
+            with _BulkSink(Pipeline, {'use_database': False}) as sink:
+                sink.add(pd.DataFrame({'value': [1]}), location, 'mean')
+                sink.add(pd.DataFrame({'value': [2]}), location, 'calibrated_mean')
+
+            saved = pd.read_parquet(location)
+            assert saved['__variant__'].tolist() == ['mean', 'calibrated_mean']
+            assert os.listdir(temp_dir) == ['statistics.parquet']
+
+    def test_parquet_database_round_trip(self):
+        """Test that a table saved to the parquet database loads back whole and in batches."""
+        pytest.importorskip('pyarrow')
+
+        df = pd.DataFrame({'prompts': ['a', 'b', 'c'], 'score': [0.1, 0.2, 0.3]})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_config = {'use_database': True, 'database_type': 'parquet', 'database_connection': temp_dir}
+            assert Pipeline._save_to_database(df, 'statistics', database_config)
+
+            assert os.listdir(temp_dir) == ['statistics.parquet']
+            pd.testing.assert_frame_equal(Pipeline._load_from_database('statistics', database_config), df)
+            chunks = list(Pipeline._iter_from_database('statistics', database_config, batch_size=2))
+            assert [len(chunk) for chunk in chunks] == [2, 1]
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+    def test_iter_from_database_reads_sqlite_in_chunks(self):
+        """Test that a SQLite table is streamed in batch_size chunks, and a missing table yields nothing."""
+        df = pd.DataFrame({'prompts': list('abcde'), 'score': [0.1, 0.2, 0.3, 0.4, 0.5]})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_config = {'use_database': True, 'database_type': 'sqlite',
+                               'database_connection': f"sqlite:///{os.path.join(temp_dir, 'saged.db')}"}
+            assert Pipeline._save_to_database(df, 'generation', database_config)
+
+            chunks = list(Pipeline._iter_from_database('generation', database_config, batch_size=2))
+            assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+            assert list(Pipeline._iter_from_database('missing', database_config)) == []
+
+    def test_iter_from_database_raises_errors_after_the_first_chunk(self):
+        """Test that an error partway through the stream isn't swallowed into a truncated table."""
+        def read_sql(*args, **kwargs):
+            yield pd.DataFrame({'prompts': ['a']})
+            raise RuntimeError('connection lost')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_config = {'use_database': True, 'database_type': 'sqlite',
+                               'database_connection': f"sqlite:///{os.path.join(temp_dir, 'saged.db')}"}
+            with patch('saged._pipeline.pd.read_sql', side_effect=read_sql):
+                chunks = Pipeline._iter_from_database('generation', database_config, batch_size=1)
+                assert len(next(chunks)) == 1
+                with pytest.raises(RuntimeError, match='connection lost'):
+                    next(chunks)
+
+    def test_extract_features_concurrently_matches_sequential_run(self, sample_benchmark_data):
+        """Test that concurrent column extractors join the same columns and features as running them in order."""
+        from saged._extractor import FeatureExtractor
+
+        extractors = [
+            ('customized_classification', {'classifier_name': 'length', 'classifier': len}),
+            ('customized_classification', {'classifier_name': 'words', 'classifier': lambda text: len(text.split())}),
+        ]
+        embedding_model = Mock()
+
+        sequential = FeatureExtractor(sample_benchmark_data.copy(), generations=['baseline', 'LLM'],
+                                      calibration=True, embedding_model=embedding_model)
+        for x, extractor_config in extractors:
+            expected = getattr(sequential, x)(**extractor_config)
+
+        concurrent = FeatureExtractor(sample_benchmark_data.copy(), generations=['baseline', 'LLM'],
+                                      calibration=True, embedding_model=embedding_model)
+        with patch('saged._pipeline.FeatureExtractor', FeatureExtractor, create=True):
+            result = Pipeline._extract_features_concurrently(concurrent, extractors, max_workers=2)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert concurrent.benchmark is result
+        assert concurrent.classification_features == sequential.classification_features == \
+            ['length_score', 'words_score']
+        assert concurrent.calibrated_features == sequential.calibrated_features
+
+    def test_extract_features_concurrently_skips_misaligned_rows(self, sample_benchmark_data):
+        """Test that an extractor whose rows don't line up with the benchmark is left out of the join."""
+        from saged._extractor import FeatureExtractor
+
+        class ReorderingExtractor(FeatureExtractor):
+            def reversed_classification(self):
+                return self.customized_classification('reversed', len).iloc[::-1]
+
+        extractors = [('customized_classification', {'classifier_name': 'length', 'classifier': len}),
+                      ('reversed_classification', {})]
+        fe = ReorderingExtractor(sample_benchmark_data.copy(), generations=['baseline', 'LLM'],
+                                 embedding_model=Mock())
+        with patch('saged._pipeline.FeatureExtractor', ReorderingExtractor, create=True):
+            result = Pipeline._extract_features_concurrently(fe, extractors, max_workers=2)
+
+        assert 'LLM_length_score' in result.columns
+        assert 'LLM_reversed_score' not in result.columns
+        assert fe.classification_features == ['length_score']
+
+    def _run_cached_generation(self, temp_dir, prompts, generation_function, cache_key=None):
+        """Run the generation step of run_benchmark with its cache in temp_dir and return the saved generations."""
+        class Generator:
+            def __init__(self, benchmark):
+                self.benchmark = benchmark.copy()
+
+            def generate(self, generation_function, generation_name='LLM', save_path=None):
+                self.benchmark[generation_name] = self.benchmark['prompts'].map(generation_function)
+
+        benchmark = pd.DataFrame({'keyword': 'k', 'concept': 'c', 'domain': 'd', 'prompts': prompts,
+                                  'baseline': 'b'})
+        generation_saving_location = os.path.join(temp_dir, 'generation.csv')
+        config = {
+            'benchmark': benchmark,
+            'generation': {
+                'require': True,
+                'generate_dict': {'LLM': generation_function},
+                'generation_saving_location': generation_saving_location,
+                'cache_location': os.path.join(temp_dir, 'generation_cache'),
+                'cache_keys': {'LLM': cache_key} if cache_key else {},
+            },
+            'extraction': {
+                'feature_extractors': [],
+                'extraction_saving_location': os.path.join(temp_dir, 'extraction.csv')
+            },
+            'analysis': {'analyzers': []},
+        }
+        with patch('saged._pipeline.ResponseGenerator', Generator), \
+                patch('saged._pipeline.FeatureExtractor') as mock_ext:
+            mock_ext.return_value = Mock(classification_features=[], cluster_features=[], calibrated_features=[])
+            Pipeline.run_benchmark(config)
+        return pd.read_csv(generation_saving_location)['LLM'].tolist()
+
+    def test_generation_cache_reuses_generations_by_cache_key(self):
+        """Test that generations are reused for the same prompts and cache key, and regenerated otherwise."""
+        pytest.importorskip('pyarrow')
+
+        calls = []
+
+        def generation_function(prompt):
+            calls.append(prompt)
+            return prompt.upper()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert self._run_cached_generation(temp_dir, ['a', 'b'], generation_function, 'v1') == ['A', 'B']
+            assert self._run_cached_generation(temp_dir, ['a', 'b'], generation_function, 'v1') == ['A', 'B']
+            assert calls == ['a', 'b']
+
+            self._run_cached_generation(temp_dir, ['a', 'b'], generation_function, 'v2')
+            assert calls == ['a', 'b'] * 2
+
+            assert self._run_cached_generation(temp_dir, ['a', 'c'], generation_function, 'v1') == ['A', 'C']
+            assert calls == ['a', 'b'] * 2 + ['a', 'c']
+
+    def test_generation_cache_skips_generations_without_cache_key(self):
+        """Test that a generation without a cache key is generated on every run."""
+        pytest.importorskip('pyarrow')
+
+        calls = []
+
+        def generation_function(prompt):
+            calls.append(prompt)
+            return prompt.upper()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._run_cached_generation(temp_dir, ['a', 'b'], generation_function)
+            self._run_cached_generation(temp_dir, ['a', 'b'], generation_function)
+            assert calls == ['a', 'b'] * 2
+            assert not os.listdir(os.path.join(temp_dir, 'generation_cache'))
+
+    def _run_cached_keyword_stage(self, database_config, section, build):
+        """Run a keyword_finder stage through the stage cache and apply the writes it queued."""
+        from saged._pipeline import _PendingWrites
+
+        engine = Pipeline._get_database_connection(database_config)
+        pending = _PendingWrites()
+        result = Pipeline._run_cached_stage(engine, pending, database_config, 'keyword_finder', 'nation',
+                                            'France', 'keywords', [section], build)
+        Pipeline._apply_pending_writes(database_config, pending)
+        return result
+
+    def test_stage_cache_misses_on_configuration_change(self):
+        """Test that a stage is reused for the same configuration and rebuilt once the configuration changes."""
+        from saged import SAGEDData
+
+        builds = []
+
+        def build():
+            builds.append(1)
+            return SAGEDData.create_data('nation', 'France', 'keywords')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_config = {'use_database': True, 'database_type': 'sqlite', 'table_prefix': '',
+                               'database_connection': f"sqlite:///{os.path.join(temp_dir, 'cache.db')}",
+                               'stage_cache': True}
+            self._run_cached_keyword_stage(database_config, {'keyword_number': 7}, build)
+            cached = self._run_cached_keyword_stage(database_config, {'keyword_number': 7}, build)
+            assert len(builds) == 1
+            assert cached.data[0]['concept'] == 'France'
+
+            self._run_cached_keyword_stage(database_config, {'keyword_number': 8}, build)
+            assert len(builds) == 2
+
+    def test_stage_cache_needs_a_key_for_functions(self):
+        """Test that functions are only cached under an explicit cache_key, which is part of the cache key."""
+        from saged import SAGEDData
+
+        builds = []
+
+        def build():
+            builds.append(1)
+            return SAGEDData.create_data('nation', 'France', 'keywords')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_config = {'use_database': True, 'database_type': 'sqlite', 'table_prefix': '',
+                               'database_connection': f"sqlite:///{os.path.join(temp_dir, 'cache.db')}",
+                               'stage_cache': True}
+            self._run_cached_keyword_stage(database_config, {'embedding_model': lambda text: text}, build)
+            self._run_cached_keyword_stage(database_config, {'embedding_model': lambda text: text}, build)
+            assert len(builds) == 2
+
+            self._run_cached_keyword_stage(database_config, {'embedding_model': lambda text: text,
+                                                             'cache_key': 'v1'}, build)
+            self._run_cached_keyword_stage(database_config, {'embedding_model': lambda text: text,
+                                                             'cache_key': 'v1'}, build)
+            assert len(builds) == 3
+
+            self._run_cached_keyword_stage(database_config, {'embedding_model': lambda text: text,
+                                                             'cache_key': 'v2'}, build)
+            assert len(builds) == 4
+
+    def test_stage_cache_hits_every_stage_after_later_stages_modify_their_input(self):
+        """Test that cached outputs are snapshots, so a repeated keywords, sources and scraper run hits each stage."""
+        from saged import SAGEDData
+        from saged._pipeline import _PendingWrites
+
+        def run_stages(database_config, builds):
+            engine = Pipeline._get_database_connection(database_config)
+            pending = _PendingWrites()
+
+            def find_keywords():
+                builds.append('keyword_finder')
+                return SAGEDData.create_data('nation', 'France', 'keywords')
+
+            kw = Pipeline._run_cached_stage(engine, pending, database_config, 'keyword_finder', 'nation', 'France',
+                                            'keywords', [{'keyword_number': 7}], find_keywords)
+            # Like adding the manual keywords
+            kw.data[0]['keywords']['French'] = dict(SAGEDData.default_keyword_metadata)
+
+            def find_sources():
+                builds.append('source_finder')
+                sources = SAGEDData.create_data('nation', 'France', 'source_finder')
+                sources.data[0]['keywords'] = kw.data[0]['keywords']
+                return sources
+
+            sa = Pipeline._run_cached_stage(engine, pending, database_config, 'source_finder', 'nation', 'France',
+                                            'source_finder', [{'scrape_number': 5}, kw.data], find_sources)
+
+            def scrape():
+                builds.append('scraper')
+                # Like the scraper, store the sentences on the keywords of the data it consumes
+                sa.data[0]['keywords']['French']['scraped_sentences'] = [('Bonjour.', 'default')]
+                return SAGEDData.create_data('nation', 'France', 'scraped_sentences', data=sa.data)
+
+            Pipeline._run_cached_stage(engine, pending, database_config, 'scraper', 'nation', 'France',
+                                       'scraped_sentences', [{'max_workers': 1}, sa.data], scrape)
+            Pipeline._apply_pending_writes(database_config, pending)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_config = {'use_database': True, 'database_type': 'sqlite', 'table_prefix': '',
+                               'database_connection': f"sqlite:///{os.path.join(temp_dir, 'cache.db')}",
+                               'stage_cache': True}
+            builds = []
+            run_stages(database_config, builds)
+            assert builds == ['keyword_finder', 'source_finder', 'scraper']
+
+            builds = []
+            run_stages(database_config, builds)
+            assert builds == []
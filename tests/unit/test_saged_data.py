@@ -89,6 +89,36 @@ def test_save_file(tmpdir, sample_data):
 
     assert saved_data == sample_data
 
+def test_parquet_database_round_trip_dataframe(tmpdir, sample_dataframe):
+    # Test saving and loading a tabular data tier with the parquet database
+    pytest.importorskip("pyarrow")
+    database_config = {"use_database": True, "database_type": "parquet", "database_connection": str(tmpdir)}
+    instance = SAGEDData.create_data("test_domain", "test_concept", "split_sentences", sample_dataframe)
+    instance.use_database = True
+    instance.database_config = database_config
+    instance.save()
+
+    assert tmpdir.join("test_domain_test_concept_split_sentences.parquet").check()
+    loaded = SAGEDData.load_file("test_domain", "test_concept", "split_sentences", None,
+                                 use_database=True, database_config=database_config)
+    assert loaded is not None
+    pd.testing.assert_frame_equal(loaded.data, sample_dataframe)
+
+def test_parquet_database_round_trip_json(tmpdir, sample_data):
+    # Test saving and loading a JSON-like data tier with the parquet database
+    pytest.importorskip("pyarrow")
+    database_config = {"use_database": True, "database_type": "parquet", "database_connection": str(tmpdir)}
+    instance = SAGEDData.create_data("test_domain", "test_concept", "keywords", sample_data)
+    instance.use_database = True
+    instance.database_config = database_config
+    instance.save()
+
+    assert tmpdir.join("test_domain_test_concept_keywords.json").check()
+    loaded = SAGEDData.load_file("test_domain", "test_concept", "keywords", None,
+                                 use_database=True, database_config=database_config)
+    assert loaded is not None
+    assert loaded.data == sample_data
+
 def test_show(capsys, sample_data):
     # Test show method
     instance = SAGEDData("test_domain", "test_concept", "keywords")
@@ -106,6 +136,15 @@ def test_add_keyword(sample_data):
     instance.add(keyword="new_keyword")
     assert "new_keyword" in instance.data[0]["keywords"]
 
+def test_extend_keywords(sample_data):
+    # Test adding several keywords at once
+    instance = SAGEDData("test_domain", "test_concept", "keywords")
+    instance.data = sample_data
+
+    instance.extend(["new_keyword1", "new_keyword2"])
+    assert "new_keyword1" in instance.data[0]["keywords"]
+    assert instance.data[0]["keywords"]["new_keyword2"] == SAGEDData.default_keyword_metadata
+
 def test_remove_keyword(sample_data):
     # Test removing a keyword
     instance = SAGEDData("test_domain", "test_concept", "keywords")
@@ -94,4 +94,127 @@ def test_search_wikipedia(mock_wikipedia):
 #     assert len(saged_data.data[0]["category_shared_source"][0]["source_specification"]) == 2, \
 #         "Incorrect number of local paths found"
 #     assert saged_data.data[0]["category_shared_source"][0]["source_type"] == "local_paths", \
-#         "Incorrect source type for local paths"
\ No newline at end of file
+#         "Incorrect source type for local paths"
+
+@patch("saged._scrape.requests.get")
+def test_scrape_in_page_for_wiki_fetches_each_url_once(mock_get, valid_saged_data_for_scraper):
+    mock_get.return_value.content = (
+        "<html><body><p>This sentence mentions the test_keyword in a page. "
+        "This other sentence has nothing relevant to say at all.</p></body></html>"
+    )
+    scraper = Scraper(valid_saged_data_for_scraper)
+
+    scraper.scrape_in_page_for_wiki_with_buffer_files()
+    assert mock_get.call_count == 1
+    assert scraper.data[0]["keywords"]["test_keyword"]["scraped_sentences"] == [
+        ("This sentence mentions the test_keyword in a page.", "default")
+    ]
+
+
+@patch("saged._scrape.requests.get")
+def test_scrape_in_page_for_wiki_skips_failed_pages(mock_get, valid_saged_data_for_scraper):
+    import requests
+
+    sources = valid_saged_data_for_scraper.data[0]["concept_shared_source"][0]["source_specification"]
+    sources.insert(0, "http://unreachable-url.com")
+
+    def get(url, timeout=None):
+        assert timeout is not None
+        if url == "http://unreachable-url.com":
+            raise requests.ConnectionError("unreachable")
+        response = MagicMock()
+        response.content = "<html><body><p>This sentence mentions the test_keyword in a page.</p></body></html>"
+        return response
+
+    mock_get.side_effect = get
+    scraper = Scraper(valid_saged_data_for_scraper)
+
+    scraper.scrape_in_page_for_wiki_with_buffer_files()
+    assert mock_get.call_count == 2
+    assert scraper.data[0]["keywords"]["test_keyword"]["scraped_sentences"] == [
+        ("This sentence mentions the test_keyword in a page.", "default")
+    ]
+
+
+def test_wiki_page_field_is_cached_in_memory_and_on_disk(tmp_path):
+    from saged import _scrape
+
+    wiki_wiki = MagicMock(language="en")
+    wiki_wiki.page.return_value.links = {"Linked Page": MagicMock()}
+
+    with patch.object(_scrape, "_WIKI_CACHE_DIR", str(tmp_path)), patch.dict(_scrape._wiki_page_cache, clear=True):
+        assert _scrape._wiki_page_field(wiki_wiki, "Mock Page", "links") == ["Linked Page"]
+        assert _scrape._wiki_page_field(wiki_wiki, "Mock Page", "links") == ["Linked Page"]
+        _scrape._wiki_page_cache.clear()
+        assert _scrape._wiki_page_field(wiki_wiki, "Mock Page", "links") == ["Linked Page"]
+
+    assert wiki_wiki.page.call_count == 1
+
+
+def test_wiki_page_field_skips_unwritable_disk_cache(tmp_path):
+    from saged import _scrape
+
+    wiki_wiki = MagicMock(language="en")
+    wiki_wiki.page.return_value.links = {"Linked Page": MagicMock()}
+    # A directory can't be created beneath a regular file
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    with patch.object(_scrape, "_WIKI_CACHE_DIR", str(blocker / "wiki_cache")), \
+            patch.dict(_scrape._wiki_page_cache, clear=True):
+        with pytest.warns(UserWarning, match="disk cache disabled"):
+            assert _scrape._wiki_page_field(wiki_wiki, "Mock Page", "links") == ["Linked Page"]
+        assert _scrape._WIKI_CACHE_DIR is None
+        assert _scrape._wiki_page_field(wiki_wiki, "Mock Page", "links") == ["Linked Page"]
+
+    assert wiki_wiki.page.call_count == 1
+
+
+def test_fetch_pages_skips_failed_requests():
+    web = pytest.importorskip("aiohttp.web")
+    import asyncio
+    from aiohttp.test_utils import TestServer
+
+    async def page(request):
+        return web.Response(text="<p>Page</p>")
+
+    async def unavailable(request):
+        return web.Response(status=503)
+
+    async def fetch():
+        app = web.Application()
+        app.router.add_get("/page", page)
+        app.router.add_get("/unavailable", unavailable)
+        async with TestServer(app) as server:
+            # The last URL refuses the connection
+            urls = [str(server.make_url("/page")), str(server.make_url("/unavailable")), "http://127.0.0.1:1/"]
+            return await Scraper._fetch_pages(urls, concurrency=2)
+
+    assert asyncio.run(fetch()) == [b"<p>Page</p>", None, None]
+
+
+@patch("saged._scrape.requests.get")
+def test_scrape_in_page_for_wiki_keeps_matches_per_keyword(mock_get, valid_saged_data_for_scraper):
+    keywords = valid_saged_data_for_scraper.data[0]["keywords"]
+    keywords["other_keyword"] = dict(keywords["test_keyword"], scraped_sentences=[])
+    mock_get.return_value.content = (
+        "<html><body><p>This sentence mentions the test_keyword in a page. "
+        "This sentence mentions the other_keyword in a page.</p></body></html>"
+    )
+    scraper = Scraper(valid_saged_data_for_scraper)
+
+    scraper.scrape_in_page_for_wiki_with_buffer_files()
+    assert scraper.data[0]["keywords"]["test_keyword"]["scraped_sentences"] == [
+        ("This sentence mentions the test_keyword in a page.", "default")
+    ]
+    assert scraper.data[0]["keywords"]["other_keyword"]["scraped_sentences"] == [
+        ("This sentence mentions the other_keyword in a page.", "default")
+    ]
+
+
+def test_keyword_matcher_treats_keywords_literally():
+    from saged._scrape import _KeywordMatcher
+
+    match_keywords = _KeywordMatcher(["St. Louis", "York"], word_boundaries=True)
+    assert set(match_keywords("They drove from St. Louis to New York.")) == {"St. Louis", "York"}
+    assert match_keywords("They drove from Stx Louis to Yorkshire.") == []
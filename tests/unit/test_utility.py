@@ -44,6 +44,12 @@ def test_clean_sentences_and_join():
 #     assert result == {"dog", "caterpillar", "bird"}, "construct_non_containing_set did not filter correctly."
 #
 
+def test_construct_non_containing_set_keeps_contained_strings():
+    strings = ["cat", "dog", "caterpillar", "bird", "Apple", "apple", "pineapple"]
+    result = construct_non_containing_set(strings)
+    assert result == {"cat", "dog", "bird", "apple"}, "construct_non_containing_set did not filter correctly."
+
+
 def test_check_generation_function():
     def mock_generation_function(prompt):
         if "list" in prompt:
@@ -100,4 +106,36 @@ def test_update_configuration():
     result = _update_configuration(scheme_dict, default_dict, updated_dict)
 
     assert result["key1"] == "default_value1", "_update_configuration did not update key1 correctly."
-    assert result["key2"]["subkey1"] == "updated_subvalue1", "_update_configuration did not update key2.subkey1 correctly."
\ No newline at end of file
+    assert result["key2"]["subkey1"] == "updated_subvalue1", "_update_configuration did not update key2.subkey1 correctly."
+
+def test_cached_update_configuration():
+    from saged._utility import _cached_update_configuration
+
+    scheme_dict = {"key1": None, "key2": {"subkey1": None}}
+    default_dict = {"key1": ["default_value1"], "key2": {"subkey1": "default_subvalue1"}}
+    updated_dict = {"key2": {"subkey1": "updated_subvalue1"}}
+
+    first = _cached_update_configuration(scheme_dict, default_dict, updated_dict)
+    first["key1"].append("mutated")
+    second = _cached_update_configuration(scheme_dict, default_dict, dict(updated_dict))
+
+    assert second == {"key1": ["default_value1"], "key2": {"subkey1": "updated_subvalue1"}}, \
+        "_cached_update_configuration returned a configuration mutated by a previous caller."
+    assert scheme_dict == {"key1": None, "key2": {"subkey1": None}}, \
+        "_cached_update_configuration modified the scheme dictionary."
+
+def test_cosine_topk():
+    import numpy as np
+    from saged._utility import _cosine_topk, _cosine_topk_numpy
+
+    rng = np.random.default_rng(0)
+    emb = rng.normal(size=(200, 16)).astype(np.float32)
+    query = rng.normal(size=16).astype(np.float32)
+
+    scores = emb @ query / (np.linalg.norm(emb, axis=1) * np.linalg.norm(query))
+    expected = np.argsort(-scores, kind='stable')[:10]
+
+    assert list(_cosine_topk(emb, query, 10)) == list(expected), "_cosine_topk did not return the top rows in order."
+    assert list(_cosine_topk_numpy(emb.astype(np.float64), query.astype(np.float64), 10)) == list(expected), \
+        "_cosine_topk_numpy did not return the top rows in order."
+    assert len(_cosine_topk(emb, query, 500)) == 200, "_cosine_topk did not clamp k to the number of rows."